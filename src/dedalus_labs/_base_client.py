@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+import gzip
 import json
 import time
 import uuid
@@ -55,6 +56,7 @@ from ._types import (
     HttpxSendArgs,
     RequestOptions,
     HttpxRequestFiles,
+    RequestCompression,
     ModelBuilderProtocol,
     not_given,
 )
@@ -67,6 +69,7 @@ from ._response import (
     AsyncAPIResponse,
     extract_response_type,
 )
+from ._transfer import ACCEPT_ENCODING
 from ._constants import (
     DEFAULT_TIMEOUT,
     MAX_RETRY_DELAY,
@@ -75,6 +78,8 @@ from ._constants import (
     RAW_RESPONSE_HEADER,
     OVERRIDE_CAST_TO_HEADER,
     DEFAULT_CONNECTION_LIMITS,
+    DEFAULT_STREAM_RECONNECTS,
+    REQUEST_COMPRESSION_MIN_BYTES,
 )
 from ._streaming import Stream, SSEDecoder, AsyncStream, SSEBytesDecoder
 from ._exceptions import (
@@ -365,6 +370,9 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
     _strict_response_validation: bool
     _idempotency_header: str | None
     _default_stream_cls: type[_DefaultStreamT] | None = None
+    request_compression: RequestCompression | None = None
+    stream_reconnects: int = DEFAULT_STREAM_RECONNECTS
+    _accepted_encodings: frozenset[str] = frozenset()
 
     def __init__(
         self,
@@ -555,6 +563,51 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
             **kwargs,
         )
 
+    def _freeze_json_body(self, input_options: FinalRequestOptions, options: FinalRequestOptions) -> None:
+        """Encode (and maybe compress) the prepared JSON body of `options` in place.
+
+        The bytes are also stored on `input_options`, so retries send them as-is
+        instead of rebuilding and re-encoding the body on every attempt.
+        """
+        json_data = options.json_data
+        if options.method.lower() == "get" or options.files is not None or not is_mapping(json_data):
+            return
+
+        headers = {**self.default_headers, **(options.headers or {})}
+        if headers.get("Content-Type") != "application/json":
+            return
+
+        if options.extra_json is not None:
+            json_data = _merge_mappings(json_data, options.extra_json)
+        body = _encode_json(json_data)
+
+        encoding = self._request_encoding(len(body))
+        if encoding is not None:
+            body = _compress(body, encoding)
+            options.headers = {**(options.headers or {}), "Content-Encoding": encoding}
+            input_options.headers = {**(input_options.headers or {}), "Content-Encoding": encoding}
+
+        options.json_data = input_options.json_data = body
+        options.extra_json = input_options.extra_json = None
+
+    def _request_encoding(self, size: int) -> str | None:
+        if self.request_compression is None or size < REQUEST_COMPRESSION_MIN_BYTES:
+            return None
+        if self.request_compression != "auto":
+            return self.request_compression
+        if "zstd" in self._accepted_encodings and _has_zstd():
+            return "zstd"
+        if "gzip" in self._accepted_encodings:
+            return "gzip"
+        return None
+
+    def _record_accepted_encodings(self, response: httpx.Response) -> None:
+        accept_encoding = response.headers.get("Accept-Encoding")
+        if accept_encoding is not None and self.request_compression == "auto":
+            self._accepted_encodings = frozenset(
+                token.split(";")[0].strip().lower() for token in accept_encoding.split(",") if token.strip()
+            )
+
     def _serialize_multipartform(self, data: Mapping[object, object]) -> dict[str, object]:
         items = self.qs.stringify_items(
             # TODO: type ignore is required as stringify_items is well typed but we can't be
@@ -645,6 +698,7 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
     def default_headers(self) -> dict[str, str | Omit]:
         return {
             "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Content-Type": "application/json",
             "User-Agent": self.user_agent,
             **self.platform_headers(),
@@ -961,6 +1015,8 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         for retries_taken in range(max_retries + 1):
             options = model_copy(input_options)
             options = self._prepare_options(options)
+            if retries_taken == 0:
+                self._freeze_json_body(input_options, options)
 
             remaining_retries = max_retries - retries_taken
             request = self._build_request(options, retries_taken=retries_taken)
@@ -1043,6 +1099,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                 log.debug("Re-raising status error")
                 raise self._make_status_error_from_response(err.response) from None
 
+            self._record_accepted_encodings(response)
             break
 
         assert response is not None, "could not resolve response (should never happen)"
@@ -1496,6 +1553,8 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         for retries_taken in range(max_retries + 1):
             options = model_copy(input_options)
             options = await self._prepare_options(options)
+            if retries_taken == 0:
+                self._freeze_json_body(input_options, options)
 
             remaining_retries = max_retries - retries_taken
             request = self._build_request(options, retries_taken=retries_taken)
@@ -1578,6 +1637,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                 log.debug("Re-raising status error")
                 raise self._make_status_error_from_response(err.response) from None
 
+            self._record_accepted_encodings(response)
             break
 
         assert response is not None, "could not resolve response (should never happen)"
@@ -1989,6 +2049,31 @@ def get_architecture() -> Arch:
     return "unknown"
 
 
+def _encode_json(data: object) -> bytes:
+    # the same compact encoding httpx uses for `json=`
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def _has_zstd() -> bool:
+    try:
+        import zstandard  # noqa: F401  # pyright: ignore[reportUnusedImport, reportMissingImports]
+    except ImportError:
+        return False
+    return True
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "zstd":
+        if not _has_zstd():
+            raise RuntimeError("To use zstd request compression you must have installed the `zstandard` package")
+        import zstandard  # pyright: ignore[reportMissingImports]
+
+        return cast(bytes, zstandard.ZstdCompressor().compress(body))
+    raise ValueError(f"Unsupported request compression: {encoding!r}")
+
+
 def _merge_mappings(
     obj1: Mapping[_T_co, Union[_T, Omit]],
     obj2: Mapping[_T_co, Union[_T, Omit]],
@@ -18,6 +18,7 @@ from ._types import (
     Transport,
     ProxiesTypes,
     RequestOptions,
+    RequestCompression,
     not_given,
 )
 from ._utils import is_given, get_async_library
@@ -28,6 +29,7 @@ from ._streaming import Stream as Stream, AsyncStream as AsyncStream
 from ._exceptions import APIStatusError
 from ._base_client import (
     DEFAULT_MAX_RETRIES,
+    DEFAULT_STREAM_RECONNECTS,
     SyncAPIClient,
     AsyncAPIClient,
 )
@@ -35,6 +37,7 @@ from .lib.mcp import prepare_mcp_request, prepare_mcp_request_sync
 
 if TYPE_CHECKING:
     from .resources import chat, audio, images, models, embeddings
+    from .lib.transport import KeepAlive, PoolStats, WarmupResult, AsyncKeepAlive
     from .resources.images import ImagesResource, AsyncImagesResource
     from .resources.models import ModelsResource, AsyncModelsResource
     from .resources.chat.chat import ChatResource, AsyncChatResource
@@ -68,6 +71,8 @@ class Dedalus(SyncAPIClient):
     provider: str | None
     provider_key: str | None
     provider_model: str | None
+    request_compression: RequestCompression | None
+    stream_reconnects: int
 
     _environment: Literal["production", "development"] | NotGiven
 
@@ -87,6 +92,13 @@ class Dedalus(SyncAPIClient):
         max_retries: int = DEFAULT_MAX_RETRIES,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
+        # Compress JSON request bodies of at least 1 KiB: "gzip" or "zstd" (needs `zstandard`) always,
+        # "auto" with whichever of them the server lists in an `Accept-Encoding` response header.
+        request_compression: RequestCompression | None = None,
+        # Opt in to resuming `stream=True` responses whose connection drops: the request is sent again
+        # with `Last-Event-ID`, at most this many times per stream. Only enable it for endpoints that
+        # resume streams rather than start a new generation; only streams whose events carry an `id` are resumed.
+        stream_reconnects: int = DEFAULT_STREAM_RECONNECTS,
         # Configure a custom httpx client.
         # We provide a `DefaultHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#client) for more details.
@@ -140,6 +152,9 @@ class Dedalus(SyncAPIClient):
             provider_model = os.environ.get("DEDALUS_PROVIDER_MODEL")
         self.provider_model = provider_model
 
+        self.request_compression = request_compression
+        self.stream_reconnects = stream_reconnects
+
         self._environment = environment
 
         base_url_env = os.environ.get("DEDALUS_BASE_URL")
@@ -293,6 +308,8 @@ class Dedalus(SyncAPIClient):
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
+        request_compression: RequestCompression | None | NotGiven = not_given,
+        stream_reconnects: int | NotGiven = not_given,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -332,6 +349,8 @@ class Dedalus(SyncAPIClient):
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
             default_headers=headers,
             default_query=params,
+            request_compression=request_compression if is_given(request_compression) else self.request_compression,
+            stream_reconnects=stream_reconnects if is_given(stream_reconnects) else self.stream_reconnects,
             **_extra_kwargs,
         )
 
@@ -339,6 +358,27 @@ class Dedalus(SyncAPIClient):
     # client.with_options(timeout=10).foo.create(...)
     with_options = copy
 
+    def pool_stats(self) -> PoolStats:
+        """Connection pool statistics for this client's HTTP transport; see `dedalus_labs.lib.transport`."""
+        from .lib.transport import pool_stats
+
+        return pool_stats(self)
+
+    def warmup(self, n_connections: int = 4, *, timeout: float = 5.0) -> WarmupResult:
+        """Open `n_connections` pooled connections to `base_url`, plus one to `as_base_url`, ahead of the first request."""
+        from .lib.transport import warmup
+
+        return warmup(self, n_connections, timeout=timeout)
+
+    def keep_alive(self, n_connections: int = 4, *, interval: float | None = None) -> KeepAlive:
+        """Start re-warming the pool every `interval` seconds on a background thread; `stop()` or use as a context manager.
+
+        `interval` defaults to half the pool's keep-alive expiry and must be shorter than it.
+        """
+        from .lib.transport import KeepAlive
+
+        return KeepAlive(self, n_connections, interval=interval).start()
+
     @override
     def _make_status_error(
         self,
@@ -382,6 +422,8 @@ class AsyncDedalus(AsyncAPIClient):
     provider: str | None
     provider_key: str | None
     provider_model: str | None
+    request_compression: RequestCompression | None
+    stream_reconnects: int
 
     _environment: Literal["production", "development"] | NotGiven
 
@@ -401,6 +443,13 @@ class AsyncDedalus(AsyncAPIClient):
         max_retries: int = DEFAULT_MAX_RETRIES,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
+        # Compress JSON request bodies of at least 1 KiB: "gzip" or "zstd" (needs `zstandard`) always,
+        # "auto" with whichever of them the server lists in an `Accept-Encoding` response header.
+        request_compression: RequestCompression | None = None,
+        # Opt in to resuming `stream=True` responses whose connection drops: the request is sent again
+        # with `Last-Event-ID`, at most this many times per stream. Only enable it for endpoints that
+        # resume streams rather than start a new generation; only streams whose events carry an `id` are resumed.
+        stream_reconnects: int = DEFAULT_STREAM_RECONNECTS,
         # Configure a custom httpx client.
         # We provide a `DefaultAsyncHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#asyncclient) for more details.
@@ -454,6 +503,9 @@ class AsyncDedalus(AsyncAPIClient):
             provider_model = os.environ.get("DEDALUS_PROVIDER_MODEL")
         self.provider_model = provider_model
 
+        self.request_compression = request_compression
+        self.stream_reconnects = stream_reconnects
+
         self._environment = environment
 
         base_url_env = os.environ.get("DEDALUS_BASE_URL")
@@ -607,6 +659,8 @@ class AsyncDedalus(AsyncAPIClient):
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
+        request_compression: RequestCompression | None | NotGiven = not_given,
+        stream_reconnects: int | NotGiven = not_given,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -646,6 +700,8 @@ class AsyncDedalus(AsyncAPIClient):
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
             default_headers=headers,
             default_query=params,
+            request_compression=request_compression if is_given(request_compression) else self.request_compression,
+            stream_reconnects=stream_reconnects if is_given(stream_reconnects) else self.stream_reconnects,
             **_extra_kwargs,
         )
 
@@ -653,6 +709,27 @@ class AsyncDedalus(AsyncAPIClient):
     # client.with_options(timeout=10).foo.create(...)
     with_options = copy
 
+    def pool_stats(self) -> PoolStats:
+        """Connection pool statistics for this client's HTTP transport; see `dedalus_labs.lib.transport`."""
+        from .lib.transport import pool_stats
+
+        return pool_stats(self)
+
+    async def warmup(self, n_connections: int = 4, *, timeout: float = 5.0) -> WarmupResult:
+        """Open `n_connections` pooled connections to `base_url`, plus one to `as_base_url`, ahead of the first request."""
+        from .lib.transport import async_warmup
+
+        return await async_warmup(self, n_connections, timeout=timeout)
+
+    def keep_alive(self, n_connections: int = 4, *, interval: float | None = None) -> AsyncKeepAlive:
+        """Start re-warming the pool every `interval` seconds as a task on the running loop; `await stop()` or use `async with`.
+
+        `interval` defaults to half the pool's keep-alive expiry and must be shorter than it.
+        """
+        from .lib.transport import AsyncKeepAlive
+
+        return AsyncKeepAlive(self, n_connections, interval=interval).start()
+
     @override
     def _make_status_error(
         self,
@@ -12,3 +12,15 @@ DEFAULT_CONNECTION_LIMITS = httpx.Limits(max_connections=100, max_keepalive_conn
 
 INITIAL_RETRY_DELAY = 0.1
 MAX_RETRY_DELAY = 3.0
+
+# JSON request bodies smaller than this are sent uncompressed
+REQUEST_COMPRESSION_MIN_BYTES = 1024
+
+# async file writes are coalesced into chunks of at least this size
+DEFAULT_WRITE_BUFFER_SIZE = 256 * 1024
+
+# dropped `stream=True` connections are resumed with `Last-Event-ID` up to this many times;
+# off by default, since resuming re-sends the original (non-idempotent) POST
+DEFAULT_STREAM_RECONNECTS = 0
+# ids of this many recent events are kept to skip events a resumed stream replays
+STREAM_REPLAY_WINDOW = 1024
@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 import inspect
 import weakref
-from typing import TYPE_CHECKING, Any, Type, Union, Generic, TypeVar, Callable, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Type, Union, Generic, TypeVar, Callable, Optional, cast
 from datetime import date, datetime
 from typing_extensions import (
     List,
@@ -535,6 +535,13 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
 
         raise RuntimeError(f"Could not convert data into a valid instance of {type_}")
 
+    if is_literal_type(type_):
+        # hand back the annotation's own string, so e.g. the `object: "chat.completion.chunk"` of every
+        # chunk shares one object instead of keeping a fresh copy from the JSON decoder
+        if isinstance(value, str):
+            return _literal_strings(type_).get(value, value)
+        return value
+
     if origin == dict:
         if not is_mapping(value):
             return value
@@ -587,6 +594,11 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
     return value
 
 
+@lru_cache(maxsize=None)
+def _literal_strings(type_: type) -> Dict[str, str]:
+    return {arg: arg for arg in get_args(type_) if isinstance(arg, str)}
+
+
 @runtime_checkable
 class CachedDiscriminatorType(Protocol):
     __discriminator__: DiscriminatorDetails
@@ -12,6 +12,7 @@ from typing import (
     Union,
     Generic,
     TypeVar,
+    BinaryIO,
     Callable,
     Iterator,
     AsyncIterator,
@@ -24,10 +25,11 @@ import anyio
 import httpx
 import pydantic
 
-from ._types import NoneType
+from ._types import NoneType, AsyncByteSink
 from ._utils import is_given, extract_type_arg, is_annotated_type, is_type_alias_type, extract_type_var_from_base
 from ._models import BaseModel, is_basemodel
-from ._constants import RAW_RESPONSE_HEADER, OVERRIDE_CAST_TO_HEADER
+from ._transfer import TransferStats
+from ._constants import RAW_RESPONSE_HEADER, OVERRIDE_CAST_TO_HEADER, DEFAULT_WRITE_BUFFER_SIZE
 from ._streaming import Stream, AsyncStream, is_stream_class_type, extract_stream_chunk_type
 from ._exceptions import DedalusError, APIResponseValidationError
 
@@ -109,6 +111,15 @@ class BaseAPIResponse(Generic[R]):
         """The time taken for the complete request/response cycle to complete."""
         return self.http_response.elapsed
 
+    @property
+    def transfer_stats(self) -> TransferStats:
+        """Body bytes received over the wire and after decompression; complete once the body has been read."""
+        try:
+            decoded_bytes = len(self.http_response.content)
+        except httpx.ResponseNotRead:
+            decoded_bytes = 0
+        return TransferStats.from_response(self.http_response, decoded_bytes)
+
     @property
     def is_closed(self) -> bool:
         """Whether or not the response body has been closed.
@@ -506,20 +517,23 @@ class AsyncBinaryAPIResponse(AsyncAPIResponse[bytes]):
 
     async def write_to_file(
         self,
-        file: str | os.PathLike[str],
+        file: str | os.PathLike[str] | AsyncByteSink,
+        *,
+        buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
     ) -> None:
         """Write the output to the given file.
 
-        Accepts a filename or any path-like object, e.g. pathlib.Path
+        Accepts a filename or any path-like object, e.g. pathlib.Path, or any
+        object with an async `write(bytes)` method; writes are coalesced into
+        chunks of at least `buffer_size` bytes.
 
         Note: if you want to stream the data to the file instead of writing
         all at once then you should use `.with_streaming_response` when making
         the API request, e.g. `.with_streaming_response.get_binary_response()`
         """
-        path = anyio.Path(file)
-        async with await path.open(mode="wb") as f:
-            async for data in self.iter_bytes():
-                await f.write(data)
+        await _write_buffered(
+            self.iter_bytes(), file, buffer_size=buffer_size, size=_decoded_length(self.http_response)
+        )
 
 
 class StreamedBinaryAPIResponse(APIResponse[bytes]):
@@ -541,18 +555,87 @@ class StreamedBinaryAPIResponse(APIResponse[bytes]):
 class AsyncStreamedBinaryAPIResponse(AsyncAPIResponse[bytes]):
     async def stream_to_file(
         self,
-        file: str | os.PathLike[str],
+        file: str | os.PathLike[str] | AsyncByteSink,
         *,
         chunk_size: int | None = None,
+        buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+        preallocate: bool = True,
     ) -> None:
         """Streams the output to the given file.
 
-        Accepts a filename or any path-like object, e.g. pathlib.Path
+        Accepts a filename or any path-like object, e.g. pathlib.Path, or any
+        object with an async `write(bytes)` method.
+
+        Network chunks are coalesced so each write (a worker thread hop for
+        files) carries at least `buffer_size` bytes. With `preallocate`, files
+        are preallocated to the response's `Content-Length` when it is known.
         """
-        path = anyio.Path(file)
-        async with await path.open(mode="wb") as f:
-            async for data in self.iter_bytes(chunk_size):
-                await f.write(data)
+        size = _decoded_length(self.http_response) if preallocate else None
+        await _write_buffered(self.iter_bytes(chunk_size), file, buffer_size=buffer_size, size=size)
+
+
+def _decoded_length(response: httpx.Response) -> int | None:
+    # with a Content-Encoding the header counts compressed bytes, not what is written
+    length = response.headers.get("Content-Length")
+    if length is None or response.headers.get("Content-Encoding", "identity") != "identity":
+        return None
+    try:
+        return int(length)
+    except ValueError:
+        return None
+
+
+async def _write_buffered(
+    chunks: AsyncIterator[bytes],
+    file: str | os.PathLike[str] | AsyncByteSink,
+    *,
+    buffer_size: int,
+    size: int | None,
+) -> None:
+    if isinstance(file, (str, os.PathLike)):
+        f = await anyio.to_thread.run_sync(_open_for_write, file, size)
+        try:
+            await _coalesce(chunks, functools.partial(anyio.to_thread.run_sync, f.write), buffer_size)
+        finally:
+            await anyio.to_thread.run_sync(_close_written, f, size)
+    else:
+        await _coalesce(chunks, file.write, buffer_size)
+
+
+async def _coalesce(
+    chunks: AsyncIterator[bytes], write: Callable[[bytes], Awaitable[object]], buffer_size: int
+) -> None:
+    buffer = bytearray()
+    async for chunk in chunks:
+        if not buffer and len(chunk) >= buffer_size:
+            await write(chunk)
+            continue
+        buffer += chunk
+        if len(buffer) >= buffer_size:
+            await write(bytes(buffer))
+            buffer.clear()
+    if buffer:
+        await write(bytes(buffer))
+
+
+def _open_for_write(file: str | os.PathLike[str], size: int | None) -> BinaryIO:
+    f = open(file, mode="wb")  # noqa: SIM115
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            # not supported by every filesystem; the file just grows as it is written
+            pass
+    return f
+
+
+def _close_written(f: BinaryIO, size: int | None) -> None:
+    try:
+        if size:
+            # drop any preallocated space past what was actually written
+            f.truncate()
+    finally:
+        f.close()
 
 
 class MissingStreamClassError(TypeError):
@@ -2,14 +2,19 @@
 from __future__ import annotations
 
 import json
+import time
 import inspect
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, Iterator, AsyncIterator, cast
+from collections import deque
 from typing_extensions import Self, Protocol, TypeGuard, override, get_origin, runtime_checkable
 
+import anyio
 import httpx
 
 from ._utils import extract_type_var_from_base
+from ._transfer import TransferStats
+from ._constants import MAX_RETRY_DELAY, INITIAL_RETRY_DELAY, STREAM_REPLAY_WINDOW
 
 if TYPE_CHECKING:
     from ._client import Dedalus, AsyncDedalus
@@ -36,6 +41,7 @@ class Stream(Generic[_T]):
         self._cast_to = cast_to
         self._client = client
         self._decoder = client._make_sse_decoder()
+        self._decoded_bytes = 0
         self._iterator = self.__stream__()
 
     def __next__(self) -> _T:
@@ -46,11 +52,52 @@ class Stream(Generic[_T]):
             yield item
 
     def _iter_events(self) -> Iterator[ServerSentEvent]:
-        yield from self._decoder.iter_bytes(self.response.iter_bytes())
+        resumption = _Resumption(self._client.stream_reconnects)
+        while True:
+            try:
+                for sse in self._decoder.iter_bytes(self._count_bytes(self.response.iter_bytes())):
+                    if resumption.accept(sse):
+                        yield sse
+                return
+            except httpx.TransportError:
+                if not self._resume(resumption):
+                    raise
+
+    def _resume(self, resumption: _Resumption) -> bool:
+        """Reconnects with `Last-Event-ID` after a dropped connection; `False` if the stream can't be resumed."""
+        while True:
+            delay = resumption.next_delay()
+            request = resumption.build_request(self.response.request) if delay is not None else None
+            if delay is None or request is None:
+                return False
+
+            self.response.close()
+            time.sleep(delay)
+            try:
+                response = self._client._client.send(request, stream=True)
+            except httpx.TransportError:
+                continue
+
+            if not _is_event_stream(response):
+                response.close()
+                return False
+
+            self.response = response
+            self._decoder = self._client._make_sse_decoder()
+            return True
+
+    def _count_bytes(self, iterator: Iterator[bytes]) -> Iterator[bytes]:
+        for chunk in iterator:
+            self._decoded_bytes += len(chunk)
+            yield chunk
+
+    @property
+    def transfer_stats(self) -> TransferStats:
+        """Body bytes received over the wire and after decompression, so far."""
+        return TransferStats.from_response(self.response, self._decoded_bytes)
 
     def __stream__(self) -> Iterator[_T]:
         cast_to = cast(Any, self._cast_to)
-        response = self.response
         process_data = self._client._process_response_data
         iterator = self._iter_events()
 
@@ -66,7 +113,7 @@ class Stream(Generic[_T]):
                         body = sse.json()
                         err_msg = f"{body}"
                     except Exception:
-                        err_msg = sse.data or f"Error code: {response.status_code}"
+                        err_msg = sse.data or f"Error code: {self.response.status_code}"
 
                     raise self._client._make_status_error(
                         err_msg,
@@ -75,10 +122,10 @@ class Stream(Generic[_T]):
                     )
 
                 if sse.event is None:
-                    yield process_data(data=sse.json(), cast_to=cast_to, response=response)
+                    yield process_data(data=sse.json(), cast_to=cast_to, response=self.response)
         finally:
             # Ensure the response is closed even if the consumer doesn't read all data
-            response.close()
+            self.response.close()
 
     def __enter__(self) -> Self:
         return self
@@ -118,6 +165,7 @@ class AsyncStream(Generic[_T]):
         self._cast_to = cast_to
         self._client = client
         self._decoder = client._make_sse_decoder()
+        self._decoded_bytes = 0
         self._iterator = self.__stream__()
 
     async def __anext__(self) -> _T:
@@ -128,12 +176,52 @@ class AsyncStream(Generic[_T]):
             yield item
 
     async def _iter_events(self) -> AsyncIterator[ServerSentEvent]:
-        async for sse in self._decoder.aiter_bytes(self.response.aiter_bytes()):
-            yield sse
+        resumption = _Resumption(self._client.stream_reconnects)
+        while True:
+            try:
+                async for sse in self._decoder.aiter_bytes(self._count_bytes(self.response.aiter_bytes())):
+                    if resumption.accept(sse):
+                        yield sse
+                return
+            except httpx.TransportError:
+                if not await self._resume(resumption):
+                    raise
+
+    async def _resume(self, resumption: _Resumption) -> bool:
+        """Reconnects with `Last-Event-ID` after a dropped connection; `False` if the stream can't be resumed."""
+        while True:
+            delay = resumption.next_delay()
+            request = resumption.build_request(self.response.request) if delay is not None else None
+            if delay is None or request is None:
+                return False
+
+            await self.response.aclose()
+            await anyio.sleep(delay)
+            try:
+                response = await self._client._client.send(request, stream=True)
+            except httpx.TransportError:
+                continue
+
+            if not _is_event_stream(response):
+                await response.aclose()
+                return False
+
+            self.response = response
+            self._decoder = self._client._make_sse_decoder()
+            return True
+
+    async def _count_bytes(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        async for chunk in iterator:
+            self._decoded_bytes += len(chunk)
+            yield chunk
+
+    @property
+    def transfer_stats(self) -> TransferStats:
+        """Body bytes received over the wire and after decompression, so far."""
+        return TransferStats.from_response(self.response, self._decoded_bytes)
 
     async def __stream__(self) -> AsyncIterator[_T]:
         cast_to = cast(Any, self._cast_to)
-        response = self.response
         process_data = self._client._process_response_data
         iterator = self._iter_events()
 
@@ -149,7 +237,7 @@ class AsyncStream(Generic[_T]):
                         body = sse.json()
                         err_msg = f"{body}"
                     except Exception:
-                        err_msg = sse.data or f"Error code: {response.status_code}"
+                        err_msg = sse.data or f"Error code: {self.response.status_code}"
 
                     raise self._client._make_status_error(
                         err_msg,
@@ -158,10 +246,10 @@ class AsyncStream(Generic[_T]):
                     )
 
                 if sse.event is None:
-                    yield process_data(data=sse.json(), cast_to=cast_to, response=response)
+                    yield process_data(data=sse.json(), cast_to=cast_to, response=self.response)
         finally:
             # Ensure the response is closed even if the consumer doesn't read all data
-            await response.aclose()
+            await self.response.aclose()
 
     async def __aenter__(self) -> Self:
         return self
@@ -183,6 +271,67 @@ class AsyncStream(Generic[_T]):
         await self.response.aclose()
 
 
+class _Resumption:
+    """Bookkeeping for resuming a stream whose connection dropped mid-way.
+
+    Only streams whose events carry an `id` are resumed, so servers without
+    resumption support see no extra requests. Events replayed after a reconnect
+    are recognised by their id and skipped; only the ids of the last
+    `STREAM_REPLAY_WINDOW` events are remembered.
+    """
+
+    def __init__(self, max_reconnects: int) -> None:
+        self.max_reconnects = max_reconnects
+        self.attempts = 0
+        self.last_event_id: str | None = None
+        self.retry: int | None = None
+        self._seen: deque[str] = deque(maxlen=STREAM_REPLAY_WINDOW)
+        self._delivered: frozenset[str] = frozenset()
+
+    def accept(self, sse: ServerSentEvent) -> bool:
+        """Records the event's `id`/`retry` fields; returns whether it should be yielded."""
+        if sse.retry is not None:
+            self.retry = sse.retry
+        if sse.id is not None:
+            if sse.id in self._delivered:
+                return False
+            self._seen.append(sse.id)
+            self.last_event_id = sse.id
+        # blocks carrying only `id:`/`retry:` fields are control messages, not events
+        return bool(sse.data) or sse.event is not None
+
+    def next_delay(self) -> float | None:
+        """Seconds to wait before the next reconnect, or `None` if no attempt should be made."""
+        if self.last_event_id is None or self.attempts >= self.max_reconnects:
+            return None
+        self.attempts += 1
+        if self.retry is not None:
+            # the server's `retry:` field is in milliseconds
+            return min(self.retry / 1000, 60.0)
+        return min(INITIAL_RETRY_DELAY * pow(2.0, self.attempts - 1), MAX_RETRY_DELAY)
+
+    def build_request(self, previous: httpx.Request) -> httpx.Request | None:
+        try:
+            content = previous.content
+        except httpx.RequestNotRead:
+            # a streamed request body can't be sent again
+            return None
+
+        assert self.last_event_id is not None
+        headers = previous.headers.copy()
+        headers["Last-Event-ID"] = self.last_event_id
+        self._delivered = frozenset(self._seen)
+        # extensions carry the per-request timeout
+        return httpx.Request(
+            previous.method, previous.url, headers=headers, content=content, extensions=dict(previous.extensions)
+        )
+
+
+def _is_event_stream(response: httpx.Response) -> bool:
+    content_type = response.headers.get("content-type", "")
+    return response.status_code == 200 and content_type.startswith("text/event-stream")
+
+
 class ServerSentEvent:
     def __init__(
         self,
@@ -0,0 +1,80 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Response compression negotiation and byte accounting.
+
+Clients advertise every content coding httpx can decode, best first: zstd
+(with `zstandard` installed), brotli (with `brotli` or `brotlicffi`), then gzip
+and deflate. Override it like any other header, e.g.
+`Dedalus(default_headers={"Accept-Encoding": "gzip"})`.
+
+`APIResponse.transfer_stats` and `Stream.transfer_stats` report how many body
+bytes crossed the wire and how many they decoded to; `TransferStats` add up,
+so totals across many responses are `sum(stats, TransferStats())`.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+from dataclasses import dataclass
+
+import httpx
+
+try:
+    from httpx._decoders import SUPPORTED_DECODERS as _SUPPORTED_DECODERS
+except ImportError:  # pragma: no cover
+    _SUPPORTED_DECODERS = {"gzip": None, "deflate": None}
+
+__all__ = ["TransferStats", "ACCEPT_ENCODING"]
+
+_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+
+ACCEPT_ENCODING = ", ".join(coding for coding in _PREFERENCE if coding in _SUPPORTED_DECODERS)
+"""Content codings this process can decode, most preferred first."""
+
+
+@dataclass
+class TransferStats:
+    """Response body sizes before and after content decoding."""
+
+    wire_bytes: int = 0
+    """Body bytes received from the network."""
+    decoded_bytes: int = 0
+    """Body bytes after decompression; equal to `wire_bytes` for uncompressed responses."""
+    content_encoding: Optional[str] = None
+    """The response's `Content-Encoding`, if any."""
+    responses: int = 0
+    """How many responses these numbers cover."""
+
+    @property
+    def saved_bytes(self) -> int:
+        return max(self.decoded_bytes - self.wire_bytes, 0)
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.decoded_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+    def __add__(self, other: TransferStats) -> TransferStats:
+        if not self.responses:
+            return other
+        if not other.responses:
+            return self
+        return TransferStats(
+            wire_bytes=self.wire_bytes + other.wire_bytes,
+            decoded_bytes=self.decoded_bytes + other.decoded_bytes,
+            # only kept while every response used the same coding
+            content_encoding=self.content_encoding if self.content_encoding == other.content_encoding else None,
+            responses=self.responses + other.responses,
+        )
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, decoded_bytes: int) -> TransferStats:
+        return cls(
+            wire_bytes=response.num_bytes_downloaded,
+            decoded_bytes=decoded_bytes,
+            content_encoding=response.headers.get("Content-Encoding"),
+            responses=1,
+        )
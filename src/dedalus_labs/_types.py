@@ -185,6 +185,9 @@ class ModelBuilderProtocol(Protocol):
 
 Headers = Mapping[str, Union[str, Omit]]
 
+# "auto" compresses only with encodings the server has listed in an `Accept-Encoding` response header
+RequestCompression = Literal["auto", "gzip", "zstd"]
+
 
 class HeadersLikeProtocol(Protocol):
     def get(self, __key: str) -> str | None: ...
@@ -192,6 +195,13 @@ class HeadersLikeProtocol(Protocol):
 
 HeadersLike = Union[Headers, HeadersLikeProtocol]
 
+
+class AsyncByteSink(Protocol):
+    """Anything with an async `write(bytes)`, e.g. an uploader or a queue adapter."""
+
+    async def write(self, __data: bytes) -> object: ...
+
+
 ResponseT = TypeVar(
     "ResponseT",
     bound=Union[
@@ -9,6 +9,7 @@ import re
 from typing import Dict, Union, Optional
 from datetime import date, datetime, timezone, timedelta
 
+from ._utils import lru_cache
 from .._types import StrBytesIntFloat
 
 date_expr = r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
@@ -66,6 +67,21 @@ def _parse_timezone(value: Optional[str]) -> Union[None, int, timezone]:
         return None
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> Optional[datetime]:
+    # Fast path for the canonical `YYYY-MM-DDTHH:MM...` form the API sends. The
+    # C-level `fromisoformat` is much cheaper than the regex below, and list
+    # responses repeat the same timestamps, so results are cached (datetimes are
+    # immutable). Anything it rejects, e.g. single-digit fields or `+HH` offsets,
+    # falls back to the regex.
+    if len(value) < 16 or value[4] != "-" or value[7] != "-" or value[10] not in "T " or value[13] != ":":
+        return None
+    try:
+        return datetime.fromisoformat(value[:-1] + "+00:00" if value[-1] == "Z" else value)
+    except ValueError:
+        return None
+
+
 def parse_datetime(value: Union[datetime, StrBytesIntFloat]) -> datetime:
     """
     Parse a datetime/int/float/string and return a datetime.datetime.
@@ -79,6 +95,11 @@ def parse_datetime(value: Union[datetime, StrBytesIntFloat]) -> datetime:
     if isinstance(value, datetime):
         return value
 
+    if isinstance(value, str):
+        parsed = _parse_iso_datetime(value)
+        if parsed is not None:
+            return parsed
+
     number = _get_numeric(value, "datetime")
     if number is not None:
         return _from_unix_seconds(number)
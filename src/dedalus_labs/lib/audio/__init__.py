@@ -0,0 +1,23 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Client-side helpers for working with audio endpoints."""
+
+from ._chunking import (
+    AudioChunk,
+    split_audio,
+)
+from ._transcribe import (
+    stitch_transcriptions,
+    transcribe_long_audio,
+)
+
+__all__ = [
+    "AudioChunk",
+    "split_audio",
+    "stitch_transcriptions",
+    "transcribe_long_audio",
+]
@@ -0,0 +1,199 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Local silence-aware splitting of WAV / raw PCM audio.
+
+Cut points are placed near every `segment_seconds` boundary, snapped to the
+quietest window found within `search_seconds` of the target. Each chunk is
+extended by `overlap_seconds` past its cut so words straddling a boundary are
+heard by both neighbours; the stitcher later drops the duplicated tail.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import wave
+import array
+from typing import IO, List, Union, Optional
+from dataclasses import dataclass
+
+__all__ = [
+    "AudioChunk",
+    "split_audio",
+]
+
+AudioInput = Union[bytes, bytearray, memoryview, os.PathLike[str], str, IO[bytes]]
+
+# Energy is measured over windows of this length when looking for a quiet cut point.
+_ENERGY_WINDOW_SECONDS = 0.02
+
+_SAMPLE_TYPECODES = {1: "B", 2: "h", 4: "i"}
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """A self-contained WAV segment of a longer recording."""
+
+    index: int
+    start: float
+    """Offset of the first sample, in seconds from the start of the recording."""
+    end: float
+    """Offset of the owned end boundary (excluding the overlap tail), in seconds."""
+    overlap: float
+    """Seconds of audio past `end` that are also included in `data`."""
+    data: bytes
+    """WAV-encoded audio for this chunk."""
+
+    @property
+    def filename(self) -> str:
+        return f"chunk-{self.index:04d}.wav"
+
+
+@dataclass(frozen=True)
+class _PCM:
+    frames: memoryview
+    sample_rate: int
+    channels: int
+    sample_width: int
+
+    @property
+    def frame_size(self) -> int:
+        return self.channels * self.sample_width
+
+    @property
+    def n_frames(self) -> int:
+        return len(self.frames) // self.frame_size
+
+
+def split_audio(
+    audio: AudioInput,
+    *,
+    segment_seconds: float = 600.0,
+    overlap_seconds: float = 2.0,
+    search_seconds: float = 5.0,
+    sample_rate: Optional[int] = None,
+    channels: int = 1,
+    sample_width: int = 2,
+) -> List[AudioChunk]:
+    """Split a WAV file or raw PCM buffer into overlapping WAV chunks.
+
+    WAV input is detected from its RIFF header. Anything else is treated as raw
+    little-endian PCM, in which case `sample_rate` is required and `channels` /
+    `sample_width` describe the layout.
+
+    Args:
+        audio: WAV or PCM bytes, a path, or a binary file object.
+        segment_seconds: Target length of each chunk before silence snapping.
+        overlap_seconds: Audio shared between consecutive chunks.
+        search_seconds: How far either side of a target boundary to look for silence.
+        sample_rate: Sample rate of raw PCM input (ignored for WAV).
+        channels: Channel count of raw PCM input (ignored for WAV).
+        sample_width: Bytes per sample of raw PCM input (ignored for WAV).
+    """
+    if segment_seconds <= 0:
+        raise ValueError("segment_seconds must be positive")
+    if overlap_seconds < 0 or search_seconds < 0:
+        raise ValueError("overlap_seconds and search_seconds must not be negative")
+
+    pcm = _load_pcm(_read_bytes(audio), sample_rate=sample_rate, channels=channels, sample_width=sample_width)
+    rate = pcm.sample_rate
+    total = pcm.n_frames
+
+    segment_frames = max(1, int(segment_seconds * rate))
+    overlap_frames = int(overlap_seconds * rate)
+    # keep every chunk at least half a segment long, whatever the search window
+    search_frames = min(int(search_seconds * rate), segment_frames // 2)
+
+    cuts = [0]
+    target = segment_frames
+    while target < total:
+        cut = _quietest_frame(pcm, target - search_frames, target + search_frames)
+        # never produce an empty or backwards chunk
+        cut = max(cut, cuts[-1] + 1)
+        # a tail shorter than the search window is folded into the last chunk
+        if total - cut <= search_frames:
+            break
+        cuts.append(cut)
+        target = cut + segment_frames
+    cuts.append(total)
+
+    chunks: List[AudioChunk] = []
+    for index, (start, end) in enumerate(zip(cuts, cuts[1:])):
+        tail = min(end + overlap_frames, total)
+        chunks.append(
+            AudioChunk(
+                index=index,
+                start=start / rate,
+                end=end / rate,
+                overlap=(tail - end) / rate,
+                data=_encode_wav(pcm, start, tail),
+            )
+        )
+    return chunks
+
+
+def _read_bytes(audio: AudioInput) -> bytes:
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return bytes(audio)
+    if isinstance(audio, (str, os.PathLike)):
+        with open(audio, "rb") as f:
+            return f.read()
+    return audio.read()
+
+
+def _load_pcm(data: bytes, *, sample_rate: Optional[int], channels: int, sample_width: int) -> _PCM:
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        with wave.open(io.BytesIO(data), "rb") as w:
+            pcm = _PCM(
+                frames=memoryview(w.readframes(w.getnframes())),
+                sample_rate=w.getframerate(),
+                channels=w.getnchannels(),
+                sample_width=w.getsampwidth(),
+            )
+    else:
+        if sample_rate is None:
+            raise ValueError("`sample_rate` is required for raw PCM input")
+        pcm = _PCM(frames=memoryview(data), sample_rate=sample_rate, channels=channels, sample_width=sample_width)
+
+    if pcm.sample_width not in _SAMPLE_TYPECODES:
+        raise ValueError(f"Unsupported sample width: {pcm.sample_width} bytes")
+    return pcm
+
+
+def _quietest_frame(pcm: _PCM, lo: int, hi: int) -> int:
+    """Return the frame index at the start of the lowest-energy window in `[lo, hi)`."""
+    lo = max(lo, 0)
+    hi = min(hi, pcm.n_frames)
+    window = max(1, int(_ENERGY_WINDOW_SECONDS * pcm.sample_rate))
+    if hi - lo <= window:
+        return (lo + hi) // 2
+
+    # Only the first channel is inspected; speech is rarely silent on one channel alone.
+    samples = array.array(_SAMPLE_TYPECODES[pcm.sample_width])
+    samples.frombytes(pcm.frames[lo * pcm.frame_size : hi * pcm.frame_size])
+    if sys.byteorder == "big" and pcm.sample_width > 1:
+        samples.byteswap()
+    mono = samples[:: pcm.channels]
+    bias = 128 if pcm.sample_width == 1 else 0  # 8-bit WAV is unsigned
+
+    best_frame, best_energy = lo, None
+    for offset in range(0, len(mono) - window + 1, window):
+        energy = sum((s - bias) * (s - bias) for s in mono[offset : offset + window])
+        if best_energy is None or energy < best_energy:
+            best_frame, best_energy = lo + offset, energy
+    return best_frame + window // 2
+
+
+def _encode_wav(pcm: _PCM, start: int, end: int) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(pcm.channels)
+        w.setsampwidth(pcm.sample_width)
+        w.setframerate(pcm.sample_rate)
+        w.writeframes(pcm.frames[start * pcm.frame_size : end * pcm.frame_size])
+    return buf.getvalue()
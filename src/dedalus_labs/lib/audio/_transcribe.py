@@ -0,0 +1,161 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Parallel transcription of long recordings.
+
+The recording is split locally (see `split_audio`), every chunk is sent as its
+own `audio.transcriptions.create` request, and the per-chunk results are merged
+back into a single verbose transcript with timestamps shifted onto the
+recording's timeline. Wall-clock time is bounded by the slowest chunk rather
+than by the length of the whole file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, List, TypeVar, Optional, Sequence
+
+from ..._compat import model_copy
+from ._chunking import AudioChunk, AudioInput, split_audio
+from ...types.audio.transcription_create_response import (
+    TranscriptionCreateResponse,
+    CreateTranscriptionResponseVerboseJSON,
+    CreateTranscriptionResponseVerboseJSONWord,
+    CreateTranscriptionResponseVerboseJSONSegment,
+)
+
+if TYPE_CHECKING:
+    from ...resources.audio.transcriptions import AsyncTranscriptionsResource
+
+__all__ = [
+    "stitch_transcriptions",
+    "transcribe_long_audio",
+]
+
+_TimedT = TypeVar("_TimedT", CreateTranscriptionResponseVerboseJSONSegment, CreateTranscriptionResponseVerboseJSONWord)
+
+
+async def transcribe_long_audio(
+    transcriptions: AsyncTranscriptionsResource,
+    audio: AudioInput,
+    *,
+    model: str,
+    segment_seconds: float = 600.0,
+    overlap_seconds: float = 2.0,
+    search_seconds: float = 5.0,
+    max_concurrency: int = 8,
+    sample_rate: Optional[int] = None,
+    channels: int = 1,
+    sample_width: int = 2,
+    **create_kwargs: Any,
+) -> CreateTranscriptionResponseVerboseJSON:
+    """Transcribe a long WAV / PCM recording by fanning out over overlapping chunks.
+
+    Chunks are requested with `response_format="verbose_json"` (unless overridden)
+    so that segment timestamps are available for de-duplicating the overlaps.
+    Extra keyword arguments such as `language` or `prompt` are forwarded to every
+    `create` call.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    chunks = split_audio(
+        audio,
+        segment_seconds=segment_seconds,
+        overlap_seconds=overlap_seconds,
+        search_seconds=search_seconds,
+        sample_rate=sample_rate,
+        channels=channels,
+        sample_width=sample_width,
+    )
+    create_kwargs.setdefault("response_format", "verbose_json")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def transcribe(chunk: AudioChunk) -> TranscriptionCreateResponse:
+        async with semaphore:
+            return await transcriptions.create(
+                file=(chunk.filename, chunk.data, "audio/wav"),
+                model=model,
+                **create_kwargs,
+            )
+
+    results = await asyncio.gather(*(transcribe(chunk) for chunk in chunks))
+    return stitch_transcriptions(chunks, results)
+
+
+def stitch_transcriptions(
+    chunks: Sequence[AudioChunk],
+    results: Sequence[TranscriptionCreateResponse],
+) -> CreateTranscriptionResponseVerboseJSON:
+    """Merge per-chunk transcripts into one, shifting timestamps by each chunk's offset.
+
+    Each chunk owns the interval `[chunk.start, chunk.end)`; segments and words are
+    kept only by the chunk that owns their midpoint, which drops the duplicates
+    produced by the overlap tails. Results without segments (plain `json`) are
+    concatenated as-is.
+    """
+    if len(chunks) != len(results):
+        raise ValueError("Expected one transcription result per chunk")
+
+    segments: List[CreateTranscriptionResponseVerboseJSONSegment] = []
+    words: List[CreateTranscriptionResponseVerboseJSONWord] = []
+    texts: List[str] = []
+    language: Optional[str] = None
+    has_timestamps = False
+
+    for chunk, result in zip(chunks, results):
+        chunk_segments = getattr(result, "segments", None)
+        chunk_words = getattr(result, "words", None)
+        language = language or getattr(result, "language", None)
+
+        if chunk_segments is None and chunk_words is None:
+            texts.append(result.text.strip())
+            continue
+
+        has_timestamps = True
+        chunk_texts: List[str] = []
+        for segment in chunk_segments or []:
+            start, end = segment.start + chunk.start, segment.end + chunk.start
+            if not _owns(chunk, start, end):
+                continue
+            segments.append(_shifted(segment, start, end, id=len(segments)))
+            chunk_texts.append(segment.text.strip())
+
+        for word in chunk_words or []:
+            start, end = word.start + chunk.start, word.end + chunk.start
+            if _owns(chunk, start, end):
+                words.append(_shifted(word, start, end))
+
+        if chunk_segments is None:
+            chunk_texts = [
+                w.word for w in chunk_words or [] if _owns(chunk, w.start + chunk.start, w.end + chunk.start)
+            ]
+        texts.append(" ".join(t for t in chunk_texts if t))
+
+    return CreateTranscriptionResponseVerboseJSON.construct(
+        duration=chunks[-1].end if chunks else 0.0,
+        language=language or "",
+        text=" ".join(t for t in texts if t),
+        segments=segments if has_timestamps else None,
+        words=words or None,
+    )
+
+
+def _owns(chunk: AudioChunk, start: float, end: float) -> bool:
+    midpoint = (start + end) / 2
+    if midpoint < chunk.start:
+        return chunk.index == 0
+    # the final chunk has no overlap tail and owns everything up to the end
+    return midpoint < chunk.end or chunk.overlap == 0
+
+
+def _shifted(item: _TimedT, start: float, end: float, **updates: Any) -> _TimedT:
+    item = model_copy(item)
+    item.start = start
+    item.end = end
+    for key, value in updates.items():
+        setattr(item, key, value)
+    return item
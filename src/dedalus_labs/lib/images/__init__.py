@@ -0,0 +1,29 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Client-side helpers for working with image endpoints."""
+
+from ._bulk import (
+    BulkImageStats,
+    generate_images_bulk,
+)
+from ._lazy import (
+    LazyImage,
+    LazyImagesResponse,
+)
+from ._payload import (
+    Base64Payload,
+    parse_b64_json,
+)
+
+__all__ = [
+    "Base64Payload",
+    "BulkImageStats",
+    "LazyImage",
+    "LazyImagesResponse",
+    "generate_images_bulk",
+    "parse_b64_json",
+]
@@ -0,0 +1,212 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Bulk image generation with bounded concurrency and a resumable manifest.
+
+Requests are pulled lazily from the input iterable by a fixed pool of workers,
+so memory stays flat for arbitrarily long jobs. Each finished request is written
+to disk and appended to a JSONL manifest immediately; re-running the same job
+with the same manifest skips everything that already succeeded.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Union, Mapping, Iterable, Optional
+from pathlib import Path
+from dataclasses import field, dataclass
+from typing_extensions import Literal
+
+from ._lazy import LazyImagesResponse
+from ..._utils import asyncify
+from ..utils._manifest import Manifest, request_id, latency_percentile
+
+if TYPE_CHECKING:
+    from ...resources.images import AsyncImagesResource
+
+__all__ = [
+    "BulkImageStats",
+    "generate_images_bulk",
+]
+
+BulkMethod = Literal["generate", "edit", "create_variation"]
+
+BulkItem = Union[str, Mapping[str, Any]]
+"""A prompt, or a mapping of keyword arguments for the chosen method (plus an optional `id`)."""
+
+
+@dataclass
+class BulkImageStats:
+    """Aggregate results of a `generate_bulk` run."""
+
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    """Items already marked as done in the manifest."""
+    images: int = 0
+    bytes_written: int = 0
+    elapsed: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    """Per-request latency in seconds, in completion order."""
+
+    @property
+    def requests_per_second(self) -> float:
+        return (self.succeeded + self.failed) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def images_per_second(self) -> float:
+        return self.images / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        return latency_percentile(self.latencies, percentile)
+
+
+class _RateLimiter:
+    """Spaces out acquisitions so that at most `per_minute` happen in any minute."""
+
+    def __init__(self, per_minute: float) -> None:
+        self._interval = 60.0 / per_minute
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+async def generate_images_bulk(
+    images: AsyncImagesResource,
+    items: Iterable[BulkItem],
+    *,
+    output_dir: Union[str, os.PathLike[str]],
+    method: BulkMethod = "generate",
+    manifest: Union[str, os.PathLike[str], None] = None,
+    max_concurrency: int = 8,
+    requests_per_minute: Union[float, Mapping[str, float], None] = None,
+    **params: Any,
+) -> BulkImageStats:
+    """Run `method` for every item at bounded concurrency, saving results as they complete.
+
+    Args:
+        images: The `AsyncImagesResource` to call.
+        items: Prompts or per-request keyword arguments; `params` are used as defaults.
+            A mapping may carry an `id`, which names its output files and manifest entry;
+            otherwise a hash of the request parameters is used, with `image`/`mask`
+            files hashed by content. Unseekable file objects can't be hashed that
+            way, so items using them need an explicit `id`. Characters that aren't
+            safe in a file name are replaced with `_` in the output file names.
+        output_dir: Directory that decoded images are written to as `<id>-<n>.<format>`.
+        method: Which endpoint to call: `generate`, `edit` or `create_variation`.
+        manifest: JSONL file recording each finished item. Defaults to
+            `<output_dir>/manifest.jsonl`; items recorded as `ok` are skipped on re-runs.
+        max_concurrency: Maximum number of requests in flight.
+        requests_per_minute: Either a single limit shared by all requests, or a mapping of
+            model name to limit (models not in the mapping are not rate limited).
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    log = Manifest(manifest if manifest is not None else out / "manifest.jsonl")
+    done = log.finished()
+    record = asyncify(log.record)
+
+    endpoint = getattr(images.with_lazy_payloads, method)
+    limiters: Dict[Optional[str], _RateLimiter] = {}
+    stats = BulkImageStats()
+    iterator = iter(items)
+    started = time.monotonic()
+
+    def limiter_for(model: Optional[str]) -> Optional[_RateLimiter]:
+        if requests_per_minute is None:
+            return None
+        if isinstance(requests_per_minute, Mapping):
+            if model not in requests_per_minute:
+                return None
+            rate = requests_per_minute[model]
+        else:
+            model, rate = None, requests_per_minute
+        if model not in limiters:
+            limiters[model] = _RateLimiter(rate)
+        return limiters[model]
+
+    async def worker() -> None:
+        for item in iterator:
+            request = {**params, **({"prompt": item} if isinstance(item, str) else item)}
+            # reads any files in the request to hash them
+            item_id = str(request.pop("id", None) or await asyncify(request_id)({"method": method, **request}))
+            if item_id in done:
+                stats.skipped += 1
+                continue
+
+            stats.submitted += 1
+            limiter = limiter_for(request.get("model"))
+            if limiter is not None:
+                await limiter.acquire()
+
+            request_started = time.monotonic()
+            try:
+                response: LazyImagesResponse = await endpoint(**request)
+                latency = time.monotonic() - request_started
+                files, written = await asyncify(_save_images)(
+                    response, out, item_id, request.get("output_format") or "png"
+                )
+            except Exception as exc:
+                stats.failed += 1
+                await record({"id": item_id, "status": "error", "error": f"{type(exc).__name__}: {exc}"})
+                continue
+
+            stats.succeeded += 1
+            stats.images += len(response.data)
+            stats.bytes_written += written
+            stats.latencies.append(latency)
+            done.add(item_id)
+            await record(
+                {
+                    "id": item_id,
+                    "status": "ok",
+                    "model": request.get("model"),
+                    "latency": round(latency, 4),
+                    "files": files,
+                    "urls": [image.url for image in response.data if image.url],
+                }
+            )
+
+    await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+
+    stats.elapsed = time.monotonic() - started
+    return stats
+
+
+def _file_stem(item_id: str) -> str:
+    # ids come from the caller; never let one name a path outside `output_dir`
+    stem = re.sub(r"[^\w.-]", "_", item_id)
+    return "_" + stem if stem.startswith(".") else stem
+
+
+def _save_images(response: LazyImagesResponse, out: Path, item_id: str, extension: str) -> tuple[List[str], int]:
+    files: List[str] = []
+    written = 0
+    for index, image in enumerate(response.data):
+        if image.payload is None:
+            continue
+        path = out / f"{_file_stem(item_id)}-{index}.{extension}"
+        written += image.save(path)
+        files.append(path.name)
+    return files, written
@@ -0,0 +1,144 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""`ImagesResponse` variant whose image payloads stay as slices of the response body.
+
+A regular `ImagesResponse` holds every image as a base64 `str` (one copy of the
+body) and decoding it creates another. Here each image keeps a `Base64Payload`
+view into the raw body instead, so the only full-size allocations are the body
+itself and whatever the caller explicitly decodes; `save()` decodes slice by
+slice straight into the file.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any, Dict, List, Callable, Optional, Awaitable, cast
+from typing_extensions import ParamSpec
+
+import httpx
+import pydantic
+
+from ._payload import Base64Payload, parse_b64_json
+from ..._compat import PYDANTIC_V1
+from ...types.image import Image
+from ...types.images_response import ImagesResponse
+
+if TYPE_CHECKING:
+    from ..._response import APIResponse, AsyncAPIResponse
+    from ...resources.images import ImagesResource, AsyncImagesResource
+
+__all__ = [
+    "LazyImage",
+    "LazyImagesResponse",
+    "ImagesResourceWithLazyPayloads",
+    "AsyncImagesResourceWithLazyPayloads",
+]
+
+P = ParamSpec("P")
+
+
+class LazyImage(Image):
+    """An `Image` whose data is held as an undecoded view into the response body.
+
+    `b64_json` is left unset; use `payload`, `to_bytes()` or `save()` instead.
+    """
+
+    _payload: Optional[Base64Payload] = pydantic.PrivateAttr(default=None)
+
+    @property
+    def payload(self) -> Optional[Base64Payload]:
+        if self._payload is None and self.b64_json is not None:
+            return Base64Payload.from_str(self.b64_json)
+        return self._payload
+
+    def _b64_payload(self) -> Base64Payload:
+        if self._payload is None:
+            return super()._b64_payload()
+        return self._payload
+
+
+class LazyImagesResponse(ImagesResponse):
+    data: List[LazyImage]  # type: ignore[assignment]
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> LazyImagesResponse:
+        """Parse a raw `/v1/images/*` JSON body without materialising image payloads as `str`."""
+        parsed = cast(Dict[str, Any], parse_b64_json(body))
+        items = cast(List[Dict[str, Any]], parsed.get("data") or [])
+        payloads = [item.pop("b64_json", None) for item in items]
+
+        response = cls.construct(**parsed)
+        for image, payload in zip(response.data, payloads):
+            if isinstance(payload, Base64Payload):
+                _attach_payload(image, payload)
+        return response
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> LazyImagesResponse:
+        """Parse an already-read `httpx.Response`, e.g. `client.images.with_raw_response.generate(...).http_response`."""
+        return cls.from_bytes(response.content)
+
+
+def _attach_payload(image: LazyImage, payload: Base64Payload) -> None:
+    if PYDANTIC_V1:
+        object.__setattr__(image, "_payload", payload)
+    else:
+        # `construct()` leaves the private namespace unset under pydantic v2
+        private = cast(Optional[Dict[str, Any]], image.__pydantic_private__)
+        if private is None:
+            object.__setattr__(image, "__pydantic_private__", {"_payload": payload})
+        else:
+            private["_payload"] = payload
+
+
+def to_lazy_images_wrapper(func: Callable[P, APIResponse[ImagesResponse]]) -> Callable[P, LazyImagesResponse]:
+    @functools.wraps(func)
+    def wrapped(*args: P.args, **kwargs: P.kwargs) -> LazyImagesResponse:
+        return LazyImagesResponse.from_bytes(func(*args, **kwargs).read())
+
+    return wrapped
+
+
+def async_to_lazy_images_wrapper(
+    func: Callable[P, Awaitable[AsyncAPIResponse[ImagesResponse]]],
+) -> Callable[P, Awaitable[LazyImagesResponse]]:
+    @functools.wraps(func)
+    async def wrapped(*args: P.args, **kwargs: P.kwargs) -> LazyImagesResponse:
+        raw = await func(*args, **kwargs)
+        return LazyImagesResponse.from_bytes(await raw.read())
+
+    return wrapped
+
+
+class ImagesResourceWithLazyPayloads:
+    def __init__(self, images: ImagesResource) -> None:
+        self._images = images
+
+        self.create_variation = to_lazy_images_wrapper(
+            images.with_raw_response.create_variation,
+        )
+        self.edit = to_lazy_images_wrapper(
+            images.with_raw_response.edit,
+        )
+        self.generate = to_lazy_images_wrapper(
+            images.with_raw_response.generate,
+        )
+
+
+class AsyncImagesResourceWithLazyPayloads:
+    def __init__(self, images: AsyncImagesResource) -> None:
+        self._images = images
+
+        self.create_variation = async_to_lazy_images_wrapper(
+            images.with_raw_response.create_variation,
+        )
+        self.edit = async_to_lazy_images_wrapper(
+            images.with_raw_response.edit,
+        )
+        self.generate = async_to_lazy_images_wrapper(
+            images.with_raw_response.generate,
+        )
@@ -0,0 +1,161 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Zero-copy handling of base64 image payloads.
+
+Image endpoints return pictures as multi-megabyte base64 strings embedded in
+JSON. Parsing that JSON the usual way materialises every payload as a Python
+`str` before the caller has decided whether it even wants the pixels. The
+helpers here keep the encoded bytes as a `memoryview` into the response body
+and only decode when asked, optionally straight into a file.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import binascii
+from typing import IO, Any, Dict, List, Tuple, Union, Iterator, Optional, cast
+
+__all__ = [
+    "Base64Payload",
+    "parse_b64_json",
+]
+
+# Decode in slices that are a multiple of 4 base64 characters.
+_DECODE_SLICE = 4 * 64 * 1024
+
+
+class Base64Payload:
+    """A lazily decoded view over base64-encoded bytes."""
+
+    __slots__ = ("_encoded", "_decoded")
+
+    def __init__(self, encoded: Union[bytes, bytearray, memoryview]) -> None:
+        self._encoded = memoryview(encoded).cast("B")
+        self._decoded: Optional[bytes] = None
+
+    @classmethod
+    def from_str(cls, value: str) -> Base64Payload:
+        return cls(value.encode("ascii"))
+
+    @property
+    def encoded(self) -> memoryview:
+        """The raw base64 characters, without copying."""
+        return self._encoded
+
+    @property
+    def size(self) -> int:
+        """Length of the decoded data, computed without decoding."""
+        n = len(self._encoded)
+        if n == 0:
+            return 0
+        padding = (self._encoded[n - 1] == ord("=")) + (n > 1 and self._encoded[n - 2] == ord("="))
+        return n // 4 * 3 - padding
+
+    def __len__(self) -> int:
+        return self.size
+
+    def to_bytes(self) -> bytes:
+        """Decode the payload. The result is cached, so repeated calls are free."""
+        if self._decoded is None:
+            self._decoded = binascii.a2b_base64(self._encoded)
+        return self._decoded
+
+    def to_memoryview(self) -> memoryview:
+        return memoryview(self.to_bytes())
+
+    def to_str(self) -> str:
+        """The base64 text, for APIs that insist on a `str`."""
+        return str(self._encoded, "ascii")
+
+    def save(self, file: Union[str, "os.PathLike[str]", IO[bytes]]) -> int:
+        """Decode into `file` slice by slice and return the number of bytes written.
+
+        Unless `to_bytes()` has already been called, the full decoded image is
+        never held in memory at once.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "wb") as f:
+                return self._write(f)
+        return self._write(file)
+
+    def _write(self, f: IO[bytes]) -> int:
+        if self._decoded is not None:
+            f.write(self._decoded)
+            return len(self._decoded)
+
+        written = 0
+        encoded = self._encoded
+        for offset in range(0, len(encoded), _DECODE_SLICE):
+            chunk = binascii.a2b_base64(encoded[offset : offset + _DECODE_SLICE])
+            f.write(chunk)
+            written += len(chunk)
+        return written
+
+    def __repr__(self) -> str:
+        return f"Base64Payload(size={self.size})"
+
+
+def parse_b64_json(data: Union[bytes, bytearray, memoryview]) -> Any:
+    """Parse JSON, replacing every `b64_json` string value with a `Base64Payload`.
+
+    The payloads are sliced out of `data` before parsing, so the JSON parser only
+    ever sees the small surrounding metadata and the base64 text is never turned
+    into a `str`. Values containing escape sequences fall back to a copy.
+    """
+    view = memoryview(data).cast("B")
+    raw = data if isinstance(data, bytes) else bytes(view)
+
+    spans: List[Tuple[int, int]] = []
+    stripped = bytearray()
+    last = 0
+    pos = raw.find(b'"b64_json"')
+    while pos != -1:
+        start = _skip_to_string(raw, pos + len(b'"b64_json"'))
+        end = raw.find(b'"', start) if start is not None else -1
+        if start is not None and end != -1 and raw.find(b"\\", start, end) == -1:
+            stripped += view[last:start]
+            spans.append((start, end))
+            last = end
+            pos = raw.find(b'"b64_json"', end + 1)
+        else:
+            pos = raw.find(b'"b64_json"', pos + 1)
+    stripped += view[last:]
+
+    payloads = iter([Base64Payload(view[start:end]) for start, end in spans])
+    parsed = json.loads(stripped if spans else raw)
+    return _attach(parsed, payloads)
+
+
+def _attach(value: Any, payloads: Iterator[Base64Payload]) -> Any:
+    # json.loads preserves document order, so payloads are re-attached in the order they were cut out
+    if isinstance(value, dict):
+        obj = cast(Dict[str, Any], value)
+        for key, item in obj.items():
+            if key == "b64_json" and isinstance(item, str):
+                obj[key] = next(payloads) if item == "" else Base64Payload.from_str(item)
+            else:
+                _attach(item, payloads)
+    elif isinstance(value, list):
+        for item in cast(List[Any], value):
+            _attach(item, payloads)
+    return value
+
+
+def _skip_to_string(raw: bytes, pos: int) -> Optional[int]:
+    """Return the index just past the opening quote of the value following a key at `pos`."""
+    n = len(raw)
+    while pos < n and raw[pos] in b" \t\r\n":
+        pos += 1
+    if pos >= n or raw[pos] != ord(":"):
+        return None
+    pos += 1
+    while pos < n and raw[pos] in b" \t\r\n":
+        pos += 1
+    if pos >= n or raw[pos] != ord('"'):
+        return None
+    return pos + 1
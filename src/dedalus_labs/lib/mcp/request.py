@@ -8,23 +8,22 @@
 
 This module handles the client-side preparation of MCP requests:
 1. Serializes MCPServer objects to wire format (dicts/strings)
-2. Deep copies to protect retry logic from mutation side effects
+2. Copies the body on write, so retries always start from the caller's body
 3. Encrypts credentials client-side before transmission
 """
 
 from __future__ import annotations
 
-import copy
 import logging
-from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence
+from dataclasses import dataclass
 
-from dedalus_labs.types.shared_params.mcp_server_spec import MCPServerSpec
 from dedalus_labs.types.shared_params.mcp_servers import MCPServerItem
+from dedalus_labs.types.shared_params.mcp_server_spec import MCPServerSpec
 
+from .wire import serialize_mcp_servers
 from ..crypto import encrypt_credentials, fetch_encryption_key, fetch_encryption_key_sync
 from .protocols import CredentialProtocol
-from .wire import serialize_mcp_servers
 
 logger = logging.getLogger(__name__)
 
@@ -63,24 +62,22 @@ async def prepare_mcp_request(
     as_url: Optional[str],
     http_client: Any,
 ) -> Dict[str, Any]:
-    """Serialize mcp_servers, deepcopy, and encrypt credentials.
+    """Serialize mcp_servers and encrypt credentials.
 
     Args:
-        data: Request body dict (modified in place before copy).
+        data: Request body dict; never modified.
         as_url: Authorization server URL for fetching encryption key.
         http_client: httpx.AsyncClient for key fetch.
 
     Returns:
-        A new dict with serialized servers and encrypted credentials.
+        `data` itself if there is nothing to prepare, otherwise a shallow copy
+        with serialized servers and encrypted credentials.
 
     """
-    # Serialize MCP servers, if provided.
+    if not _needs_preparation(data):
+        return data
     servers = data.get("mcp_servers")
-    if servers is not None:
-        data["mcp_servers"] = serialize_mcp_servers(servers)
-
-    # Make a copy to avoid mutation side effects related to SDK retry logic.
-    data = copy.deepcopy(data)
+    data = _with_serialized_servers(data)
     credentials = data.get("credentials")
 
     # If credentials are provided, encrypt them on the client side
@@ -107,21 +104,19 @@ def prepare_mcp_request_sync(
     """Sync version of prepare_mcp_request.
 
     Args:
-        data: Request body dict (modified in place before copy).
+        data: Request body dict; never modified.
         as_url: Authorization server URL for fetching encryption key.
         http_client: httpx.Client for key fetch.
 
     Returns:
-        A new dict with serialized servers and encrypted credentials.
+        `data` itself if there is nothing to prepare, otherwise a shallow copy
+        with serialized servers and encrypted credentials.
 
     """
-    # Serialize MCP servers, if provided.
+    if not _needs_preparation(data):
+        return data
     servers = data.get("mcp_servers")
-    if servers is not None:
-        data["mcp_servers"] = serialize_mcp_servers(servers)
-
-    # Make a copy to avoid mutation side effects related to SDK retry logic.
-    data = copy.deepcopy(data)
+    data = _with_serialized_servers(data)
     credentials = data.get("credentials")
 
     # If credentials are provided, encrypt them on the client side
@@ -145,6 +140,25 @@ def prepare_mcp_request_sync(
 # ---------------------------------------------------------------------------
 
 
+def _needs_preparation(data: Dict[str, Any]) -> bool:
+    return data.get("mcp_servers") is not None or "credentials" in data
+
+
+def _with_serialized_servers(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow copy of the body with `mcp_servers` in wire format.
+
+    Only top-level keys are replaced, and the helpers below build new server
+    specs rather than editing them, so nested values (e.g. `messages` with
+    base64 images) are shared with the caller's body instead of deep-copied.
+    The caller's body is left as it was for the SDK's retries.
+    """
+    data = dict(data)
+    servers = data.get("mcp_servers")
+    if servers is not None:
+        data["mcp_servers"] = serialize_mcp_servers(servers)
+    return data
+
+
 def _encrypt_credentials(
     credentials: Sequence[CredentialProtocol],
     public_key: Any,
@@ -0,0 +1,19 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Client-side helpers for working with the models endpoint."""
+
+from ._catalog import (
+    CAPABILITIES,
+    ModelCatalog,
+    AsyncModelCatalog,
+)
+
+__all__ = [
+    "CAPABILITIES",
+    "AsyncModelCatalog",
+    "ModelCatalog",
+]
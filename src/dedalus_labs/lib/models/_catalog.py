@@ -0,0 +1,327 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Client-scoped cache of `/v1/models` with capability indexes.
+
+The catalog keeps an immutable snapshot of the model list together with
+indexes by id, provider and capability. Queries run against the snapshot and
+are memoised, so repeated questions such as "tools + vision with at least 128k
+input" are dictionary lookups. When the snapshot is older than `ttl` it is
+refreshed with a conditional request (`If-None-Match`) in the background while
+readers keep using the previous snapshot; only the very first load blocks.
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Set, Dict, List, Tuple, Iterator, Optional, FrozenSet
+from dataclasses import field, dataclass
+
+from ..._exceptions import APIStatusError
+from ...types.model import Model, Capabilities
+from ...types.list_models_response import ListModelsResponse
+
+if TYPE_CHECKING:
+    from ..._response import APIResponse, AsyncAPIResponse
+    from ...resources.models import ModelsResource, AsyncModelsResource
+
+__all__ = [
+    "CAPABILITIES",
+    "AsyncModelCatalog",
+    "ModelCatalog",
+]
+
+CAPABILITIES: Tuple[str, ...] = (
+    "audio",
+    "image_generation",
+    "streaming",
+    "structured_output",
+    "text",
+    "thinking",
+    "tools",
+    "vision",
+)
+"""Boolean `Capabilities` fields that can be used in `find()`."""
+
+_QueryKey = Tuple[FrozenSet[str], Optional[int], Optional[str]]
+
+
+@dataclass
+class _Snapshot:
+    models: Tuple[Model, ...]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    by_id: Dict[str, Model] = field(default_factory=dict)
+    by_provider: Dict[str, Tuple[Model, ...]] = field(default_factory=dict)
+    by_capability: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+    _queries: Dict[_QueryKey, Tuple[Model, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, models: List[Model], *, etag: Optional[str], last_modified: Optional[str]) -> _Snapshot:
+        snapshot = cls(models=tuple(models), etag=etag, last_modified=last_modified, fetched_at=time.monotonic())
+
+        providers: Dict[str, List[Model]] = {}
+        capabilities: Dict[str, Set[str]] = {name: set() for name in CAPABILITIES}
+        for model in models:
+            snapshot.by_id[model.id] = model
+            providers.setdefault(model.provider, []).append(model)
+            caps = model.capabilities
+            if caps is None:
+                continue
+            for name in CAPABILITIES:
+                if getattr(caps, name, None):
+                    capabilities[name].add(model.id)
+
+        snapshot.by_provider = {provider: tuple(group) for provider, group in providers.items()}
+        snapshot.by_capability = {name: frozenset(ids) for name, ids in capabilities.items()}
+        return snapshot
+
+    def touch(self) -> _Snapshot:
+        return _Snapshot(
+            models=self.models,
+            etag=self.etag,
+            last_modified=self.last_modified,
+            fetched_at=time.monotonic(),
+            by_id=self.by_id,
+            by_provider=self.by_provider,
+            by_capability=self.by_capability,
+            _queries=self._queries,
+        )
+
+    def find(
+        self, capabilities: Tuple[str, ...], min_input_tokens: Optional[int], provider: Optional[str]
+    ) -> Tuple[Model, ...]:
+        key: _QueryKey = (frozenset(capabilities), min_input_tokens, provider)
+        cached = self._queries.get(key)
+        if cached is not None:
+            return cached
+
+        for name in capabilities:
+            if name not in self.by_capability:
+                raise ValueError(f"Unknown capability {name!r}; expected one of {', '.join(CAPABILITIES)}")
+
+        candidates = self.by_provider.get(provider, ()) if provider is not None else self.models
+        result = tuple(
+            model
+            for model in candidates
+            if all(model.id in self.by_capability[name] for name in capabilities)
+            and (min_input_tokens is None or _input_limit(model.capabilities) >= min_input_tokens)
+        )
+        self._queries[key] = result
+        return result
+
+
+def _input_limit(capabilities: Optional[Capabilities]) -> int:
+    if capabilities is None or capabilities.input_token_limit is None:
+        return 0
+    return capabilities.input_token_limit
+
+
+def _conditional_headers(snapshot: Optional[_Snapshot]) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    if snapshot is not None and snapshot.etag:
+        headers["If-None-Match"] = snapshot.etag
+    if snapshot is not None and snapshot.last_modified:
+        headers["If-Modified-Since"] = snapshot.last_modified
+    return headers
+
+
+def _is_not_modified(err: APIStatusError, snapshot: Optional[_Snapshot]) -> bool:
+    return err.status_code == 304 and snapshot is not None
+
+
+class _CatalogQueries:
+    _snapshot: Optional[_Snapshot]
+    _ttl: float
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._snapshot.etag if self._snapshot is not None else None
+
+    @property
+    def is_stale(self) -> bool:
+        snapshot = self._snapshot
+        return snapshot is None or time.monotonic() - snapshot.fetched_at >= self._ttl
+
+    def _from_raw(
+        self, raw: APIResponse[ListModelsResponse] | AsyncAPIResponse[ListModelsResponse], parsed: ListModelsResponse
+    ) -> _Snapshot:
+        return _Snapshot.build(
+            parsed.data,
+            etag=raw.headers.get("etag"),
+            last_modified=raw.headers.get("last-modified"),
+        )
+
+
+class ModelCatalog(_CatalogQueries):
+    """Cached, indexed view over `client.models.list()`.
+
+    ```py
+    catalog = client.models.catalog
+    catalog.get("openai/gpt-4o")
+    catalog.by_provider("anthropic")
+    catalog.find("tools", "vision", min_input_tokens=128_000)
+    ```
+
+    Args:
+        models: The `ModelsResource` to load from.
+        ttl: Seconds before the cached list is considered stale.
+        background_refresh: Refresh stale data on a background thread instead of
+            blocking the caller. The first load always blocks.
+    """
+
+    def __init__(self, models: ModelsResource, *, ttl: float = 300.0, background_refresh: bool = True) -> None:
+        self._models = models
+        self._ttl = ttl
+        self._background_refresh = background_refresh
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._refreshing: Optional[threading.Thread] = None
+
+    def refresh(self) -> bool:
+        """Fetch the model list now, returning `True` if it changed."""
+        with self._lock:
+            current = self._snapshot
+            try:
+                raw = self._models.with_raw_response.list(extra_headers=_conditional_headers(current))
+            except APIStatusError as err:
+                if not _is_not_modified(err, current):
+                    raise
+                assert current is not None
+                self._snapshot = current.touch()
+                return False
+
+            self._snapshot = self._from_raw(raw, raw.parse())
+            return True
+
+    def get(self, model_id: str) -> Optional[Model]:
+        return self._current().by_id.get(model_id)
+
+    def all(self) -> Tuple[Model, ...]:
+        return self._current().models
+
+    def __getitem__(self, model_id: str) -> Model:
+        return self._current().by_id[model_id]
+
+    def __contains__(self, model_id: object) -> bool:
+        return model_id in self._current().by_id
+
+    def __iter__(self) -> Iterator[Model]:
+        return iter(self._current().models)
+
+    def __len__(self) -> int:
+        return len(self._current().models)
+
+    def by_provider(self, provider: str) -> Tuple[Model, ...]:
+        return self._current().by_provider.get(provider, ())
+
+    def find(
+        self, *capabilities: str, min_input_tokens: Optional[int] = None, provider: Optional[str] = None
+    ) -> Tuple[Model, ...]:
+        """Models supporting every given capability, e.g. `find("tools", "vision", min_input_tokens=128_000)`.
+
+        Results are memoised per snapshot.
+        """
+        return self._current().find(capabilities, min_input_tokens, provider)
+
+    def _current(self) -> _Snapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.refresh()
+            assert self._snapshot is not None
+            return self._snapshot
+
+        if self.is_stale:
+            if not self._background_refresh:
+                self.refresh()
+                assert self._snapshot is not None
+                return self._snapshot
+            self._start_background_refresh()
+        return snapshot
+
+    def _start_background_refresh(self) -> None:
+        if self._refreshing is not None and self._refreshing.is_alive():
+            return
+        thread = threading.Thread(target=self._refresh_quietly, name="dedalus-model-catalog", daemon=True)
+        self._refreshing = thread
+        thread.start()
+
+    def _refresh_quietly(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            # keep serving the previous snapshot; the next stale read retries
+            pass
+
+
+class AsyncModelCatalog(_CatalogQueries):
+    """Async counterpart of `ModelCatalog`; stale data is refreshed in an `asyncio` task."""
+
+    def __init__(self, models: AsyncModelsResource, *, ttl: float = 300.0, background_refresh: bool = True) -> None:
+        self._models = models
+        self._ttl = ttl
+        self._background_refresh = background_refresh
+        self._snapshot = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._refreshing: Optional[asyncio.Task[bool]] = None
+
+    async def refresh(self) -> bool:
+        """Fetch the model list now, returning `True` if it changed."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            current = self._snapshot
+            try:
+                raw = await self._models.with_raw_response.list(extra_headers=_conditional_headers(current))
+            except APIStatusError as err:
+                if not _is_not_modified(err, current):
+                    raise
+                assert current is not None
+                self._snapshot = current.touch()
+                return False
+
+            self._snapshot = self._from_raw(raw, await raw.parse())
+            return True
+
+    async def get(self, model_id: str) -> Optional[Model]:
+        return (await self._current()).by_id.get(model_id)
+
+    async def all(self) -> Tuple[Model, ...]:
+        return (await self._current()).models
+
+    async def by_provider(self, provider: str) -> Tuple[Model, ...]:
+        return (await self._current()).by_provider.get(provider, ())
+
+    async def find(
+        self, *capabilities: str, min_input_tokens: Optional[int] = None, provider: Optional[str] = None
+    ) -> Tuple[Model, ...]:
+        """Models supporting every given capability, e.g. `await find("tools", "vision", min_input_tokens=128_000)`.
+
+        Results are memoised per snapshot.
+        """
+        return (await self._current()).find(capabilities, min_input_tokens, provider)
+
+    async def _current(self) -> _Snapshot:
+        snapshot = self._snapshot
+        if snapshot is None or (self.is_stale and not self._background_refresh):
+            await self.refresh()
+            assert self._snapshot is not None
+            return self._snapshot
+
+        if self.is_stale and (self._refreshing is None or self._refreshing.done()):
+            self._refreshing = asyncio.get_running_loop().create_task(self.refresh())
+            self._refreshing.add_done_callback(_discard_result)
+        return snapshot
+
+
+def _discard_result(task: asyncio.Task[bool]) -> None:
+    # retrieve the exception so a failed background refresh isn't reported as unhandled
+    if not task.cancelled():
+        task.exception()
@@ -10,6 +10,35 @@ from __future__ import annotations
 
 from ..utils._schemas import to_schema
 from .core import DedalusRunner, MCPServersInput
+from .batch import BatchRun, BatchItem, BatchInput, BatchStats, AsyncBatchRun
+from .checkpoint import (
+    RunState,
+    RunJournal,
+    CheckpointStore,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+    MemoryCheckpointStore,
+)
+from .events import (
+    RunEvent,
+    FinalEvent,
+    StepEndEvent,
+    StepStartEvent,
+    ToolResultEvent,
+    ContentDeltaEvent,
+    ToolCallReadyEvent,
+)
+from .router import ModelHealth, ModelRouter
+from .metrics import RunMetrics, ToolTiming, StepMetrics
+from .context import (
+    ContextWindow,
+    KeepLastTokens,
+    ContextStrategy,
+    SummarizeOldTurns,
+    DropStaleToolOutputs,
+    estimate_tokens,
+)
+from .tool_cache import ToolCache, ToolCacheStats, cached_tool
 from .types import (
     JsonValue,
     Message,
@@ -25,6 +54,38 @@ from .types import (
 __all__ = [
     "DedalusRunner",
     "MCPServersInput",
+    "AsyncBatchRun",
+    "BatchInput",
+    "BatchItem",
+    "BatchRun",
+    "BatchStats",
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "MemoryCheckpointStore",
+    "RunJournal",
+    "RunState",
+    "SQLiteCheckpointStore",
+    "ContentDeltaEvent",
+    "FinalEvent",
+    "RunEvent",
+    "StepEndEvent",
+    "StepStartEvent",
+    "ToolCallReadyEvent",
+    "ToolResultEvent",
+    "ModelHealth",
+    "ModelRouter",
+    "RunMetrics",
+    "StepMetrics",
+    "ToolTiming",
+    "ContextStrategy",
+    "ContextWindow",
+    "DropStaleToolOutputs",
+    "KeepLastTokens",
+    "SummarizeOldTurns",
+    "estimate_tokens",
+    "ToolCache",
+    "ToolCacheStats",
+    "cached_tool",
     "JsonValue",
     "Message",
     "PolicyContext",
@@ -0,0 +1,42 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Helpers for tool calls accumulated from streamed deltas."""
+
+from __future__ import annotations
+
+import json
+from typing import Container
+
+from .types import ToolCall
+
+__all__ = ["ready_tool_calls"]
+
+
+def ready_tool_calls(acc: list[ToolCall], started: Container[int], local: Container[str]) -> list[int]:
+    """Indices of local tool calls in `acc` whose arguments are complete but which haven't started.
+
+    A call is complete once a later tool call index has appeared in the stream, or
+    as soon as its arguments parse as a JSON object.
+    """
+    ready: list[int] = []
+    last = len(acc) - 1
+    for index, tc in enumerate(acc):
+        if index in started or not tc["id"] or tc["function"]["name"] not in local:
+            continue
+        if index < last or _is_complete_json_object(tc["function"]["arguments"]):
+            ready.append(index)
+    return ready
+
+
+def _is_complete_json_object(arguments: str) -> bool:
+    # cheap pre-check so we don't re-parse the buffer on every delta
+    if not arguments.rstrip().endswith("}"):
+        return False
+    try:
+        return isinstance(json.loads(arguments), dict)
+    except json.JSONDecodeError:
+        return False
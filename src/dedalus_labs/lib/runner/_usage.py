@@ -0,0 +1,35 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Token usage bookkeeping shared by the runner, its event stream and checkpoints."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+__all__ = ["merge_usage", "response_usage"]
+
+
+def merge_usage(totals: Dict[str, int], usage: Optional[Dict[str, int]]) -> None:
+    """Add each count in `usage` to `totals`, in place."""
+    for key, value in (usage or {}).items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def response_usage(response: Any) -> Dict[str, int]:
+    """Token counts from `response.usage`, if the server reported any."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return {}
+    out: Dict[str, int] = {}
+    for key in ("prompt_tokens", "completion_tokens", "total_tokens"):
+        value = getattr(usage, key, None)
+        if isinstance(value, int):
+            out[key] = value
+    cached = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None)
+    if isinstance(cached, int):
+        out["cached_tokens"] = cached
+    return out
@@ -0,0 +1,232 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Run many independent conversations through one `DedalusRunner`.
+
+Inputs are pulled lazily and at most `max_concurrency` runs are in flight, all
+sharing the runner's client (and so its connection pool) and tool schemas.
+Results are yielded in completion order; a failing run is reported, not raised.
+With a `checkpoint` file every finished run is appended as a JSONL line, and
+re-running the same batch skips inputs already recorded as `ok`.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Union, Mapping, Iterable, Iterator, Optional, AsyncIterator
+from dataclasses import field, dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from .types import Message
+from ..._utils import asyncify
+from ..utils._manifest import Manifest, request_id, latency_percentile
+
+if TYPE_CHECKING:
+    from .core import DedalusRunner, _RunResult
+
+__all__ = [
+    "AsyncBatchRun",
+    "BatchInput",
+    "BatchItem",
+    "BatchRun",
+    "BatchStats",
+]
+
+BatchInput = Union[str, List[Message], Mapping[str, Any]]
+"""A prompt, a message list, or a mapping of `run()` keyword arguments (plus an optional `id`)."""
+
+
+@dataclass
+class BatchItem:
+    """Outcome of one run in a batch."""
+
+    id: str
+    index: int
+    result: Optional[_RunResult] = None
+    error: Optional[BaseException] = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchStats:
+    """Aggregate results of a `run_many` / `arun_many` batch, updated as runs finish."""
+
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    """Inputs already marked as done in the checkpoint."""
+    steps: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cached_tokens: int = 0
+    """Prompt tokens served from the provider's prompt cache."""
+    elapsed: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    """Per-run latency in seconds, in completion order."""
+
+    @property
+    def runs_per_second(self) -> float:
+        return (self.succeeded + self.failed) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    @property
+    def mean_steps(self) -> float:
+        return self.steps / self.succeeded if self.succeeded else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        return latency_percentile(self.latencies, percentile)
+
+    def _record(self, item: BatchItem) -> None:
+        if item.result is None:
+            self.failed += 1
+            return
+        self.succeeded += 1
+        self.latencies.append(item.latency)
+        self.steps += item.result.steps_used
+        usage = item.result.usage
+        self.prompt_tokens += usage.get("prompt_tokens", 0)
+        self.completion_tokens += usage.get("completion_tokens", 0)
+        self.total_tokens += usage.get("total_tokens", 0)
+        self.cached_tokens += usage.get("cached_tokens", 0)
+
+
+class _Batch:
+    def __init__(
+        self,
+        runner: DedalusRunner,
+        inputs: Iterable[BatchInput],
+        run_kwargs: Dict[str, Any],
+        *,
+        max_concurrency: int,
+        checkpoint: Union[str, os.PathLike[str], None],
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if run_kwargs.get("stream"):
+            raise ValueError("run_many does not support stream=True")
+
+        self.stats = BatchStats()
+        self._runner = runner
+        self._run_kwargs = run_kwargs
+        self._max_concurrency = max_concurrency
+        self._checkpoint = Manifest(checkpoint) if checkpoint is not None else None
+        self._done = self._checkpoint.finished() if self._checkpoint is not None else set()
+        self._pending = self._requests(inputs)
+        self._started = 0.0
+
+    def _requests(self, inputs: Iterable[BatchInput]) -> Iterator[tuple[int, str, Dict[str, Any]]]:
+        for index, item in enumerate(inputs):
+            request = dict(item) if isinstance(item, Mapping) else {"input": item}
+            explicit_id = request.pop("id", None)
+            request = {**self._run_kwargs, **request}
+            # hash the merged arguments, so a different model or tools isn't "already done"
+            item_id = str(explicit_id or request_id(request))
+            if item_id in self._done:
+                self.stats.skipped += 1
+                continue
+            self.stats.submitted += 1
+            yield index, item_id, request
+
+    def _finish(self, item: BatchItem) -> BatchItem:
+        self.stats._record(item)
+        self.stats.elapsed = time.monotonic() - self._started
+        if self._checkpoint is not None:
+            self._checkpoint.record(_checkpoint_entry(item))
+        return item
+
+
+class BatchRun(_Batch):
+    """Iterator over `BatchItem`s from `DedalusRunner.run_many`, in completion order.
+
+    Runs execute on a thread pool of `max_concurrency` workers; `stats` is updated
+    as each one finishes.
+    """
+
+    def __iter__(self) -> Iterator[BatchItem]:
+        self._started = time.monotonic()
+        in_flight: Dict[Future[Any], tuple[int, str, float]] = {}
+
+        with ThreadPoolExecutor(self._max_concurrency, thread_name_prefix="dedalus-runner-batch") as pool:
+            try:
+                while True:
+                    for index, item_id, request in self._pending:
+                        in_flight[pool.submit(self._runner.run, **request)] = (index, item_id, time.monotonic())
+                        if len(in_flight) >= self._max_concurrency:
+                            break
+                    if not in_flight:
+                        break
+
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        index, item_id, started = in_flight.pop(future)
+                        item = BatchItem(id=item_id, index=index, latency=time.monotonic() - started)
+                        try:
+                            item.result = future.result()
+                        except Exception as exc:
+                            item.error = exc
+                        yield self._finish(item)
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+
+class AsyncBatchRun(_Batch):
+    """Async iterator over `BatchItem`s from `DedalusRunner.arun_many`, in completion order."""
+
+    async def __aiter__(self) -> AsyncIterator[BatchItem]:
+        self._started = time.monotonic()
+        finished: asyncio.Queue[Optional[BatchItem]] = asyncio.Queue()
+
+        async def worker() -> None:
+            for index, item_id, request in self._pending:
+                started = time.monotonic()
+                item = BatchItem(id=item_id, index=index)
+                try:
+                    item.result = await self._runner.run(**request)
+                except Exception as exc:
+                    item.error = exc
+                item.latency = time.monotonic() - started
+                await finished.put(item)
+            await finished.put(None)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self._max_concurrency)]
+        try:
+            remaining = len(workers)
+            while remaining:
+                item = await finished.get()
+                if item is None:
+                    remaining -= 1
+                    continue
+                # appending to the checkpoint is blocking file I/O
+                yield await asyncify(self._finish)(item)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _checkpoint_entry(item: BatchItem) -> Dict[str, Any]:
+    if item.result is None:
+        return {"id": item.id, "status": "error", "error": f"{type(item.error).__name__}: {item.error}"}
+    return {
+        "id": item.id,
+        "status": "ok",
+        "latency": round(item.latency, 4),
+        "steps": item.result.steps_used,
+        "usage": item.result.usage,
+        "output": item.result.final_output,
+    }
@@ -0,0 +1,245 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Append-only journals that let `DedalusRunner` resume an interrupted run.
+
+Each run writes small JSON records as it goes: the starting conversation, every
+assistant turn, and every finished tool call. Replaying the journal rebuilds a
+`RunState`, so a restarted run continues after the last completed step and only
+executes the tool calls that never finished:
+
+```py
+store = SQLiteCheckpointStore("runs.db")
+result = runner.run(input=..., model=..., tools=[...], checkpoint=store, run_id="ticket-42")
+```
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Union, Optional
+from pathlib import Path
+from dataclasses import field, dataclass
+
+from .types import Message, ToolCall, ToolResult
+from ._usage import merge_usage
+
+__all__ = [
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "MemoryCheckpointStore",
+    "RunJournal",
+    "RunState",
+    "SQLiteCheckpointStore",
+]
+
+Record = Dict[str, Any]
+
+
+class CheckpointStore(ABC):
+    """Storage backend for run journals, keyed by run id."""
+
+    @abstractmethod
+    def append(self, run_id: str, record: Record) -> None:
+        """Durably add `record` to the end of the journal for `run_id`."""
+
+    @abstractmethod
+    def load(self, run_id: str) -> List[Record]:
+        """All records for `run_id` in the order they were appended."""
+
+    @abstractmethod
+    def clear(self, run_id: str) -> None:
+        """Forget the journal for `run_id`; a no-op if there is none."""
+
+    def state(self, run_id: str) -> Optional[RunState]:
+        """Replay the journal for `run_id`, or `None` if nothing was recorded."""
+        records = self.load(run_id)
+        return RunState.replay(run_id, records) if records else None
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Keeps journals in process memory; useful for tests and retries within one process."""
+
+    def __init__(self) -> None:
+        self._journals: Dict[str, List[Record]] = {}
+        self._lock = threading.Lock()
+
+    def append(self, run_id: str, record: Record) -> None:
+        # round-trip so stored records don't alias live message dicts
+        encoded = json.loads(_dumps(record))
+        with self._lock:
+            self._journals.setdefault(run_id, []).append(encoded)
+
+    def load(self, run_id: str) -> List[Record]:
+        with self._lock:
+            return list(self._journals.get(run_id, ()))
+
+    def clear(self, run_id: str) -> None:
+        with self._lock:
+            self._journals.pop(run_id, None)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """One JSONL file per run in `directory`.
+
+    Args:
+        fsync: Also `fsync` after every record, trading throughput for durability
+            across power loss (a flush is always done).
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike[str]], *, fsync: bool = False) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._fsync = fsync
+
+    def _path(self, run_id: str) -> Path:
+        return self._directory / f"{_safe_name(run_id)}.jsonl"
+
+    def append(self, run_id: str, record: Record) -> None:
+        with open(self._path(run_id), "a", encoding="utf-8") as f:
+            f.write(_dumps(record) + "\n")
+            f.flush()
+            if self._fsync:
+                os.fsync(f.fileno())
+
+    def load(self, run_id: str) -> List[Record]:
+        path = self._path(run_id)
+        if not path.exists():
+            return []
+        records: List[Record] = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # a torn final line from an interrupted write
+                    break
+        return records
+
+    def clear(self, run_id: str) -> None:
+        try:
+            self._path(run_id).unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Journals in a single SQLite database, safe to share between threads."""
+
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS runner_journal ("
+                " run_id TEXT NOT NULL, seq INTEGER PRIMARY KEY AUTOINCREMENT, record TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS runner_journal_run ON runner_journal (run_id, seq)")
+
+    def append(self, run_id: str, record: Record) -> None:
+        with self._lock:
+            self._conn.execute("INSERT INTO runner_journal (run_id, record) VALUES (?, ?)", (run_id, _dumps(record)))
+
+    def load(self, run_id: str) -> List[Record]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT record FROM runner_journal WHERE run_id = ? ORDER BY seq", (run_id,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def clear(self, run_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM runner_journal WHERE run_id = ?", (run_id,))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@dataclass
+class RunState:
+    """Conversation state rebuilt from a run journal."""
+
+    run_id: str
+    steps: int = 0
+    messages: List[Message] = field(default_factory=list)
+    tool_results: List[ToolResult] = field(default_factory=list)
+    tools_called: List[str] = field(default_factory=list)
+    usage: Dict[str, int] = field(default_factory=dict)
+    final_output: Optional[str] = None
+    """Set once the run has finished."""
+    pending_tool_calls: List[ToolCall] = field(default_factory=list)
+    """Tool calls from the last assistant turn that have no recorded result yet."""
+
+    @property
+    def done(self) -> bool:
+        return self.final_output is not None
+
+    @classmethod
+    def replay(cls, run_id: str, records: List[Record]) -> RunState:
+        state = cls(run_id=run_id)
+        for record in records:
+            kind = record.get("kind")
+            if kind == "start":
+                state.messages = list(record["messages"])
+            elif kind == "assistant":
+                state.steps = record["step"]
+                state.messages.append(record["message"])
+                state.pending_tool_calls = list(record["message"].get("tool_calls") or [])
+                merge_usage(state.usage, record.get("usage"))
+            elif kind == "tool":
+                state.messages.append(record["message"])
+                state.tool_results.append(record["result"])
+                if "error" not in record["result"]:
+                    state.tools_called.append(record["result"]["name"])
+                call_id = record["message"].get("tool_call_id")
+                state.pending_tool_calls = [tc for tc in state.pending_tool_calls if tc.get("id") != call_id]
+            elif kind == "final":
+                state.steps = record["step"]
+                if record.get("message"):
+                    state.messages.append(record["message"])
+                state.final_output = record["output"]
+                state.pending_tool_calls = []
+                merge_usage(state.usage, record.get("usage"))
+        return state
+
+
+class RunJournal:
+    """Writes the records for one run; used internally by `DedalusRunner`."""
+
+    def __init__(self, store: CheckpointStore, run_id: str) -> None:
+        self.store = store
+        self.run_id = run_id
+
+    def begin(self, messages: List[Message]) -> Optional[RunState]:
+        """Return the recorded state if this run was started before, else record its start."""
+        state = self.store.state(self.run_id)
+        if state is None:
+            self.store.append(self.run_id, {"kind": "start", "messages": messages})
+        return state
+
+    def assistant(self, step: int, message: Message, usage: Optional[Dict[str, int]] = None) -> None:
+        self.store.append(self.run_id, {"kind": "assistant", "step": step, "message": message, "usage": usage or {}})
+
+    def tool(self, step: int, message: Message, result: ToolResult) -> None:
+        self.store.append(self.run_id, {"kind": "tool", "step": step, "message": message, "result": result})
+
+    def final(self, step: int, output: str, message: Optional[Message], usage: Optional[Dict[str, int]] = None) -> None:
+        self.store.append(
+            self.run_id, {"kind": "final", "step": step, "output": output, "message": message, "usage": usage or {}}
+        )
+
+
+def _dumps(record: Record) -> str:
+    return json.dumps(record, separators=(",", ":"), default=str)
+
+
+def _safe_name(run_id: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in run_id)
@@ -0,0 +1,317 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Token-aware context window management for `DedalusRunner`.
+
+A `ContextWindow` is applied to the conversation before every model call. When
+the locally estimated size of the history exceeds the model's input budget, its
+strategies run in order until the history fits:
+
+```py
+window = ContextWindow([DropStaleToolOutputs(), SummarizeOldTurns("openai/gpt-4o-mini"), KeepLastTokens()])
+runner.run(input=..., model="openai/gpt-4o", context=window)
+```
+
+The budget is `max_input_tokens` if given, otherwise the model's
+`capabilities.input_token_limit` from `client.models.catalog`, minus
+`reserve_tokens` for tool schemas and the reply. Assistant tool calls are always
+kept together with their tool results so the trimmed history stays valid.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, List, Callable, Optional, Sequence
+from typing_extensions import override
+
+from .types import Message
+from ..._exceptions import APIError
+
+if TYPE_CHECKING:
+    from ..._client import Dedalus, AsyncDedalus
+
+__all__ = [
+    "ContextStrategy",
+    "ContextWindow",
+    "DropStaleToolOutputs",
+    "KeepLastTokens",
+    "SummarizeOldTurns",
+    "estimate_tokens",
+]
+
+TokenCounter = Callable[[Message], int]
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+_CHARS_PER_TOKEN = 4
+_MESSAGE_OVERHEAD = 4
+
+
+def estimate_tokens(message: Message) -> int:
+    """Rough local token estimate for a single message (~4 characters per token)."""
+    chars = 0
+    content = message.get("content")
+    if isinstance(content, str):
+        chars += len(content)
+    elif isinstance(content, list):
+        for part in content:
+            if isinstance(part, dict):
+                chars += len(str(part.get("text", "")))
+    for tc in message.get("tool_calls") or []:
+        if isinstance(tc, dict):
+            fn = tc.get("function") or {}
+            chars += len(str(fn.get("name", ""))) + len(str(fn.get("arguments", "")))
+    return _MESSAGE_OVERHEAD + (chars + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+class ContextStrategy(ABC):
+    """Base class for strategies that shrink a conversation to fit `budget` tokens.
+
+    Strategies may return a history that is still over budget; the window then
+    moves on to the next strategy. Override `apply_async` as well when the
+    strategy makes API calls.
+    """
+
+    @abstractmethod
+    def apply(
+        self, messages: List[Message], budget: int, count: TokenCounter, client: Dedalus | AsyncDedalus
+    ) -> List[Message]: ...
+
+    async def apply_async(
+        self, messages: List[Message], budget: int, count: TokenCounter, client: Dedalus | AsyncDedalus
+    ) -> List[Message]:
+        return self.apply(messages, budget, count, client)
+
+
+class DropStaleToolOutputs(ContextStrategy):
+    """Replace the content of all but the last `keep_last` tool results with a placeholder."""
+
+    def __init__(self, keep_last: int = 2, placeholder: str = "[tool output omitted]"):
+        self.keep_last = keep_last
+        self.placeholder = placeholder
+
+    @override
+    def apply(
+        self, messages: List[Message], budget: int, count: TokenCounter, client: Dedalus | AsyncDedalus
+    ) -> List[Message]:
+        tool_positions = [i for i, msg in enumerate(messages) if msg.get("role") == "tool"]
+        stale = tool_positions[: max(0, len(tool_positions) - self.keep_last)]
+        if not stale:
+            return messages
+
+        out = list(messages)
+        for i in stale:
+            out[i] = {**out[i], "content": self.placeholder}
+        return out
+
+
+class KeepLastTokens(ContextStrategy):
+    """Keep system messages plus the most recent turns that fit in the budget.
+
+    The newest turn is always kept, even if it alone exceeds the budget.
+    """
+
+    @override
+    def apply(
+        self, messages: List[Message], budget: int, count: TokenCounter, client: Dedalus | AsyncDedalus
+    ) -> List[Message]:
+        pinned, turns = _split(messages)
+        recent, _ = _take_recent(turns, budget - sum(count(m) for m in pinned), count)
+        return pinned + [m for turn in recent for m in turn]
+
+
+class SummarizeOldTurns(ContextStrategy):
+    """Replace older turns with a summary written by a (cheaper) model.
+
+    The most recent turns fitting in `keep_recent` of the budget are kept verbatim;
+    everything older, including earlier summaries, is folded into one summary message.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        *,
+        keep_recent: float = 0.5,
+        max_summary_tokens: int = 512,
+        instructions: str = (
+            "Summarize the conversation below for an assistant that will continue it. "
+            "Keep facts, decisions, open questions and tool results that may still matter. Be concise."
+        ),
+    ):
+        self.model = model
+        self.keep_recent = keep_recent
+        self.max_summary_tokens = max_summary_tokens
+        self.instructions = instructions
+
+    @override
+    def apply(
+        self, messages: List[Message], budget: int, count: TokenCounter, client: Dedalus | AsyncDedalus
+    ) -> List[Message]:
+        pinned, old, recent = self._partition(messages, budget, count)
+        if not old:
+            return messages
+        response: Any = client.chat.completions.create(**self._request(old))
+        return pinned + [_summary_message(response)] + recent
+
+    @override
+    async def apply_async(
+        self, messages: List[Message], budget: int, count: TokenCounter, client: Dedalus | AsyncDedalus
+    ) -> List[Message]:
+        pinned, old, recent = self._partition(messages, budget, count)
+        if not old:
+            return messages
+        response: Any = await client.chat.completions.create(**self._request(old))  # type: ignore[misc]
+        return pinned + [_summary_message(response)] + recent
+
+    def _partition(
+        self, messages: List[Message], budget: int, count: TokenCounter
+    ) -> tuple[List[Message], List[Message], List[Message]]:
+        pinned, turns = _split(messages)
+        recent, old = _take_recent(turns, int(budget * self.keep_recent), count)
+        return pinned, [m for turn in old for m in turn], [m for turn in recent for m in turn]
+
+    def _request(self, old: List[Message]) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.instructions},
+                {"role": "user", "content": _transcript(old)},
+            ],
+            "max_tokens": self.max_summary_tokens,
+        }
+
+
+class ContextWindow:
+    """Keeps the runner's conversation within the model's input token budget.
+
+    Args:
+        strategies: Applied in order while the history is over budget. Defaults to
+            `[DropStaleToolOutputs(), KeepLastTokens()]`.
+        max_input_tokens: Fixed budget; when omitted it is looked up per model from
+            `client.models.catalog`. Models without a known limit are left untouched.
+        reserve_tokens: Subtracted from the budget for tool schemas and the reply.
+        token_counter: Per-message token estimator, `estimate_tokens` by default.
+    """
+
+    def __init__(
+        self,
+        strategies: Optional[Sequence[ContextStrategy]] = None,
+        *,
+        max_input_tokens: Optional[int] = None,
+        reserve_tokens: int = 4096,
+        token_counter: TokenCounter = estimate_tokens,
+    ):
+        self.strategies = list(strategies) if strategies is not None else [DropStaleToolOutputs(), KeepLastTokens()]
+        self.max_input_tokens = max_input_tokens
+        self.reserve_tokens = reserve_tokens
+        self.count = token_counter
+
+    def total(self, messages: Sequence[Message]) -> int:
+        return sum(self.count(m) for m in messages)
+
+    def budget(self, model: str, client: Dedalus) -> Optional[int]:
+        if self.max_input_tokens is not None:
+            return self._reserve(self.max_input_tokens)
+        try:
+            info = client.models.catalog.get(model)
+        except APIError:
+            return None
+        return self._reserve(_input_token_limit(info))
+
+    async def budget_async(self, model: str, client: AsyncDedalus) -> Optional[int]:
+        if self.max_input_tokens is not None:
+            return self._reserve(self.max_input_tokens)
+        try:
+            info = await client.models.catalog.get(model)
+        except APIError:
+            return None
+        return self._reserve(_input_token_limit(info))
+
+    def fit(self, messages: List[Message], model: str, client: Dedalus) -> List[Message]:
+        """Return `messages`, shrunk by the strategies if they exceed the budget for `model`."""
+        budget = self.budget(model, client)
+        if budget is None:
+            return messages
+        for strategy in self.strategies:
+            if self.total(messages) <= budget:
+                break
+            messages = strategy.apply(messages, budget, self.count, client)
+        return messages
+
+    async def fit_async(self, messages: List[Message], model: str, client: AsyncDedalus) -> List[Message]:
+        budget = await self.budget_async(model, client)
+        if budget is None:
+            return messages
+        for strategy in self.strategies:
+            if self.total(messages) <= budget:
+                break
+            messages = await strategy.apply_async(messages, budget, self.count, client)
+        return messages
+
+    def _reserve(self, limit: Optional[int]) -> Optional[int]:
+        if limit is None:
+            return None
+        return max(1, limit - self.reserve_tokens)
+
+
+def _input_token_limit(info: Any) -> Optional[int]:
+    capabilities = getattr(info, "capabilities", None)
+    return getattr(capabilities, "input_token_limit", None)
+
+
+def _split(messages: List[Message]) -> tuple[List[Message], List[List[Message]]]:
+    """Separate pinned system messages from turns; a turn is a message plus any tool results answering it."""
+    pinned: List[Message] = []
+    turns: List[List[Message]] = []
+    for msg in messages:
+        role = msg.get("role")
+        if role == "system" and not _is_summary(msg):
+            pinned.append(msg)
+        elif role == "tool" and turns and turns[-1][0].get("tool_calls"):
+            turns[-1].append(msg)
+        else:
+            turns.append([msg])
+    return pinned, turns
+
+
+def _take_recent(
+    turns: List[List[Message]], budget: int, count: TokenCounter
+) -> tuple[List[List[Message]], List[List[Message]]]:
+    """Split `turns` into (recent, older) where recent is the newest suffix fitting in `budget` (at least one turn)."""
+    used = 0
+    start = len(turns)
+    while start > 0:
+        cost = sum(count(m) for m in turns[start - 1])
+        if start < len(turns) and used + cost > budget:
+            break
+        used += cost
+        start -= 1
+    return turns[start:], turns[:start]
+
+
+def _is_summary(msg: Message) -> bool:
+    content = msg.get("content")
+    return isinstance(content, str) and content.startswith(SUMMARY_PREFIX)
+
+
+def _transcript(messages: List[Message]) -> str:
+    lines: List[str] = []
+    for msg in messages:
+        role = msg.get("role", "?")
+        content = msg.get("content")
+        if isinstance(content, str) and content:
+            lines.append(f"{role}: {content}")
+        for tc in msg.get("tool_calls") or []:
+            if isinstance(tc, dict):
+                fn = tc.get("function") or {}
+                lines.append(f"{role} called {fn.get('name', '?')}({fn.get('arguments', '')})")
+    return "\n".join(lines)
+
+
+def _summary_message(response: Any) -> Message:
+    choices = getattr(response, "choices", None) or []
+    text = (choices[0].message.content if choices else None) or ""
+    return {"role": "system", "content": SUMMARY_PREFIX + text.strip()}
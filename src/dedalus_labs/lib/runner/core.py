@@ -6,9 +6,13 @@
 
 from __future__ import annotations
 
+import os
 import json
+import time
 import asyncio
+import hashlib
 import inspect
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -20,7 +24,12 @@ from typing import (
     AsyncIterator,
     Sequence,
     Union,
+    Iterable,
+    Optional,
+    Container,
 )
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import field, asdict, dataclass
 
 if TYPE_CHECKING:
@@ -29,6 +38,15 @@ if TYPE_CHECKING:
 from ..._client import Dedalus, AsyncDedalus
 
 from .types import Message, ToolCall, JsonValue, ToolResult, PolicyInput, PolicyContext
+from .batch import BatchRun, BatchInput, AsyncBatchRun
+from .events import _EventTimeline
+from .router import ModelRouter
+from .metrics import RunMetrics, ToolTiming, StepMetrics
+from .context import ContextWindow
+from ._usage import merge_usage, response_usage
+from ._tool_calls import ready_tool_calls
+from .checkpoint import RunState, RunJournal, CheckpointStore
+from .tool_cache import ToolCacheStats, tool_cache_of
 from ...types.shared import MCPToolResult
 from ..mcp import serialize_mcp_servers, MCPServerProtocol
 
@@ -73,8 +91,12 @@ def _extract_mcp_results(response: Any) -> list[MCPToolResult]:
 
 class _ToolHandler(Protocol):
     def schemas(self) -> list[Dict]: ...
-    async def exec(self, name: str, args: Dict[str, JsonValue]) -> JsonValue: ...
-    def exec_sync(self, name: str, args: Dict[str, JsonValue]) -> JsonValue: ...
+    async def exec(
+        self, name: str, args: Dict[str, JsonValue], cache_stats: Dict[str, ToolCacheStats] | None = None
+    ) -> JsonValue: ...
+    def exec_sync(
+        self, name: str, args: Dict[str, JsonValue], cache_stats: Dict[str, ToolCacheStats] | None = None
+    ) -> JsonValue: ...
 
 
 class _FunctionToolHandler:
@@ -82,20 +104,51 @@ class _FunctionToolHandler:
 
     def __init__(self, funcs: list[Callable[..., Any]]):
         self._funcs = {f.__name__: f for f in funcs}
+        self._schemas: list[Dict[str, Any]] | None = None
 
     def schemas(self) -> list[Dict]:
-        """Build OpenAI-compatible function schemas via introspection."""
+        """Build OpenAI-compatible function schemas via introspection (computed once)."""
+        if self._schemas is not None:
+            return self._schemas
         out: list[Dict[str, Any]] = []
         for fn in self._funcs.values():
             try:
                 out.append(to_schema(fn))
             except Exception:
                 continue
+        self._schemas = out
         return out
 
-    async def exec(self, name: str, args: Dict[str, JsonValue]) -> JsonValue:
-        """Execute tool by name with given args (async)."""
+    async def exec(
+        self, name: str, args: Dict[str, JsonValue], cache_stats: Dict[str, ToolCacheStats] | None = None
+    ) -> JsonValue:
+        """Execute tool by name with given args (async).
+
+        Tools wrapped with `cached_tool` are answered from their cache when possible;
+        lookups are counted in `cache_stats` under the tool name.
+        """
+        fn = self._funcs[name]
+        cache = tool_cache_of(fn)
+        if cache is not None:
+            original = fn.__wrapped__  # type: ignore[attr-defined]
+            key = cache.key(name, args, inspect.signature(original))
+            return await cache.acall(key, lambda: self._call(original, args), name=name, run_stats=cache_stats)
+        return await self._call(fn, args)
+
+    def exec_sync(
+        self, name: str, args: Dict[str, JsonValue], cache_stats: Dict[str, ToolCacheStats] | None = None
+    ) -> JsonValue:
+        """Execute tool by name with given args (sync)."""
         fn = self._funcs[name]
+        cache = tool_cache_of(fn)
+        if cache is not None:
+            original = fn.__wrapped__  # type: ignore[attr-defined]
+            key = cache.key(name, args, inspect.signature(original))
+            return cache.call(key, lambda: self._call_sync(original, args), name=name, run_stats=cache_stats)
+        return self._call_sync(fn, args)
+
+    @staticmethod
+    async def _call(fn: Callable[..., Any], args: Dict[str, JsonValue]) -> JsonValue:
         if inspect.iscoroutinefunction(fn):
             return await fn(**args)
         # asyncio.to_thread is Python 3.9+, use run_in_executor for 3.8 compat
@@ -105,9 +158,8 @@ class _FunctionToolHandler:
 
         return await loop.run_in_executor(None, partial(fn, **args))
 
-    def exec_sync(self, name: str, args: Dict[str, JsonValue]) -> JsonValue:
-        """Execute tool by name with given args (sync)."""
-        fn = self._funcs[name]
+    @staticmethod
+    def _call_sync(fn: Callable[..., Any], args: Dict[str, JsonValue]) -> JsonValue:
         if inspect.iscoroutinefunction(fn):
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -118,6 +170,85 @@ class _FunctionToolHandler:
         return fn(**args)
 
 
+def _parse_tool_args(arguments: str) -> Dict[str, JsonValue]:
+    try:
+        return json.loads(arguments)
+    except json.JSONDecodeError:
+        return {}
+
+
+def _has_server_tool_calls(acc: list[ToolCall], local: Container[str]) -> bool:
+    # once the step calls an MCP tool the server may answer it in this same turn,
+    # in which case the runner stops without executing local calls; so don't start any
+    return any(tc["function"]["name"] and tc["function"]["name"] not in local for tc in acc)
+
+
+class _EagerToolCalls:
+    """Starts local tool calls while the model is still streaming later ones."""
+
+    def __init__(self, tool_handler: _ToolHandler):
+        self._handler = tool_handler
+        self._local = getattr(tool_handler, "_funcs", {})
+        self._pending: Dict[int, asyncio.Future[JsonValue]] = {}
+
+    def update(self, acc: list[ToolCall]) -> None:
+        if _has_server_tool_calls(acc, self._local):
+            return
+        for index in ready_tool_calls(acc, self._pending, self._local):
+            fn = acc[index]["function"]
+            self._pending[index] = asyncio.ensure_future(
+                self._handler.exec(fn["name"], _parse_tool_args(fn["arguments"]))
+            )
+
+    def take(self, index: int) -> Optional[asyncio.Future[JsonValue]]:
+        return self._pending.pop(index, None)
+
+    def take_all(self) -> Dict[int, asyncio.Future[JsonValue]]:
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def cancel(self) -> None:
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+
+
+class _EagerToolCallsSync:
+    """Thread-pool counterpart of `_EagerToolCalls` for the sync streaming loop."""
+
+    def __init__(self, tool_handler: _ToolHandler):
+        self._handler = tool_handler
+        self._local = getattr(tool_handler, "_funcs", {})
+        self._pending: Dict[int, Future[JsonValue]] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    def update(self, acc: list[ToolCall]) -> None:
+        if _has_server_tool_calls(acc, self._local):
+            return
+        for index in ready_tool_calls(acc, self._pending, self._local):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="dedalus-runner-tool")
+            fn = acc[index]["function"]
+            self._pending[index] = self._executor.submit(
+                self._handler.exec_sync, fn["name"], _parse_tool_args(fn["arguments"])
+            )
+
+    def take(self, index: int) -> Optional[Future[JsonValue]]:
+        return self._pending.pop(index, None)
+
+    def take_all(self) -> Dict[int, Future[JsonValue]]:
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def cancel(self) -> None:
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
 @dataclass
 class _ModelConfig:
     """Model configuration parameters."""
@@ -136,6 +267,7 @@ class _ModelConfig:
     tool_choice: str | Dict[str, JsonValue] | None = None
     guardrails: list[Dict[str, JsonValue]] | None = None
     handoff_config: Dict[str, JsonValue] | None = None
+    prompt_cache_key: str | None = None
 
 
 @dataclass
@@ -154,6 +286,11 @@ class _ExecutionConfig:
     policy: PolicyInput = None
     available_models: list[str] = field(default_factory=list)
     strict_models: bool = True
+    eager_tools: bool = False
+    events: bool = False
+    context: ContextWindow | None = None
+    router: ModelRouter | None = None
+    journal: RunJournal | None = None
 
 
 @dataclass
@@ -168,12 +305,28 @@ class _RunResult:
     tools_called: list[str] = field(default_factory=list)
     mcp_results: list[MCPToolResult] = field(default_factory=list)
     """MCP tool results from server-side tool calls."""
+    usage: Dict[str, int] = field(default_factory=dict)
+    """Token usage summed over all steps (`prompt_tokens`, `completion_tokens`, `total_tokens`, `cached_tokens`)."""
+    tool_cache: Dict[str, ToolCacheStats] = field(default_factory=dict)
+    """Cache lookups during this run for tools wrapped with `cached_tool`, keyed by tool name."""
+    step_metrics: list[StepMetrics] = field(default_factory=list)
+    """Latency and token usage per model call (steps replayed from a checkpoint are not included)."""
+
+    @property
+    def metrics(self) -> RunMetrics:
+        """Totals over `step_metrics`."""
+        return RunMetrics.from_steps(self.step_metrics)
 
     @property
     def output(self) -> str:
         """Alias for final_output."""
         return self.final_output
 
+    @property
+    def cached_tokens(self) -> int:
+        """Prompt tokens served from the provider's prompt cache, summed over all steps."""
+        return self.usage.get("cached_tokens", 0)
+
     @property
     def content(self) -> str:
         """Alias for final_output."""
@@ -184,12 +337,114 @@ class _RunResult:
         return list(self.messages)
 
 
+def _prompt_cache_key(
+    conversation: list[Message], tool_schemas: list[Dict[str, Any]], mcp_servers: list[Any], model: str
+) -> str:
+    """Stable key for the prefix every step re-sends: leading system messages, tool schemas and model."""
+    instructions: list[Any] = []
+    for msg in conversation:
+        if msg.get("role") not in ("system", "developer"):
+            break
+        instructions.append(msg.get("content"))
+    canonical = json.dumps(
+        {"model": model, "instructions": instructions, "tools": tool_schemas, "mcp_servers": mcp_servers},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return "dedalus-runner-" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+def _route_candidates(model: str | list[str], exec_config: _ExecutionConfig) -> list[str]:
+    requested = [model] if isinstance(model, str) else list(model)
+    return requested + [m for m in exec_config.available_models if m not in requested]
+
+
+def _default_run_id(conversation: list[Message], model_config: _ModelConfig) -> str:
+    canonical = json.dumps(
+        {"model": model_config.model_list or model_config.id, "messages": conversation}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:24]
+
+
+def _result_from_state(state: RunState) -> _RunResult:
+    return _RunResult(
+        final_output=state.final_output or "",
+        tool_results=state.tool_results,
+        steps_used=state.steps,
+        tools_called=state.tools_called,
+        messages=state.messages,
+        usage=state.usage,
+    )
+
+
 class DedalusRunner:
     """Enhanced Dedalus client with tool execution capabilities."""
 
+    _MAX_CACHED_HANDLERS = 32
+
     def __init__(self, client: Dedalus | AsyncDedalus, verbose: bool = False):
         self.client = client
         self.verbose = verbose
+        self._tool_handlers: OrderedDict[tuple[int, ...], _FunctionToolHandler] = OrderedDict()
+        self._tool_handlers_lock = threading.Lock()
+
+    def run_many(
+        self,
+        inputs: Iterable[BatchInput],
+        *,
+        max_concurrency: int = 8,
+        checkpoint: str | os.PathLike[str] | None = None,
+        **run_kwargs: Any,
+    ) -> BatchRun:
+        """Run many independent conversations on a thread pool, yielding `BatchItem`s as they finish.
+
+        ```py
+        batch = runner.run_many(prompts, model="openai/gpt-4o-mini", tools=[lookup], checkpoint="eval.jsonl")
+        for item in batch:
+            print(item.id, item.result.final_output if item.ok else item.error)
+        print(batch.stats.mean_latency, batch.stats.total_tokens)
+        ```
+
+        Args:
+            inputs: Prompts, message lists, or mappings of `run()` keyword arguments. A
+                mapping may carry an `id` used in the checkpoint; otherwise a hash of the
+                input merged with `run_kwargs` is used, so changing e.g. `model` or `tools`
+                runs every input again.
+            max_concurrency: Maximum number of runs in flight.
+            checkpoint: JSONL file recording each finished run; runs recorded as `ok`
+                are skipped when the batch is started again.
+            **run_kwargs: Shared `run()` arguments, overridden per input.
+        """
+        if not isinstance(self.client, Dedalus):
+            raise TypeError("run_many requires a sync Dedalus client; use arun_many with AsyncDedalus")
+        return BatchRun(self, inputs, run_kwargs, max_concurrency=max_concurrency, checkpoint=checkpoint)
+
+    def arun_many(
+        self,
+        inputs: Iterable[BatchInput],
+        *,
+        max_concurrency: int = 8,
+        checkpoint: str | os.PathLike[str] | None = None,
+        **run_kwargs: Any,
+    ) -> AsyncBatchRun:
+        """Async counterpart of `run_many`; iterate the result with `async for`."""
+        if not isinstance(self.client, AsyncDedalus):
+            raise TypeError("arun_many requires an AsyncDedalus client; use run_many with Dedalus")
+        return AsyncBatchRun(self, inputs, run_kwargs, max_concurrency=max_concurrency, checkpoint=checkpoint)
+
+    def _tool_handler_for(self, tools: list[Callable[..., Any]]) -> _FunctionToolHandler:
+        """Reuse handlers (and their schemas) across runs with the same tool functions."""
+        key = tuple(id(fn) for fn in tools)
+        with self._tool_handlers_lock:
+            handler = self._tool_handlers.get(key)
+            if handler is None:
+                handler = self._tool_handlers[key] = _FunctionToolHandler(tools)
+                if len(self._tool_handlers) > self._MAX_CACHED_HANDLERS:
+                    self._tool_handlers.popitem(last=False)
+            else:
+                self._tool_handlers.move_to_end(key)
+            return handler
 
     def run(
         self,
@@ -222,8 +477,43 @@ class DedalusRunner:
         policy: PolicyInput = None,
         available_models: list[str] | None = None,
         strict_models: bool = True,
+        eager_tools: bool = False,
+        events: bool = False,
+        context: ContextWindow | None = None,
+        checkpoint: CheckpointStore | None = None,
+        run_id: str | None = None,
+        prompt_cache_key: str | Literal[False] | None = None,
+        router: ModelRouter | None = None,
     ):
-        """Execute tools with unified async/sync + streaming/non-streaming logic."""
+        """Execute tools with unified async/sync + streaming/non-streaming logic.
+
+        With `stream=True` and `eager_tools=True`, each local tool call starts as soon
+        as its arguments are complete instead of after the whole response has been
+        streamed, so tool latency overlaps with the model generating later calls.
+
+        With `stream=True` and `events=True`, the stream yields typed `RunEvent`s
+        (step boundaries, text deltas, completed tool calls and results, and a final
+        event with usage totals) instead of raw chunks; see `lib.runner.events`.
+
+        `context` keeps the conversation within the model's input token budget before
+        each step; see `ContextWindow`. The returned history is the trimmed one.
+
+        `checkpoint` journals every step and tool result to a `CheckpointStore` under
+        `run_id` (by default a hash of the model and starting conversation). Calling
+        `run()` again with the same store and id resumes after the last completed step
+        without re-running tools that already finished. Not supported with `stream=True`.
+
+        Every step re-sends the same system prompt and tool schemas, so by default the
+        runner sends a `prompt_cache_key` derived from them and the model, letting the
+        provider reuse its cached prefix across steps and runs. Pass a string to use
+        your own key or `False` to send none; cached prompt tokens are reported in
+        `usage["cached_tokens"]` of the result.
+
+        `router` picks, per step, the fastest healthy model among the requested models
+        and `available_models` from latency and error history, and fails over to the
+        next one within the step on connection errors, timeouts and 408/409/429/5xx
+        responses. Use `ModelRouter.shared()` to share that history process-wide.
+        """
         if not model:
             raise ValueError("model must be provided")
 
@@ -416,9 +706,13 @@ class DedalusRunner:
             policy=policy,
             available_models=available_models or [],
             strict_models=strict_models,
+            eager_tools=eager_tools,
+            events=events,
+            context=context,
+            router=router,
         )
 
-        tool_handler = _FunctionToolHandler(list(tools or []))
+        tool_handler = self._tool_handler_for(list(tools or []))
 
         # Handle instructions and messages parameters
         if instructions is not None and messages is not None:
@@ -445,6 +739,20 @@ class DedalusRunner:
         else:
             raise ValueError("Must provide one of: 'instructions', 'messages', or 'input'")
 
+        if prompt_cache_key is None:
+            prompt_cache_key = _prompt_cache_key(
+                conversation, tool_handler.schemas(), exec_config.mcp_servers, model_config.id
+            )
+        model_config.prompt_cache_key = prompt_cache_key or None
+
+        if events and not exec_config.stream:
+            raise ValueError("events=True requires stream=True")
+
+        if checkpoint is not None:
+            if exec_config.stream:
+                raise ValueError("checkpoint is not supported with stream=True")
+            exec_config.journal = RunJournal(checkpoint, run_id or _default_run_id(conversation, model_config))
+
         return self._execute_conversation(conversation, tool_handler, model_config, exec_config)
 
     def _execute_conversation(
@@ -481,6 +789,36 @@ class DedalusRunner:
         final_text = ""
         tool_results: list[ToolResult] = []
         tools_called: list[str] = []
+        usage: Dict[str, int] = {}
+        cache_stats: Dict[str, ToolCacheStats] = {}
+        step_metrics: list[StepMetrics] = []
+        response = None
+        journal = exec_config.journal
+
+        state = journal.begin(messages) if journal is not None else None
+        if state is not None:
+            if state.done:
+                return _result_from_state(state)
+            messages, steps, tool_results, tools_called, usage = (
+                state.messages,
+                state.steps,
+                state.tool_results,
+                state.tools_called,
+                state.usage,
+            )
+            if state.pending_tool_calls:
+                await self._execute_tool_calls(
+                    state.pending_tool_calls,
+                    tool_handler,
+                    messages,
+                    tool_results,
+                    tools_called,
+                    steps,
+                    verbose=exec_config.verbose,
+                    journal=journal,
+                    cache_stats=cache_stats,
+                    resumed=True,
+                )
 
         while steps < exec_config.max_steps:
             steps += 1
@@ -508,10 +846,15 @@ class DedalusRunner:
                 exec_config,
             )
 
+            if exec_config.context is not None:
+                messages = await exec_config.context.fit_async(messages, policy_result["model_id"], self.client)
+
             # Make model call
             current_messages = self._build_messages(messages, policy_result["prepend"], policy_result["append"])
 
-            response = await self.client.chat.completions.create(
+            requested = time.monotonic()
+            response = await self._create_completion_async(
+                exec_config,
                 model=policy_result["model"],
                 messages=current_messages,
                 tools=tool_handler.schemas() or None,
@@ -519,6 +862,11 @@ class DedalusRunner:
                 credentials=exec_config.credentials,
                 **{**self._mk_kwargs(model_config), **policy_result["model_kwargs"]},
             )
+            step_metrics.append(
+                StepMetrics.from_response(steps, policy_result["model_id"], time.monotonic() - requested, response)
+            )
+            step_usage = response_usage(response)
+            merge_usage(usage, step_usage)
 
             if exec_config.verbose:
                 actual_model = policy_result["model"]
@@ -540,6 +888,8 @@ class DedalusRunner:
             # Check if we have tool calls
             if not hasattr(response, "choices") or not response.choices:
                 final_text = ""
+                if journal is not None:
+                    journal.final(steps, final_text, None, step_usage)
                 break
 
             message = response.choices[0].message
@@ -566,6 +916,8 @@ class DedalusRunner:
                 # Add assistant response to conversation
                 if final_text:
                     messages.append({"role": "assistant", "content": final_text})
+                if journal is not None:
+                    journal.final(steps, final_text, messages[-1] if final_text else None, step_usage)
                 break
 
             # Execute tools
@@ -582,6 +934,10 @@ class DedalusRunner:
                 tools_called,
                 steps,
                 verbose=exec_config.verbose,
+                journal=journal,
+                step_usage=step_usage,
+                cache_stats=cache_stats,
+                metrics=step_metrics[-1],
             )
 
         # Extract MCP tool executions from the last response
@@ -594,6 +950,9 @@ class DedalusRunner:
             tools_called=tools_called,
             messages=messages,
             mcp_results=mcp_results,
+            usage=usage,
+            tool_cache=cache_stats,
+            step_metrics=step_metrics,
         )
 
     async def _execute_streaming_async(
@@ -604,8 +963,25 @@ class DedalusRunner:
         exec_config: _ExecutionConfig,
     ) -> AsyncIterator[Any]:
         """Execute async streaming conversation."""
+        eager = _EagerToolCalls(tool_handler) if exec_config.eager_tools else None
+        try:
+            async for chunk in self._stream_turns_async(messages, tool_handler, model_config, exec_config, eager):
+                yield chunk
+        finally:
+            if eager is not None:
+                eager.cancel()
+
+    async def _stream_turns_async(
+        self,
+        messages: list[Message],
+        tool_handler: _ToolHandler,
+        model_config: _ModelConfig,
+        exec_config: _ExecutionConfig,
+        eager: _EagerToolCalls | None,
+    ) -> AsyncIterator[Any]:
         messages = list(messages)
         steps = 0
+        timeline = _EventTimeline(getattr(tool_handler, "_funcs", {})) if exec_config.events else None
 
         while steps < exec_config.max_steps:
             steps += 1
@@ -639,12 +1015,19 @@ class DedalusRunner:
                 exec_config,
             )
 
+            if exec_config.context is not None:
+                messages = await exec_config.context.fit_async(messages, policy_result["model_id"], self.client)
+
             # Stream model response
             current_messages = self._build_messages(messages, policy_result["prepend"], policy_result["append"])
 
             # Suppress per-message debug; keep streaming minimal
 
-            stream = await self.client.chat.completions.create(
+            if timeline is not None:
+                yield timeline.step_start(steps, policy_result["model_id"])
+
+            stream = await self._create_completion_async(
+                exec_config,
                 model=policy_result["model"],
                 messages=current_messages,
                 tools=tool_handler.schemas() or None,
@@ -681,6 +1064,8 @@ class DedalusRunner:
                     if hasattr(delta, "tool_calls") and delta.tool_calls:
                         tool_call_chunks += 1
                         self._accumulate_tool_calls(delta.tool_calls, tool_calls)
+                        if eager is not None:
+                            eager.update(tool_calls)
                         # suppress per-chunk tool_call delta spam
 
                     # Check for content
@@ -692,7 +1077,11 @@ class DedalusRunner:
                     if hasattr(delta, "role") and delta.role:
                         pass
 
-                    yield chunk
+                    if timeline is None:
+                        yield chunk
+                if timeline is not None:
+                    for event in timeline.observe(steps, chunk, tool_calls):
+                        yield event
 
             if exec_config.verbose:
                 # Keep a compact end-of-stream summary
@@ -701,6 +1090,10 @@ class DedalusRunner:
                 if names:
                     print(f" Tools called this turn: {names}")
 
+            if timeline is not None:
+                for event in timeline.flush_tool_calls(steps, tool_calls):
+                    yield event
+
             # Execute any accumulated tool calls
             if tool_calls:
                 if exec_config.verbose:
@@ -732,6 +1125,23 @@ class DedalusRunner:
                 if mcp_names and has_streamed_content:
                     if exec_config.verbose:
                         print(f" MCP tools called and content streamed - response complete, breaking loop")
+                    # local calls started eagerly before the MCP call appeared have already
+                    # had their side effects; the turn is over, so only wait for them to finish
+                    # (and report them as `tool_result` events when events are on)
+                    started_calls = eager.take_all() if eager is not None else {}
+                    for index, started in started_calls.items():
+                        tc = tool_calls[index]
+                        tool_started = time.monotonic()
+                        try:
+                            result = await started
+                        except Exception as e:
+                            if timeline is not None:
+                                yield timeline.tool_result(steps, tc, tool_started, error=str(e))
+                        else:
+                            if timeline is not None:
+                                yield timeline.tool_result(steps, tc, tool_started, result=result)
+                    if timeline is not None:
+                        yield timeline.step_end(steps)
                     break
 
                 if all_mcp:
@@ -752,7 +1162,7 @@ class DedalusRunner:
                         )
 
                     # Execute only local tools
-                    for tc in tool_calls:
+                    for index, tc in enumerate(tool_calls):
                         fn_name = tc["function"]["name"]
                         fn_args_str = tc["function"]["arguments"]
 
@@ -763,8 +1173,13 @@ class DedalusRunner:
                             except json.JSONDecodeError:
                                 fn_args = {}
 
+                            tool_started = time.monotonic()
                             try:
-                                result = await tool_handler.exec(fn_name, fn_args)
+                                started = eager.take(index) if eager is not None else None
+                                if started is not None:
+                                    result = await started
+                                else:
+                                    result = await tool_handler.exec(fn_name, fn_args)
                                 messages.append(
                                     {
                                         "role": "tool",
@@ -774,6 +1189,8 @@ class DedalusRunner:
                                 )
                                 if exec_config.verbose:
                                     print(f" Executed local tool {fn_name}: {str(result)[:50]}...")
+                                if timeline is not None:
+                                    yield timeline.tool_result(steps, tc, tool_started, result=result)
                             except Exception as e:
                                 messages.append(
                                     {
@@ -784,6 +1201,8 @@ class DedalusRunner:
                                 )
                                 if exec_config.verbose:
                                     print(f" Error executing local tool {fn_name}: {e}")
+                                if timeline is not None:
+                                    yield timeline.tool_result(steps, tc, tool_started, error=str(e))
                         else:
                             # MCP tool - DON'T add any message
                             # The API server should handle this
@@ -802,13 +1221,19 @@ class DedalusRunner:
                 # Continue loop only if we need another response
                 if exec_config.verbose:
                     print(f" Tool processing complete")
+                if timeline is not None:
+                    yield timeline.step_end(steps)
             else:
                 if exec_config.verbose:
                     print(f" No tool calls found, breaking out of loop")
+                if timeline is not None:
+                    yield timeline.step_end(steps)
                 break
 
         if exec_config.verbose:
             print(f"\n[DEBUG] Exited main loop after {steps} steps")
+        if timeline is not None:
+            yield timeline.final(steps)
 
     def _execute_turns_sync(
         self,
@@ -823,6 +1248,35 @@ class DedalusRunner:
         final_text = ""
         tool_results: list[ToolResult] = []
         tools_called: list[str] = []
+        usage: Dict[str, int] = {}
+        cache_stats: Dict[str, ToolCacheStats] = {}
+        step_metrics: list[StepMetrics] = []
+        response = None
+        journal = exec_config.journal
+
+        state = journal.begin(messages) if journal is not None else None
+        if state is not None:
+            if state.done:
+                return _result_from_state(state)
+            messages, steps, tool_results, tools_called, usage = (
+                state.messages,
+                state.steps,
+                state.tool_results,
+                state.tools_called,
+                state.usage,
+            )
+            if state.pending_tool_calls:
+                self._execute_tool_calls_sync(
+                    state.pending_tool_calls,
+                    tool_handler,
+                    messages,
+                    tool_results,
+                    tools_called,
+                    steps,
+                    journal=journal,
+                    cache_stats=cache_stats,
+                    resumed=True,
+                )
 
         while steps < exec_config.max_steps:
             steps += 1
@@ -850,6 +1304,9 @@ class DedalusRunner:
                 exec_config,
             )
 
+            if exec_config.context is not None:
+                messages = exec_config.context.fit(messages, policy_result["model_id"], self.client)
+
             # Make model call
             current_messages = self._build_messages(messages, policy_result["prepend"], policy_result["append"])
 
@@ -860,7 +1317,9 @@ class DedalusRunner:
                 else:
                     print(f"  API called with single model: {actual_model}")
 
-            response = self.client.chat.completions.create(
+            requested = time.monotonic()
+            response = self._create_completion(
+                exec_config,
                 model=policy_result["model"],
                 messages=current_messages,
                 tools=tool_handler.schemas() or None,
@@ -868,6 +1327,11 @@ class DedalusRunner:
                 credentials=exec_config.credentials,
                 **{**self._mk_kwargs(model_config), **policy_result["model_kwargs"]},
             )
+            step_metrics.append(
+                StepMetrics.from_response(steps, policy_result["model_id"], time.monotonic() - requested, response)
+            )
+            step_usage = response_usage(response)
+            merge_usage(usage, step_usage)
 
             if exec_config.verbose:
                 print(f"  Response received (server says model: {getattr(response, 'model', 'unknown')})")
@@ -876,6 +1340,8 @@ class DedalusRunner:
             # Check if we have tool calls
             if not hasattr(response, "choices") or not response.choices:
                 final_text = ""
+                if journal is not None:
+                    journal.final(steps, final_text, None, step_usage)
                 break
 
             message = response.choices[0].message
@@ -894,11 +1360,24 @@ class DedalusRunner:
                 # Add assistant response to conversation
                 if final_text:
                     messages.append({"role": "assistant", "content": final_text})
+                if journal is not None:
+                    journal.final(steps, final_text, messages[-1] if final_text else None, step_usage)
                 break
 
             # Execute tools
             tool_calls = self._extract_tool_calls(response.choices[0])
-            self._execute_tool_calls_sync(tool_calls, tool_handler, messages, tool_results, tools_called, steps)
+            self._execute_tool_calls_sync(
+                tool_calls,
+                tool_handler,
+                messages,
+                tool_results,
+                tools_called,
+                steps,
+                journal=journal,
+                step_usage=step_usage,
+                cache_stats=cache_stats,
+                metrics=step_metrics[-1],
+            )
 
         # Extract MCP tool executions from the last response
         mcp_results = _extract_mcp_results(response)
@@ -910,6 +1389,9 @@ class DedalusRunner:
             tools_called=tools_called,
             messages=messages,
             mcp_results=mcp_results,
+            usage=usage,
+            tool_cache=cache_stats,
+            step_metrics=step_metrics,
         )
 
     def _execute_streaming_sync(
@@ -920,8 +1402,24 @@ class DedalusRunner:
         exec_config: _ExecutionConfig,
     ) -> Iterator[Any]:
         """Execute sync streaming conversation."""
+        eager = _EagerToolCallsSync(tool_handler) if exec_config.eager_tools else None
+        try:
+            yield from self._stream_turns_sync(messages, tool_handler, model_config, exec_config, eager)
+        finally:
+            if eager is not None:
+                eager.cancel()
+
+    def _stream_turns_sync(
+        self,
+        messages: list[Message],
+        tool_handler: _ToolHandler,
+        model_config: _ModelConfig,
+        exec_config: _ExecutionConfig,
+        eager: _EagerToolCallsSync | None,
+    ) -> Iterator[Any]:
         messages = list(messages)
         steps = 0
+        timeline = _EventTimeline(getattr(tool_handler, "_funcs", {})) if exec_config.events else None
 
         while steps < exec_config.max_steps:
             steps += 1
@@ -955,6 +1453,9 @@ class DedalusRunner:
                 exec_config,
             )
 
+            if exec_config.context is not None:
+                messages = exec_config.context.fit(messages, policy_result["model_id"], self.client)
+
             # Stream model response
             current_messages = self._build_messages(messages, policy_result["prepend"], policy_result["append"])
 
@@ -970,7 +1471,11 @@ class DedalusRunner:
                 print(f" MCP servers: {policy_result['mcp_servers']}")
                 print(f" Local tools available: {list(getattr(tool_handler, '_funcs', {}).keys())}")
 
-            stream = self.client.chat.completions.create(
+            if timeline is not None:
+                yield timeline.step_start(steps, policy_result["model_id"])
+
+            stream = self._create_completion(
+                exec_config,
                 model=policy_result["model"],
                 messages=current_messages,
                 tools=tool_handler.schemas() or None,
@@ -1001,6 +1506,8 @@ class DedalusRunner:
                     if hasattr(delta, "tool_calls") and delta.tool_calls:
                         tool_call_chunks += 1
                         self._accumulate_tool_calls(delta.tool_calls, tool_calls)
+                        if eager is not None:
+                            eager.update(tool_calls)
                         if exec_config.verbose:
                             # Show tool calls in a more readable format
                             for tc_delta in delta.tool_calls:
@@ -1016,7 +1523,11 @@ class DedalusRunner:
                         content_chunks += 1
                         accumulated_content += delta.content
 
-                    yield chunk
+                    if timeline is None:
+                        yield chunk
+                if timeline is not None:
+                    for event in timeline.observe(steps, chunk, tool_calls):
+                        yield event
 
             if exec_config.verbose:
                 if accumulated_content:
@@ -1031,6 +1542,10 @@ class DedalusRunner:
                 else:
                     print(f"\n✓ Response complete ({content_chunks} content chunks)")
 
+            if timeline is not None:
+                for event in timeline.flush_tool_calls(steps, tool_calls):
+                    yield event
+
             # Execute any accumulated tool calls
             if tool_calls:
                 if exec_config.verbose:
@@ -1062,6 +1577,23 @@ class DedalusRunner:
                 if mcp_names and has_streamed_content:
                     if exec_config.verbose:
                         print(f"  MCP tools called and content streamed - response complete, breaking loop")
+                    # local calls started eagerly before the MCP call appeared have already
+                    # had their side effects; the turn is over, so only wait for them to finish
+                    # (and report them as `tool_result` events when events are on)
+                    started_calls = eager.take_all() if eager is not None else {}
+                    for index, started in started_calls.items():
+                        tc = tool_calls[index]
+                        tool_started = time.monotonic()
+                        try:
+                            result = started.result()
+                        except Exception as e:
+                            if timeline is not None:
+                                yield timeline.tool_result(steps, tc, tool_started, error=str(e))
+                        else:
+                            if timeline is not None:
+                                yield timeline.tool_result(steps, tc, tool_started, result=result)
+                    if timeline is not None:
+                        yield timeline.step_end(steps)
                     break
 
                 if all_mcp:
@@ -1082,7 +1614,7 @@ class DedalusRunner:
                         )
 
                     # Execute only local tools
-                    for tc in tool_calls:
+                    for index, tc in enumerate(tool_calls):
                         fn_name = tc["function"]["name"]
                         fn_args_str = tc["function"]["arguments"]
 
@@ -1093,8 +1625,13 @@ class DedalusRunner:
                             except json.JSONDecodeError:
                                 fn_args = {}
 
+                            tool_started = time.monotonic()
                             try:
-                                result = tool_handler.exec_sync(fn_name, fn_args)
+                                started = eager.take(index) if eager is not None else None
+                                if started is not None:
+                                    result = started.result()
+                                else:
+                                    result = tool_handler.exec_sync(fn_name, fn_args)
                                 messages.append(
                                     {
                                         "role": "tool",
@@ -1104,6 +1641,8 @@ class DedalusRunner:
                                 )
                                 if exec_config.verbose:
                                     print(f" Executed local tool {fn_name}: {str(result)[:50]}...")
+                                if timeline is not None:
+                                    yield timeline.tool_result(steps, tc, tool_started, result=result)
                             except Exception as e:
                                 messages.append(
                                     {
@@ -1114,6 +1653,8 @@ class DedalusRunner:
                                 )
                                 if exec_config.verbose:
                                     print(f" Error executing local tool {fn_name}: {e}")
+                                if timeline is not None:
+                                    yield timeline.tool_result(steps, tc, tool_started, error=str(e))
                         else:
                             # MCP tool - DON'T add any message
                             # The API server should handle this
@@ -1132,11 +1673,31 @@ class DedalusRunner:
                 # Continue loop only if we need another response
                 if exec_config.verbose:
                     print(f" Tool processing complete")
+                if timeline is not None:
+                    yield timeline.step_end(steps)
             else:
                 if exec_config.verbose:
                     print(f" No tool calls found, breaking out of loop")
+                if timeline is not None:
+                    yield timeline.step_end(steps)
                 break
 
+        if timeline is not None:
+            yield timeline.final(steps)
+
+    def _create_completion(self, exec_config: _ExecutionConfig, model: str | list[str], **params: Any) -> Any:
+        """`chat.completions.create`, going through `exec_config.router` when one is set."""
+        if exec_config.router is None:
+            return self.client.chat.completions.create(model=model, **params)
+        return exec_config.router.create(self.client, _route_candidates(model, exec_config), **params)  # type: ignore[arg-type]
+
+    async def _create_completion_async(
+        self, exec_config: _ExecutionConfig, model: str | list[str], **params: Any
+    ) -> Any:
+        if exec_config.router is None:
+            return await self.client.chat.completions.create(model=model, **params)  # type: ignore[misc]
+        return await exec_config.router.acreate(self.client, _route_candidates(model, exec_config), **params)  # type: ignore[arg-type]
+
     def _apply_policy(
         self,
         policy: PolicyInput,
@@ -1243,13 +1804,25 @@ class DedalusRunner:
         tools_called: list[str],
         step: int,
         verbose: bool = False,
+        journal: RunJournal | None = None,
+        step_usage: Dict[str, int] | None = None,
+        cache_stats: Dict[str, ToolCacheStats] | None = None,
+        metrics: StepMetrics | None = None,
+        resumed: bool = False,
     ):
-        """Execute tool calls asynchronously."""
+        """Execute tool calls asynchronously.
+
+        With `resumed=True` the assistant message is already in `messages` (replayed
+        from a checkpoint) and only the given, unfinished calls are run.
+        """
         if verbose:
             print(f" _execute_tool_calls: Processing {len(tool_calls)} tool calls")
 
-        # Record single assistant message with ALL tool calls (OpenAI format)
-        messages.append({"role": "assistant", "tool_calls": list(tool_calls)})
+        if not resumed:
+            # Record single assistant message with ALL tool calls (OpenAI format)
+            messages.append({"role": "assistant", "tool_calls": list(tool_calls)})
+            if journal is not None:
+                journal.assistant(step, messages[-1], step_usage)
 
         for i, tc in enumerate(tool_calls):
             fn_name = tc["function"]["name"]
@@ -1263,15 +1836,22 @@ class DedalusRunner:
             except json.JSONDecodeError:
                 fn_args = {}
 
+            started = time.monotonic()
             try:
-                result = await tool_handler.exec(fn_name, fn_args)
+                result = await tool_handler.exec(fn_name, fn_args, cache_stats)
+                if metrics is not None:
+                    metrics.tools.append(ToolTiming(fn_name, tc["id"], time.monotonic() - started))
                 tool_results.append({"name": fn_name, "result": result, "step": step})
                 tools_called.append(fn_name)
                 messages.append({"role": "tool", "tool_call_id": tc["id"], "content": str(result)})
+                if journal is not None:
+                    journal.tool(step, messages[-1], tool_results[-1])
 
                 if verbose:
                     print(f" Tool {fn_name} executed successfully: {str(result)[:50]}...")
             except Exception as e:
+                if metrics is not None:
+                    metrics.tools.append(ToolTiming(fn_name, tc["id"], time.monotonic() - started, ok=False))
                 error_result = {"error": str(e), "name": fn_name, "step": step}
                 tool_results.append(error_result)
                 messages.append(
@@ -1281,6 +1861,8 @@ class DedalusRunner:
                         "content": f"Error: {str(e)}",
                     }
                 )
+                if journal is not None:
+                    journal.tool(step, messages[-1], error_result)
 
                 if verbose:
                     print(f" Tool {fn_name} failed with error: {e}")
@@ -1294,10 +1876,18 @@ class DedalusRunner:
         tool_results: list[ToolResult],
         tools_called: list[str],
         step: int,
+        journal: RunJournal | None = None,
+        step_usage: Dict[str, int] | None = None,
+        cache_stats: Dict[str, ToolCacheStats] | None = None,
+        metrics: StepMetrics | None = None,
+        resumed: bool = False,
     ):
         """Execute tool calls synchronously."""
-        # Record single assistant message with ALL tool calls (OpenAI format)
-        messages.append({"role": "assistant", "tool_calls": list(tool_calls)})
+        if not resumed:
+            # Record single assistant message with ALL tool calls (OpenAI format)
+            messages.append({"role": "assistant", "tool_calls": list(tool_calls)})
+            if journal is not None:
+                journal.assistant(step, messages[-1], step_usage)
 
         for tc in tool_calls:
             fn_name = tc["function"]["name"]
@@ -1308,12 +1898,19 @@ class DedalusRunner:
             except json.JSONDecodeError:
                 fn_args = {}
 
+            started = time.monotonic()
             try:
-                result = tool_handler.exec_sync(fn_name, fn_args)
+                result = tool_handler.exec_sync(fn_name, fn_args, cache_stats)
+                if metrics is not None:
+                    metrics.tools.append(ToolTiming(fn_name, tc["id"], time.monotonic() - started))
                 tool_results.append({"name": fn_name, "result": result, "step": step})
                 tools_called.append(fn_name)
                 messages.append({"role": "tool", "tool_call_id": tc["id"], "content": str(result)})
+                if journal is not None:
+                    journal.tool(step, messages[-1], tool_results[-1])
             except Exception as e:
+                if metrics is not None:
+                    metrics.tools.append(ToolTiming(fn_name, tc["id"], time.monotonic() - started, ok=False))
                 error_result = {"error": str(e), "name": fn_name, "step": step}
                 tool_results.append(error_result)
                 messages.append(
@@ -1323,6 +1920,8 @@ class DedalusRunner:
                         "content": f"Error: {str(e)}",
                     }
                 )
+                if journal is not None:
+                    journal.tool(step, messages[-1], error_result)
 
     def _accumulate_tool_calls(self, deltas, acc: list[ToolCall]) -> None:
         """Accumulate streaming tool call deltas."""
@@ -0,0 +1,231 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Typed events for streamed runner output.
+
+With `runner.run(..., stream=True, events=True)` the runner yields these instead
+of raw completion chunks, so consumers don't have to re-accumulate deltas to find
+text, tool calls and step boundaries:
+
+```py
+for event in runner.run(input=..., model=..., tools=[...], stream=True, events=True):
+    if event.type == "content_delta":
+        print(event.text, end="")
+    elif event.type == "tool_result":
+        print(f"\\n{event.name} took {event.duration:.2f}s")
+```
+
+Every event carries its `step` and `elapsed`, the seconds since the run started.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Union, Optional
+from dataclasses import field, dataclass
+from typing_extensions import Literal
+
+from .types import ToolCall, JsonValue
+from ._usage import merge_usage, response_usage
+from ._tool_calls import ready_tool_calls
+
+__all__ = [
+    "ContentDeltaEvent",
+    "FinalEvent",
+    "RunEvent",
+    "StepEndEvent",
+    "StepStartEvent",
+    "ToolCallReadyEvent",
+    "ToolResultEvent",
+]
+
+
+@dataclass
+class _BaseEvent:
+    step: int
+    elapsed: float
+    """Seconds since the run started."""
+
+
+@dataclass
+class StepStartEvent(_BaseEvent):
+    """A model request for `step` is about to be sent."""
+
+    model: str
+    type: Literal["step_start"] = field(default="step_start", init=False)
+
+
+@dataclass
+class ContentDeltaEvent(_BaseEvent):
+    """A piece of assistant text."""
+
+    text: str
+    type: Literal["content_delta"] = field(default="content_delta", init=False)
+
+
+@dataclass
+class ToolCallReadyEvent(_BaseEvent):
+    """A tool call whose name and arguments have been fully streamed."""
+
+    tool_call: ToolCall
+    local: bool
+    """Whether the runner executes it; other calls are handled by the server (MCP)."""
+    type: Literal["tool_call_ready"] = field(default="tool_call_ready", init=False)
+
+    @property
+    def name(self) -> str:
+        return str(self.tool_call["function"]["name"])  # type: ignore[index]
+
+    @property
+    def arguments(self) -> str:
+        return str(self.tool_call["function"]["arguments"])  # type: ignore[index]
+
+
+@dataclass
+class ToolResultEvent(_BaseEvent):
+    """A local tool call finished."""
+
+    name: str
+    tool_call_id: str
+    result: JsonValue
+    error: Optional[str]
+    duration: float
+    """Seconds the runner waited for the result (eagerly started calls may have run longer)."""
+    type: Literal["tool_result"] = field(default="tool_result", init=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class StepEndEvent(_BaseEvent):
+    """The model response for `step` and its tool calls are done."""
+
+    finish_reason: Optional[str]
+    duration: float
+    """Seconds from `step_start` to the end of the step, including local tools."""
+    time_to_first_token: Optional[float]
+    """Seconds from `step_start` to the first streamed delta."""
+    usage: Dict[str, int]
+    """Token usage for this step, if the server included it in the stream."""
+    type: Literal["step_end"] = field(default="step_end", init=False)
+
+
+@dataclass
+class FinalEvent(_BaseEvent):
+    """The run is finished; always the last event."""
+
+    output: str
+    """Assistant text from the last step."""
+    tools_called: List[str]
+    usage: Dict[str, int]
+    """Token usage summed over all steps."""
+    type: Literal["final"] = field(default="final", init=False)
+
+
+RunEvent = Union[StepStartEvent, ContentDeltaEvent, ToolCallReadyEvent, ToolResultEvent, StepEndEvent, FinalEvent]
+
+
+class _EventTimeline:
+    """Turns the streaming loop's progress into `RunEvent`s; one per run."""
+
+    def __init__(self, local: Any) -> None:
+        self._local = local
+        self._started = time.monotonic()
+        self._step_started = self._started
+        self._first_token: Optional[float] = None
+        self._announced: set[int] = set()
+        self._finish_reason: Optional[str] = None
+        self._text: List[str] = []
+        self._step_usage: Dict[str, int] = {}
+        self._usage: Dict[str, int] = {}
+        self._tools_called: List[str] = []
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def step_start(self, step: int, model: str) -> StepStartEvent:
+        self._step_started = time.monotonic()
+        self._first_token = None
+        self._announced = set()
+        self._finish_reason = None
+        self._text = []
+        self._step_usage = {}
+        return StepStartEvent(step=step, elapsed=self.elapsed(), model=model)
+
+    def observe(self, step: int, chunk: Any, tool_calls: List[ToolCall]) -> List[RunEvent]:
+        """Events for one streamed chunk; `tool_calls` is the accumulated state after it."""
+        events: List[RunEvent] = []
+        choices = getattr(chunk, "choices", None)
+        if choices:
+            choice = choices[0]
+            if self._first_token is None:
+                self._first_token = time.monotonic()
+            if getattr(choice, "finish_reason", None):
+                self._finish_reason = choice.finish_reason
+            text = getattr(choice.delta, "content", None)
+            if text:
+                self._text.append(text)
+                events.append(ContentDeltaEvent(step=step, elapsed=self.elapsed(), text=text))
+            if getattr(choice.delta, "tool_calls", None):
+                for index in ready_tool_calls(tool_calls, self._announced, _Everything()):
+                    events.append(self._ready(step, index, tool_calls[index]))
+        usage = response_usage(chunk)
+        if usage:
+            self._step_usage = usage
+        return events
+
+    def flush_tool_calls(self, step: int, tool_calls: List[ToolCall]) -> List[RunEvent]:
+        """Announce calls whose arguments only became final when the stream ended."""
+        return [self._ready(step, i, tc) for i, tc in enumerate(tool_calls) if i not in self._announced]
+
+    def tool_result(
+        self, step: int, tool_call: ToolCall, started: float, result: JsonValue = None, error: Optional[str] = None
+    ) -> ToolResultEvent:
+        name = str(tool_call["function"]["name"])  # type: ignore[index]
+        if error is None:
+            self._tools_called.append(name)
+        return ToolResultEvent(
+            step=step,
+            elapsed=self.elapsed(),
+            name=name,
+            tool_call_id=str(tool_call.get("id", "")),
+            result=result,
+            error=error,
+            duration=time.monotonic() - started,
+        )
+
+    def step_end(self, step: int) -> StepEndEvent:
+        now = time.monotonic()
+        merge_usage(self._usage, self._step_usage)
+        return StepEndEvent(
+            step=step,
+            elapsed=now - self._started,
+            finish_reason=self._finish_reason,
+            duration=now - self._step_started,
+            time_to_first_token=self._first_token - self._step_started if self._first_token is not None else None,
+            usage=self._step_usage,
+        )
+
+    def final(self, step: int) -> FinalEvent:
+        return FinalEvent(
+            step=step,
+            elapsed=self.elapsed(),
+            output="".join(self._text),
+            tools_called=self._tools_called,
+            usage=self._usage,
+        )
+
+    def _ready(self, step: int, index: int, tool_call: ToolCall) -> ToolCallReadyEvent:
+        self._announced.add(index)
+        local = tool_call["function"]["name"] in self._local  # type: ignore[index]
+        return ToolCallReadyEvent(step=step, elapsed=self.elapsed(), tool_call=dict(tool_call), local=local)
+
+
+class _Everything:
+    def __contains__(self, item: object) -> bool:
+        return True
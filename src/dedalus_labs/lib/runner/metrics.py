@@ -0,0 +1,119 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Per-step latency and token accounting for `DedalusRunner` runs.
+
+```py
+result = runner.run(input=..., model=..., tools=[...])
+for step in result.step_metrics:
+    print(step.step, step.model, f"{step.latency:.2f}s", step.prompt_tokens, step.tool_time)
+print(result.metrics.model_time, result.metrics.cached_tokens)
+```
+
+Step metrics cover non-streaming runs, where the response arrives in one piece.
+Streamed runs report each step's time to first token on its `step_end` event.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence
+from dataclasses import field, dataclass
+
+__all__ = [
+    "RunMetrics",
+    "StepMetrics",
+    "ToolTiming",
+]
+
+
+@dataclass
+class ToolTiming:
+    """One local tool call."""
+
+    name: str
+    tool_call_id: str
+    duration: float
+    """Seconds spent executing the tool (near zero for cache hits)."""
+    ok: bool = True
+
+
+@dataclass
+class StepMetrics:
+    """Timing and token usage for one model call and the tools it requested."""
+
+    step: int
+    model: str
+    """Model that answered, as reported by the server when available."""
+    latency: float
+    """Seconds from sending the request to receiving the full response."""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    total_tokens: int = 0
+    tools: List[ToolTiming] = field(default_factory=list)
+    tools_executed: List[str] = field(default_factory=list)
+    """Tools the server reports having run itself (e.g. MCP tools)."""
+
+    @property
+    def tool_time(self) -> float:
+        return sum(t.duration for t in self.tools)
+
+    @classmethod
+    def from_response(cls, step: int, model: str, latency: float, response: Any) -> StepMetrics:
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        return cls(
+            step=step,
+            model=getattr(response, "model", None) or model,
+            latency=latency,
+            prompt_tokens=getattr(usage, "prompt_tokens", None) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", None) or 0,
+            cached_tokens=getattr(details, "cached_tokens", None) or 0,
+            total_tokens=getattr(usage, "total_tokens", None) or 0,
+            tools_executed=list(getattr(response, "tools_executed", None) or []),
+        )
+
+
+@dataclass
+class RunMetrics:
+    """Totals over all steps of a run."""
+
+    steps: int = 0
+    model_time: float = 0.0
+    """Seconds spent waiting on model calls."""
+    tool_time: float = 0.0
+    """Seconds spent executing local tools."""
+    tool_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    total_tokens: int = 0
+    slowest_step: Optional[int] = None
+    """Step number with the highest model latency."""
+
+    @property
+    def mean_latency(self) -> float:
+        return self.model_time / self.steps if self.steps else 0.0
+
+    @property
+    def cached_ratio(self) -> float:
+        """Share of prompt tokens served from the provider's prompt cache."""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    @classmethod
+    def from_steps(cls, steps: Sequence[StepMetrics]) -> RunMetrics:
+        totals = cls(steps=len(steps))
+        for step in steps:
+            totals.model_time += step.latency
+            totals.tool_time += step.tool_time
+            totals.tool_calls += len(step.tools)
+            totals.prompt_tokens += step.prompt_tokens
+            totals.completion_tokens += step.completion_tokens
+            totals.cached_tokens += step.cached_tokens
+            totals.total_tokens += step.total_tokens
+        if steps:
+            totals.slowest_step = max(steps, key=lambda s: s.latency).step
+        return totals
@@ -0,0 +1,262 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Client-side model routing with latency tracking and failover.
+
+A `ModelRouter` keeps an exponentially weighted moving average (EWMA) of latency,
+time to first token and error rate for every model it sends requests to. On each
+step the runner asks it to rank the candidate models (the requested model list
+plus `available_models`): models that have not been measured yet come first so
+each gets measured once, then healthy models from fastest to slowest, then
+models that recently failed. If a request fails with a connection error, a
+timeout, or a 408/409/429/5xx response, the next candidate is tried within
+the same step.
+
+```py
+router = ModelRouter.shared()  # one process-wide instance; or ModelRouter(...) per use
+runner.run(input=..., model=["openai/gpt-4o", "anthropic/claude-sonnet-4-5"], router=router)
+```
+"""
+
+from __future__ import annotations
+
+import time
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, ClassVar, Iterator, Optional, Sequence, AsyncIterator
+from dataclasses import dataclass
+from typing_extensions import Literal
+
+from ..._exceptions import APIStatusError, APIConnectionError
+
+if TYPE_CHECKING:
+    from ..._client import Dedalus, AsyncDedalus
+
+__all__ = [
+    "ModelHealth",
+    "ModelRouter",
+]
+
+
+@dataclass
+class ModelHealth:
+    """What a `ModelRouter` has observed about one model."""
+
+    calls: int = 0
+    failures: int = 0
+    latency: Optional[float] = None
+    """EWMA of seconds until the full response (or end of stream)."""
+    time_to_first_token: Optional[float] = None
+    """EWMA of seconds until the first streamed chunk."""
+    error_rate: float = 0.0
+    """EWMA of failed calls, between 0 and 1."""
+    last_failure: Optional[float] = None
+    """`time.monotonic()` of the most recent failure."""
+
+
+class ModelRouter:
+    """Ranks models by observed latency and health, and fails over between them.
+
+    Args:
+        alpha: EWMA weight of the newest observation.
+        max_error_rate: Models whose error rate is above this are unhealthy...
+        cooldown: ...until this many seconds have passed since their last failure.
+        prefer: Rank healthy models by total `"latency"` or by `"time_to_first_token"`
+            (falls back to latency for models that were never streamed).
+        timeout: Per-request timeout in seconds while routing, so a slow model fails over.
+        max_retries: Client retries against the same model before failing over.
+    """
+
+    _shared: ClassVar[Optional[ModelRouter]] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        alpha: float = 0.3,
+        max_error_rate: float = 0.5,
+        cooldown: float = 30.0,
+        prefer: Literal["latency", "time_to_first_token"] = "latency",
+        timeout: Optional[float] = None,
+        max_retries: int = 0,
+    ) -> None:
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.max_error_rate = max_error_rate
+        self.cooldown = cooldown
+        self.prefer = prefer
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._health: Dict[str, ModelHealth] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> ModelRouter:
+        """The process-wide router, so all runners learn from each other's calls."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def health(self, model: str) -> ModelHealth:
+        with self._lock:
+            current = self._health.get(model)
+            return ModelHealth(**vars(current)) if current is not None else ModelHealth()
+
+    def is_healthy(self, model: str) -> bool:
+        with self._lock:
+            return self._is_healthy(self._health.get(model), time.monotonic())
+
+    def rank(self, models: Sequence[str]) -> List[str]:
+        """`models` in the order they should be tried."""
+        now = time.monotonic()
+        with self._lock:
+
+            def key(item: tuple[int, str]) -> tuple[int, float, int]:
+                position, model = item
+                health = self._health.get(model)
+                if health is None or health.latency is None and health.failures == 0:
+                    return (0, 0.0, position)
+                if not self._is_healthy(health, now):
+                    return (2, health.last_failure or 0.0, position)
+                return (1, self._score(health), position)
+
+            return [model for _, model in sorted(enumerate(_unique(models)), key=key)]
+
+    def record_success(self, model: str, latency: float, time_to_first_token: Optional[float] = None) -> None:
+        with self._lock:
+            health = self._health.setdefault(model, ModelHealth())
+            health.calls += 1
+            health.latency = self._ewma(health.latency, latency)
+            if time_to_first_token is not None:
+                health.time_to_first_token = self._ewma(health.time_to_first_token, time_to_first_token)
+            health.error_rate = self._ewma(health.error_rate if health.calls > 1 else None, 0.0)
+
+    def record_failure(self, model: str) -> None:
+        with self._lock:
+            health = self._health.setdefault(model, ModelHealth())
+            health.calls += 1
+            health.failures += 1
+            health.error_rate = self._ewma(health.error_rate if health.calls > 1 else None, 1.0)
+            health.last_failure = time.monotonic()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._health.clear()
+
+    def create(self, client: Dedalus, models: Sequence[str], **params: Any) -> Any:
+        """`client.chat.completions.create(**params)` against the best model, failing over on errors."""
+        routed = client.with_options(max_retries=self.max_retries)
+        if self.timeout is not None:
+            params.setdefault("timeout", self.timeout)
+        error: Optional[BaseException] = None
+        for model in self.rank(models):
+            started = time.monotonic()
+            try:
+                response = routed.chat.completions.create(model=model, **params)
+            except Exception as exc:
+                if not _should_fail_over(exc):
+                    raise
+                self.record_failure(model)
+                error = exc
+                continue
+            if params.get("stream"):
+                return _TimedStream(response, self, model, started)
+            self.record_success(model, time.monotonic() - started)
+            return response
+        assert error is not None, "no models to route between"
+        raise error
+
+    async def acreate(self, client: AsyncDedalus, models: Sequence[str], **params: Any) -> Any:
+        """Async counterpart of `create`."""
+        routed = client.with_options(max_retries=self.max_retries)
+        if self.timeout is not None:
+            params.setdefault("timeout", self.timeout)
+        error: Optional[BaseException] = None
+        for model in self.rank(models):
+            started = time.monotonic()
+            try:
+                response = await routed.chat.completions.create(model=model, **params)
+            except Exception as exc:
+                if not _should_fail_over(exc):
+                    raise
+                self.record_failure(model)
+                error = exc
+                continue
+            if params.get("stream"):
+                return _AsyncTimedStream(response, self, model, started)
+            self.record_success(model, time.monotonic() - started)
+            return response
+        assert error is not None, "no models to route between"
+        raise error
+
+    def _is_healthy(self, health: Optional[ModelHealth], now: float) -> bool:
+        if health is None or health.error_rate <= self.max_error_rate:
+            return True
+        return health.last_failure is None or now - health.last_failure >= self.cooldown
+
+    def _score(self, health: ModelHealth) -> float:
+        if self.prefer == "time_to_first_token" and health.time_to_first_token is not None:
+            return health.time_to_first_token
+        return health.latency if health.latency is not None else float("inf")
+
+    def _ewma(self, current: Optional[float], value: float) -> float:
+        return value if current is None else self.alpha * value + (1 - self.alpha) * current
+
+
+class _TimedStream:
+    """Passes chunks through while timing the first chunk and the end of the stream."""
+
+    def __init__(self, stream: Any, router: ModelRouter, model: str, started: float) -> None:
+        self._stream = stream
+        self._router = router
+        self._model = model
+        self._started = started
+
+    def __iter__(self) -> Iterator[Any]:
+        first: Optional[float] = None
+        try:
+            for chunk in self._stream:
+                if first is None:
+                    first = time.monotonic() - self._started
+                yield chunk
+        except Exception:
+            self._router.record_failure(self._model)
+            raise
+        self._router.record_success(self._model, time.monotonic() - self._started, first)
+
+
+class _AsyncTimedStream:
+    def __init__(self, stream: Any, router: ModelRouter, model: str, started: float) -> None:
+        self._stream = stream
+        self._router = router
+        self._model = model
+        self._started = started
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        first: Optional[float] = None
+        try:
+            async for chunk in self._stream:
+                if first is None:
+                    first = time.monotonic() - self._started
+                yield chunk
+        except Exception:
+            self._router.record_failure(self._model)
+            raise
+        self._router.record_success(self._model, time.monotonic() - self._started, first)
+
+
+def _should_fail_over(exc: BaseException) -> bool:
+    # the same conditions the client retries on: connection problems, timeouts and transient statuses
+    if isinstance(exc, APIConnectionError):
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code in (408, 409, 429) or exc.status_code >= 500
+    return False
+
+
+def _unique(models: Sequence[str]) -> List[str]:
+    return list(dict.fromkeys(models))
@@ -0,0 +1,361 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Opt-in result caching for pure tools.
+
+```py
+@cached_tool(ttl=3600)
+def convert(amount: float, unit: str) -> float: ...
+
+
+runner.run(input=..., model=..., tools=[convert, cached_tool(lookup, maxsize=10_000)])
+```
+
+Results are keyed by tool name and the canonical JSON of the call's arguments
+(defaults applied, keys sorted), kept in a size-bounded LRU with an optional TTL,
+and optionally persisted to a directory so they survive across processes.
+Concurrent identical calls are collapsed into one execution. The cache lives on
+the decorated function, so it is shared by every run that uses it; per-run hit
+counts are reported in `_RunResult.tool_cache`.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import inspect
+import functools
+import threading
+from typing import Any, Dict, Tuple, Union, TypeVar, Callable, Optional, Awaitable, overload
+from pathlib import Path
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .types import JsonValue
+
+__all__ = [
+    "ToolCache",
+    "ToolCacheStats",
+    "cached_tool",
+]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_CACHE_ATTR = "__dedalus_tool_cache__"
+
+
+@dataclass
+class ToolCacheStats:
+    """Lookup counters for a tool cache."""
+
+    hits: int = 0
+    """Calls answered from the cache (memory or disk)."""
+    disk_hits: int = 0
+    """Subset of `hits` answered from the disk tier."""
+    coalesced: int = 0
+    """Calls that waited on an identical call already in flight."""
+    misses: int = 0
+    """Calls that executed the tool."""
+
+    @property
+    def calls(self) -> int:
+        return self.hits + self.coalesced + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.hits + self.coalesced) / self.calls if self.calls else 0.0
+
+
+class _Flight:
+    """A call in progress that identical concurrent calls wait on (threads)."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: JsonValue = None
+        self.error: Optional[BaseException] = None
+
+
+class ToolCache:
+    """LRU + TTL cache of tool results with an optional on-disk tier.
+
+    Args:
+        ttl: Seconds a result stays valid; `None` keeps results until evicted.
+        maxsize: Maximum number of results held in memory.
+        directory: If given, results are also written there as JSON files and read
+            back on memory misses. Results that aren't JSON-serialisable stay in memory only.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: Optional[float] = None,
+        maxsize: int = 1024,
+        directory: Union[str, os.PathLike[str], None] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stats = ToolCacheStats()
+        self._directory = Path(directory) if directory is not None else None
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, Tuple[float, JsonValue]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[Tuple[int, str], asyncio.Future[JsonValue]] = {}
+
+    def key(self, name: str, args: Dict[str, Any], signature: Optional[inspect.Signature] = None) -> str:
+        """Cache key for calling tool `name` with `args`; defaults from `signature` are applied first."""
+        if signature is not None:
+            try:
+                bound = signature.bind(**args)
+            except TypeError:
+                pass
+            else:
+                bound.apply_defaults()
+                args = dict(bound.arguments)
+        canonical = json.dumps([name, args], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def call(
+        self,
+        key: str,
+        compute: Callable[[], JsonValue],
+        *,
+        name: str = "",
+        run_stats: Optional[Dict[str, ToolCacheStats]] = None,
+    ) -> JsonValue:
+        """Return the cached result for `key`, or run `compute` once for all concurrent callers."""
+        found, value = self._lookup(key, name, run_stats)
+        if found:
+            return value
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            self._record(name, run_stats, coalesced=1)
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        self._record(name, run_stats, misses=1)
+        try:
+            flight.value = compute()
+            self._store(key, flight.value)
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def acall(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[JsonValue]],
+        *,
+        name: str = "",
+        run_stats: Optional[Dict[str, ToolCacheStats]] = None,
+    ) -> JsonValue:
+        """Async counterpart of `call`; concurrent callers on the same event loop share one execution.
+
+        If the caller running the tool is cancelled, the callers waiting on it
+        retry, and one of them runs the tool instead.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        while True:
+            found, value = self._lookup(key, name, run_stats)
+            if found:
+                return value
+
+            flight = self._async_flights.get(flight_key)
+            if flight is None:
+                break
+            self._record(name, run_stats, coalesced=1)
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    # this caller was cancelled, not the one running the tool
+                    raise
+
+        flight = self._async_flights[flight_key] = loop.create_future()
+        self._record(name, run_stats, misses=1)
+        try:
+            value = await compute()
+            self._store(key, value)
+            flight.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            # only this caller was cancelled; the waiters retry rather than share it
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            # mark the exception as retrieved in case nobody else was waiting
+            flight.exception()
+            raise
+        finally:
+            del self._async_flights[flight_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self._directory is not None:
+            for path in self._directory.glob("*.json"):
+                path.unlink()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: str, name: str, run_stats: Optional[Dict[str, ToolCacheStats]]) -> Tuple[bool, JsonValue]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    _run_entry(run_stats, name).hits += 1
+                    return True, entry[1]
+                del self._entries[key]
+
+        if self._directory is not None:
+            found, expires, value = self._read_disk(key)
+            if found and expires > now:
+                self._remember(key, expires, value)
+                self._record(name, run_stats, hits=1, disk_hits=1)
+                return True, value
+        return False, None
+
+    def _store(self, key: str, value: JsonValue) -> None:
+        expires = time.time() + self.ttl if self.ttl is not None else float("inf")
+        self._remember(key, expires, value)
+        if self._directory is not None:
+            self._write_disk(key, expires, value)
+
+    def _remember(self, key: str, expires: float, value: JsonValue) -> None:
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _record(self, name: str, run_stats: Optional[Dict[str, ToolCacheStats]], **counts: int) -> None:
+        with self._lock:
+            targets = [self.stats] if run_stats is None else [self.stats, _run_entry(run_stats, name)]
+            for stats in targets:
+                for field_name, count in counts.items():
+                    setattr(stats, field_name, getattr(stats, field_name) + count)
+
+    def _read_disk(self, key: str) -> Tuple[bool, float, JsonValue]:
+        assert self._directory is not None
+        try:
+            with open(self._directory / f"{key}.json", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return False, 0.0, None
+        expires = entry.get("expires")
+        return True, float("inf") if expires is None else expires, entry.get("value")
+
+    def _write_disk(self, key: str, expires: float, value: JsonValue) -> None:
+        assert self._directory is not None
+        try:
+            encoded = json.dumps({"expires": None if expires == float("inf") else expires, "value": value})
+        except (TypeError, ValueError):
+            return
+        # write-then-rename so concurrent readers never see a partial file
+        tmp = self._directory / f".{key}.{threading.get_ident()}.tmp"
+        tmp.write_text(encoded, encoding="utf-8")
+        os.replace(tmp, self._directory / f"{key}.json")
+
+
+def _run_entry(run_stats: Optional[Dict[str, ToolCacheStats]], name: str) -> ToolCacheStats:
+    if run_stats is None:
+        return ToolCacheStats()
+    entry = run_stats.get(name)
+    if entry is None:
+        entry = run_stats[name] = ToolCacheStats()
+    return entry
+
+
+def tool_cache_of(fn: Callable[..., Any]) -> Optional[ToolCache]:
+    """The `ToolCache` attached by `cached_tool`, if any."""
+    return getattr(fn, _CACHE_ATTR, None)
+
+
+@overload
+def cached_tool(fn: F) -> F: ...
+
+
+@overload
+def cached_tool(
+    *,
+    ttl: Optional[float] = None,
+    maxsize: int = 1024,
+    directory: Union[str, os.PathLike[str], None] = None,
+    cache: Optional[ToolCache] = None,
+) -> Callable[[F], F]: ...
+
+
+def cached_tool(
+    fn: Optional[F] = None,
+    *,
+    ttl: Optional[float] = None,
+    maxsize: int = 1024,
+    directory: Union[str, os.PathLike[str], None] = None,
+    cache: Optional[ToolCache] = None,
+) -> Union[F, Callable[[F], F]]:
+    """Mark a pure tool as cacheable, as `@cached_tool` or `@cached_tool(ttl=...)`.
+
+    Only use this for tools whose result depends solely on their arguments. The
+    returned function keeps the original signature (so its schema is unchanged)
+    and also caches when called directly. Pass `cache` to share one `ToolCache`
+    between several tools.
+    """
+
+    def decorate(func: F) -> F:
+        tool_cache = cache if cache is not None else ToolCache(ttl=ttl, maxsize=maxsize, directory=directory)
+        signature = inspect.signature(func)
+        name = func.__name__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                call_args = dict(signature.bind(*args, **kwargs).arguments)
+                key = tool_cache.key(name, call_args, signature)
+                return await tool_cache.acall(key, lambda: func(*args, **kwargs), name=name)
+
+            wrapper: Any = async_wrapper
+        else:
+
+            @functools.wraps(func)
+            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+                call_args = dict(signature.bind(*args, **kwargs).arguments)
+                key = tool_cache.key(name, call_args, signature)
+                return tool_cache.call(key, lambda: func(*args, **kwargs), name=name)
+
+            wrapper = sync_wrapper
+
+        setattr(wrapper, _CACHE_ATTR, tool_cache)
+        return wrapper  # type: ignore[no-any-return]
+
+    if fn is not None:
+        return decorate(fn)
+    return decorate
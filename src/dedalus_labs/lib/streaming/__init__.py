@@ -1,3 +1,17 @@
+from ._lite import (
+    LiteChunk as LiteChunk,
+    LiteObject as LiteObject,
+    LiteStream as LiteStream,
+    AsyncLiteStream as AsyncLiteStream,
+)
+from ._tee import (
+    Subscriber as Subscriber,
+    AsyncSubscriber as AsyncSubscriber,
+    StreamBroadcast as StreamBroadcast,
+    AsyncStreamBroadcast as AsyncStreamBroadcast,
+    tee as tee,
+    atee as atee,
+)
 from ._deltas import accumulate_delta as accumulate_delta
 from .chat import (
     ChatCompletionStream as ChatCompletionStream,
@@ -6,6 +20,19 @@ from .chat import (
     AsyncChatCompletionStreamManager as AsyncChatCompletionStreamManager,
     ChatCompletionStreamState as ChatCompletionStreamState,
 )
+from .audio import (
+    AudioRingBuffer as AudioRingBuffer,
+    SpeechAudioStream as SpeechAudioStream,
+    SpeechStreamManager as SpeechStreamManager,
+    AsyncSpeechAudioStream as AsyncSpeechAudioStream,
+    AsyncSpeechStreamManager as AsyncSpeechStreamManager,
+)
+from .images import (
+    ImageGenerationStream as ImageGenerationStream,
+    AsyncImageGenerationStream as AsyncImageGenerationStream,
+    ImageGenerationStreamManager as ImageGenerationStreamManager,
+    AsyncImageGenerationStreamManager as AsyncImageGenerationStreamManager,
+)
 
 __all__ = [
     "accumulate_delta",
@@ -14,4 +41,23 @@ __all__ = [
     "ChatCompletionStreamManager",
     "AsyncChatCompletionStreamManager",
     "ChatCompletionStreamState",
+    "AudioRingBuffer",
+    "SpeechAudioStream",
+    "AsyncSpeechAudioStream",
+    "SpeechStreamManager",
+    "AsyncSpeechStreamManager",
+    "ImageGenerationStream",
+    "AsyncImageGenerationStream",
+    "ImageGenerationStreamManager",
+    "AsyncImageGenerationStreamManager",
+    "LiteChunk",
+    "LiteObject",
+    "LiteStream",
+    "AsyncLiteStream",
+    "tee",
+    "atee",
+    "StreamBroadcast",
+    "AsyncStreamBroadcast",
+    "Subscriber",
+    "AsyncSubscriber",
 ]
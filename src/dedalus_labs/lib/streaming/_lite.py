@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from types import TracebackType
+from typing import Any, Dict, Generic, TypeVar, Iterator, AsyncIterator, cast
+from typing_extensions import Self
+
+import httpx
+
+from ..._models import construct_type
+from ..._streaming import Stream, AsyncStream, ServerSentEvent
+
+_T = TypeVar("_T")
+
+
+class LiteObject:
+    """Read-only attribute view over one decoded JSON object.
+
+    Attribute names match the model fields, so `chunk.choices[0].delta.content`
+    reads the same as on a full `ChatCompletionChunk`. Nested objects are wrapped
+    on access and fields the server omitted read as `None`.
+    """
+
+    __slots__ = ("_data",)
+
+    _data: Dict[str, Any]
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        object.__setattr__(self, "_data", data)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            value = self._data[name]
+        except KeyError:
+            if name.startswith("__"):
+                raise AttributeError(name) from None
+            return None
+        return _wrap(value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, LiteObject) and other._data == self._data
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The underlying JSON object; treat it as read-only."""
+        return self._data
+
+
+class LiteChunk(LiteObject, Generic[_T]):
+    """A stream chunk kept as decoded JSON until `to_model()` is called."""
+
+    __slots__ = ("_cast_to", "_model")
+
+    _cast_to: type[_T]
+
+    def __init__(self, data: Dict[str, Any], cast_to: type[_T]) -> None:
+        super().__init__(data)
+        object.__setattr__(self, "_cast_to", cast_to)
+
+    def to_model(self) -> _T:
+        """The full pydantic model for this chunk, built on first call."""
+        try:
+            return cast(_T, object.__getattribute__(self, "_model"))
+        except AttributeError:
+            model = cast(_T, construct_type(type_=self._cast_to, value=self._data))
+            object.__setattr__(self, "_model", model)
+            return model
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, dict):
+        return LiteObject(cast(Dict[str, Any], value))
+    if isinstance(value, list) and value and isinstance(value[0], dict):
+        return [_wrap(item) for item in cast("list[Any]", value)]
+    return value
+
+
+class LiteStream(Generic[_T]):
+    """Iterates a `stream=True` response as `LiteChunk`s instead of pydantic models.
+
+    Skipping model construction for every event cuts allocation and GC work at
+    high chunk rates; call `chunk.to_model()` for the chunks that need it.
+
+    ```py
+    stream = LiteStream(raw_stream=client.chat.completions.create(..., stream=True))
+    for chunk in stream:
+        if chunk.choices:
+            print(chunk.choices[0].delta.content or "", end="")
+    ```
+    """
+
+    def __init__(self, *, raw_stream: Stream[_T]) -> None:
+        self._raw_stream = raw_stream
+        self._iterator = self.__stream__()
+
+    @property
+    def _response(self) -> httpx.Response:
+        # the raw stream swaps in a new response when it reconnects
+        return self._raw_stream.response
+
+    def __next__(self) -> LiteChunk[_T]:
+        return self._iterator.__next__()
+
+    def __iter__(self) -> Iterator[LiteChunk[_T]]:
+        for item in self._iterator:
+            yield item
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the response and release the connection.
+
+        Automatically called if the response body is read to completion.
+        """
+        self._response.close()
+
+    def __stream__(self) -> Iterator[LiteChunk[_T]]:
+        cast_to = self._raw_stream._cast_to
+        try:
+            for sse in self._raw_stream._iter_events():
+                if sse.data.startswith("[DONE]"):
+                    break
+                chunk = _build_chunk(sse, cast_to, self._raw_stream)
+                if chunk is not None:
+                    yield chunk
+        finally:
+            self._response.close()
+
+
+class AsyncLiteStream(Generic[_T]):
+    """Async counterpart of `LiteStream`."""
+
+    def __init__(self, *, raw_stream: AsyncStream[_T]) -> None:
+        self._raw_stream = raw_stream
+        self._iterator = self.__stream__()
+
+    @property
+    def _response(self) -> httpx.Response:
+        # the raw stream swaps in a new response when it reconnects
+        return self._raw_stream.response
+
+    async def __anext__(self) -> LiteChunk[_T]:
+        return await self._iterator.__anext__()
+
+    async def __aiter__(self) -> AsyncIterator[LiteChunk[_T]]:
+        async for item in self._iterator:
+            yield item
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the response and release the connection.
+
+        Automatically called if the response body is read to completion.
+        """
+        await self._response.aclose()
+
+    async def __stream__(self) -> AsyncIterator[LiteChunk[_T]]:
+        cast_to = self._raw_stream._cast_to
+        try:
+            async for sse in self._raw_stream._iter_events():
+                if sse.data.startswith("[DONE]"):
+                    break
+                chunk = _build_chunk(sse, cast_to, self._raw_stream)
+                if chunk is not None:
+                    yield chunk
+        finally:
+            await self._response.aclose()
+
+
+def _build_chunk(
+    sse: ServerSentEvent, cast_to: type[_T], raw_stream: Stream[_T] | AsyncStream[_T]
+) -> LiteChunk[_T] | None:
+    if sse.event == "error":
+        body: Any = sse.data
+        try:
+            body = sse.json()
+            err_msg = f"{body}"
+        except Exception:
+            err_msg = sse.data or f"Error code: {raw_stream.response.status_code}"
+        raise raw_stream._client._make_status_error(err_msg, body=body, response=raw_stream.response)
+
+    if sse.event is not None:
+        return None
+    data = sse.json()
+    if not isinstance(data, dict):
+        return None
+    return LiteChunk(cast(Dict[str, Any], data), cast_to)
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import queue
+import asyncio
+import inspect
+import threading
+from typing import Any, List, Tuple, Union, Generic, TypeVar, Iterable, Iterator, Optional, AsyncIterable, AsyncIterator
+from typing_extensions import Literal
+
+_T = TypeVar("_T")
+
+LagPolicy = Literal["block", "drop"]
+
+
+class _End:
+    pass
+
+
+class _Failure:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_END = _End()
+
+_Item = Union[_T, _End, _Failure]
+
+
+class StreamBroadcast(Generic[_T]):
+    """Fans one stream out to several subscribers, reading and parsing it only once.
+
+    Every subscriber receives the very same chunk objects. A background thread
+    reads the source into a bounded queue per subscriber; when a subscriber
+    falls `maxsize` chunks behind, `on_lag="block"` pauses the source until it
+    catches up and `on_lag="drop"` skips chunks for that subscriber only
+    (counted in `subscriber.dropped`).
+
+    Works with `Stream`, `ChatCompletionStream`, `LiteStream` or any iterable:
+
+    ```py
+    to_client, to_store = tee(client.chat.completions.create(..., stream=True), 2)
+    ```
+
+    With `"block"`, consume subscribers concurrently (one thread each), or keep
+    them within `maxsize` chunks of each other.
+    """
+
+    def __init__(self, source: Iterable[_T], *, maxsize: int = 64, on_lag: LagPolicy = "block") -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._source = source
+        self.maxsize = maxsize
+        self.on_lag = on_lag
+        self._subscribers: List[Subscriber[_T]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self) -> Subscriber[_T]:
+        with self._lock:
+            if self._thread is not None:
+                raise RuntimeError("subscribe() must be called before any subscriber starts iterating")
+            subscriber = Subscriber(self)
+            self._subscribers.append(subscriber)
+            return subscriber
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._pump, name="dedalus-stream-broadcast", daemon=True)
+                self._thread.start()
+
+    def _pump(self) -> None:
+        terminal: Union[_End, _Failure] = _END
+        try:
+            for item in self._source:
+                if not _any_open(self._subscribers):
+                    break
+                for subscriber in self._subscribers:
+                    subscriber._offer(item, block=self.on_lag == "block")
+            if not _any_open(self._subscribers):
+                _close_source(self._source)
+        except Exception as exc:
+            terminal = _Failure(exc)
+        except BaseException as exc:
+            terminal = _Failure(exc)
+            raise
+        finally:
+            for subscriber in self._subscribers:
+                subscriber._finish(terminal)
+
+
+class Subscriber(Generic[_T]):
+    """One consumer of a `StreamBroadcast`."""
+
+    dropped: int
+    """Chunks skipped because this subscriber lagged behind (`on_lag="drop"` only)."""
+
+    def __init__(self, broadcast: StreamBroadcast[_T]) -> None:
+        self._broadcast = broadcast
+        self._queue: queue.Queue[_Item[_T]] = queue.Queue(maxsize=broadcast.maxsize)
+        self.dropped = 0
+        self.closed = False
+
+    def __iter__(self) -> Iterator[_T]:
+        return self
+
+    def __next__(self) -> _T:
+        if self.closed:
+            raise StopIteration
+        self._broadcast._start()
+        item = self._queue.get()
+        if isinstance(item, _End):
+            self.closed = True
+            raise StopIteration
+        if isinstance(item, _Failure):
+            self.closed = True
+            raise item.error
+        return item
+
+    def close(self) -> None:
+        """Stop receiving chunks; the source is closed once every subscriber has closed."""
+        self.closed = True
+        _drain(self._queue)
+
+    def _offer(self, item: _Item[_T], *, block: bool) -> None:
+        if self.closed:
+            return
+        if block:
+            # `close()` drains the queue, which wakes this put
+            self._queue.put(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def _finish(self, terminal: Union[_End, _Failure]) -> None:
+        if self._broadcast.on_lag == "drop" or _aborted(terminal):
+            _put_terminal_nowait(self, terminal)
+        else:
+            self._offer(terminal, block=True)
+
+
+class AsyncStreamBroadcast(Generic[_T]):
+    """Async counterpart of `StreamBroadcast`; the source is read by a task on the running loop.
+
+    ```py
+    to_client, to_store, to_moderation = atee(await client.chat.completions.create(..., stream=True), 3)
+    ```
+    """
+
+    def __init__(self, source: AsyncIterable[_T], *, maxsize: int = 64, on_lag: LagPolicy = "block") -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._source = source
+        self.maxsize = maxsize
+        self.on_lag = on_lag
+        self._subscribers: List[AsyncSubscriber[_T]] = []
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def subscribe(self) -> AsyncSubscriber[_T]:
+        if self._task is not None:
+            raise RuntimeError("subscribe() must be called before any subscriber starts iterating")
+        subscriber = AsyncSubscriber(self)
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def _start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._pump())
+
+    async def _pump(self) -> None:
+        terminal: Union[_End, _Failure] = _END
+        try:
+            async for item in self._source:
+                if not _any_open(self._subscribers):
+                    break
+                for subscriber in self._subscribers:
+                    await subscriber._offer(item, block=self.on_lag == "block")
+            if not _any_open(self._subscribers):
+                await _aclose_source(self._source)
+        except Exception as exc:
+            terminal = _Failure(exc)
+        except BaseException as exc:
+            terminal = _Failure(exc)
+            raise
+        finally:
+            pending = list(self._subscribers)
+            try:
+                while pending:
+                    await pending[0]._finish(terminal)
+                    pending.pop(0)
+            finally:
+                # cancelled while waiting for room: the rest get the marker without waiting
+                for subscriber in pending:
+                    _put_terminal_nowait(subscriber, terminal)
+
+
+class AsyncSubscriber(Generic[_T]):
+    """One consumer of an `AsyncStreamBroadcast`."""
+
+    dropped: int
+    """Chunks skipped because this subscriber lagged behind (`on_lag="drop"` only)."""
+
+    def __init__(self, broadcast: AsyncStreamBroadcast[_T]) -> None:
+        self._broadcast = broadcast
+        self._queue: asyncio.Queue[_Item[_T]] = asyncio.Queue(maxsize=broadcast.maxsize)
+        self.dropped = 0
+        self.closed = False
+
+    def __aiter__(self) -> AsyncIterator[_T]:
+        return self
+
+    async def __anext__(self) -> _T:
+        if self.closed:
+            raise StopAsyncIteration
+        self._broadcast._start()
+        item = await self._queue.get()
+        if isinstance(item, _End):
+            self.closed = True
+            raise StopAsyncIteration
+        if isinstance(item, _Failure):
+            self.closed = True
+            raise item.error
+        return item
+
+    async def aclose(self) -> None:
+        """Stop receiving chunks; the source is closed once every subscriber has closed."""
+        self.closed = True
+        _drain(self._queue)
+
+    async def _offer(self, item: _Item[_T], *, block: bool) -> None:
+        if self.closed:
+            return
+        if block:
+            await self._queue.put(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def _finish(self, terminal: Union[_End, _Failure]) -> None:
+        if self._broadcast.on_lag == "drop" or _aborted(terminal):
+            _put_terminal_nowait(self, terminal)
+        else:
+            await self._offer(terminal, block=True)
+
+
+def tee(
+    source: Iterable[_T], n: int = 2, *, maxsize: int = 64, on_lag: LagPolicy = "block"
+) -> Tuple[Subscriber[_T], ...]:
+    """Split `source` into `n` subscribers that each see every chunk; see `StreamBroadcast`."""
+    broadcast = StreamBroadcast(source, maxsize=maxsize, on_lag=on_lag)
+    return tuple(broadcast.subscribe() for _ in range(n))
+
+
+def atee(
+    source: AsyncIterable[_T], n: int = 2, *, maxsize: int = 64, on_lag: LagPolicy = "block"
+) -> Tuple[AsyncSubscriber[_T], ...]:
+    """Async counterpart of `tee`; see `AsyncStreamBroadcast`."""
+    broadcast = AsyncStreamBroadcast(source, maxsize=maxsize, on_lag=on_lag)
+    return tuple(broadcast.subscribe() for _ in range(n))
+
+
+def _drain(q: Union[queue.Queue[Any], asyncio.Queue[Any]]) -> None:
+    try:
+        while True:
+            q.get_nowait()
+    except (queue.Empty, asyncio.QueueEmpty):
+        pass
+
+
+def _any_open(subscribers: Union[List[Subscriber[Any]], List[AsyncSubscriber[Any]]]) -> bool:
+    return any(not subscriber.closed for subscriber in subscribers)
+
+
+def _aborted(terminal: Union[_End, _Failure]) -> bool:
+    # cancellation, KeyboardInterrupt, ...: the pump is unwinding and must not wait on a reader
+    return isinstance(terminal, _Failure) and not isinstance(terminal.error, Exception)
+
+
+def _put_terminal_nowait(
+    subscriber: Union[Subscriber[Any], AsyncSubscriber[Any]], terminal: Union[_End, _Failure]
+) -> None:
+    """Queue the end marker without waiting, dropping the oldest chunks to make room."""
+    if subscriber.closed:
+        return
+    while True:
+        try:
+            subscriber._queue.put_nowait(terminal)
+            return
+        except (queue.Full, asyncio.QueueFull):
+            _evict_oldest(subscriber)
+
+
+def _evict_oldest(subscriber: Union[Subscriber[Any], AsyncSubscriber[Any]]) -> None:
+    try:
+        subscriber._queue.get_nowait()
+        subscriber.dropped += 1
+    except (queue.Empty, asyncio.QueueEmpty):
+        pass
+
+
+def _close_source(source: object) -> None:
+    close = getattr(source, "close", None)
+    if callable(close):
+        close()
+
+
+async def _aclose_source(source: object) -> None:
+    close = getattr(source, "aclose", None) or getattr(source, "close", None)
+    if callable(close):
+        result = close()
+        if inspect.isawaitable(result):
+            await result
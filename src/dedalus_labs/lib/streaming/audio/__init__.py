@@ -0,0 +1,17 @@
+from ._ring import AudioRingBuffer as AudioRingBuffer
+from ._speech import (
+    AudioSink as AudioSink,
+    SpeechAudioStream as SpeechAudioStream,
+    SpeechStreamManager as SpeechStreamManager,
+    AsyncSpeechAudioStream as AsyncSpeechAudioStream,
+    AsyncSpeechStreamManager as AsyncSpeechStreamManager,
+)
+
+__all__ = [
+    "AsyncSpeechAudioStream",
+    "AsyncSpeechStreamManager",
+    "AudioRingBuffer",
+    "AudioSink",
+    "SpeechAudioStream",
+    "SpeechStreamManager",
+]
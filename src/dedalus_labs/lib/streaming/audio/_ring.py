@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+
+class AudioRingBuffer:
+    """Fixed-size, thread-safe byte ring for handing streamed audio to a playback callback.
+
+    The backing `bytearray` is allocated once and reused for the whole stream.
+    `write()` blocks while the ring is full, which applies backpressure to the
+    network reader; `readinto()` never blocks, so it is safe to call from
+    real-time audio callbacks that must fill a device buffer on time.
+
+    ```py
+    ring = AudioRingBuffer(capacity=48_000)
+    threading.Thread(target=lambda: (stream.stream_to(ring), ring.close())).start()
+
+
+    def callback(outdata, frames, time, status):
+        n = ring.readinto(outdata)
+        outdata[n:] = b"\\x00" * (len(outdata) - n)
+    ```
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def eof(self) -> bool:
+        """`True` once the writer has closed the ring and every byte has been read."""
+        with self._cond:
+            return self._closed and self._size == 0
+
+    def __len__(self) -> int:
+        with self._cond:
+            return self._size
+
+    def write(self, data: bytes | bytearray | memoryview, timeout: Optional[float] = None) -> int:
+        """Copy `data` into the ring, waiting for the reader to make room as needed.
+
+        Returns the number of bytes written, which is less than `len(data)` only if
+        the ring was closed or `timeout` expired while waiting for space.
+        """
+        src = memoryview(data).cast("B")
+        written = 0
+        with self._cond:
+            while written < len(src):
+                if self._closed:
+                    break
+                if self._size == self._capacity:
+                    if not self._cond.wait(timeout):
+                        break
+                    continue
+
+                end = (self._start + self._size) % self._capacity
+                n = min(len(src) - written, self._capacity - self._size, self._capacity - end)
+                self._view[end : end + n] = src[written : written + n]
+                self._size += n
+                written += n
+                self._cond.notify_all()
+        return written
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """Copy up to `len(buffer)` buffered bytes into `buffer` without blocking."""
+        dst = memoryview(buffer).cast("B")
+        read = 0
+        with self._cond:
+            while read < len(dst) and self._size:
+                n = min(len(dst) - read, self._size, self._capacity - self._start)
+                dst[read : read + n] = self._view[self._start : self._start + n]
+                self._start = (self._start + n) % self._capacity
+                self._size -= n
+                read += n
+            if read:
+                self._cond.notify_all()
+        return read
+
+    def read(self, size: int = -1) -> bytes:
+        """Return up to `size` buffered bytes (everything buffered if negative) without blocking."""
+        with self._cond:
+            n = self._size if size < 0 else min(size, self._size)
+        out = bytearray(n)
+        return bytes(out[: self.readinto(out)])
+
+    def close(self) -> None:
+        """Signal that no more audio will be written; blocked writers return immediately."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
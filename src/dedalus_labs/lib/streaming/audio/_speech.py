@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import inspect
+import binascii
+from types import TracebackType
+from typing import Any, Dict, Callable, Optional, Awaitable, AsyncIterator, cast
+from typing_extensions import Self, Iterator, Protocol
+
+import httpx
+
+from ...._utils import consume_sync_iterator, consume_async_iterator
+from ...._streaming import Stream, AsyncStream
+
+
+class AudioSink(Protocol):
+    """Anything that accepts raw audio bytes: files, pipes, sockets, `AudioRingBuffer`..."""
+
+    def write(self, data: bytes, /) -> Any: ...
+
+
+class SpeechAudioStream:
+    """Iterator over the decoded audio of a `speech.create(stream_format="sse")` response.
+
+    Each `speech.audio.delta` event is base64-decoded and yielded as soon as it
+    arrives, so playback can begin on the first chunk.
+
+    ```py
+    with client.audio.speech.stream(model="gpt-4o-mini-tts", voice="alloy", input="Hi") as stream:
+        for chunk in stream:
+            player.write(chunk)
+    ```
+    """
+
+    usage: Optional[Dict[str, Any]]
+    """Token usage reported by the final `speech.audio.done` event, if any."""
+
+    def __init__(self, *, raw_stream: Stream[object]) -> None:
+        self._raw_stream = raw_stream
+        self._iterator = self.__stream__()
+        self.usage = None
+
+    @property
+    def _response(self) -> httpx.Response:
+        # the raw stream swaps in a new response when it reconnects
+        return self._raw_stream.response
+
+    def __next__(self) -> bytes:
+        return self._iterator.__next__()
+
+    def __iter__(self) -> Iterator[bytes]:
+        for item in self._iterator:
+            yield item
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the response and release the connection.
+
+        Automatically called if the response body is read to completion.
+        """
+        self._response.close()
+
+    def until_done(self) -> Self:
+        """Blocks until the stream has been consumed."""
+        consume_sync_iterator(self)
+        return self
+
+    def stream_to(self, sink: AudioSink) -> int:
+        """Write every decoded chunk to `sink` as it arrives and return the number of bytes written."""
+        written = 0
+        for chunk in self:
+            sink.write(chunk)
+            written += len(chunk)
+        return written
+
+    def read(self) -> bytes:
+        """Consume the stream and return the complete audio."""
+        buf = bytearray()
+        for chunk in self:
+            buf += chunk
+        return bytes(buf)
+
+    def __stream__(self) -> Iterator[bytes]:
+        for event in self._raw_stream:
+            chunk = _handle_event(event, self._set_usage)
+            if chunk:
+                yield chunk
+
+    def _set_usage(self, usage: Dict[str, Any]) -> None:
+        self.usage = usage
+
+
+class SpeechStreamManager:
+    """Context manager over a `SpeechAudioStream` that is returned by `.stream()`.
+
+    This context manager ensures the response cannot be leaked if you don't read
+    the stream to completion.
+    """
+
+    def __init__(self, api_request: Callable[[], Stream[object]]) -> None:
+        self.__stream: SpeechAudioStream | None = None
+        self.__api_request = api_request
+
+    def __enter__(self) -> SpeechAudioStream:
+        self.__stream = SpeechAudioStream(raw_stream=self.__api_request())
+        return self.__stream
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self.__stream is not None:
+            self.__stream.close()
+
+
+class AsyncSpeechAudioStream:
+    """Async iterator over the decoded audio of a `speech.create(stream_format="sse")` response."""
+
+    usage: Optional[Dict[str, Any]]
+    """Token usage reported by the final `speech.audio.done` event, if any."""
+
+    def __init__(self, *, raw_stream: AsyncStream[object]) -> None:
+        self._raw_stream = raw_stream
+        self._iterator = self.__stream__()
+        self.usage = None
+
+    @property
+    def _response(self) -> httpx.Response:
+        # the raw stream swaps in a new response when it reconnects
+        return self._raw_stream.response
+
+    async def __anext__(self) -> bytes:
+        return await self._iterator.__anext__()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for item in self._iterator:
+            yield item
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the response and release the connection.
+
+        Automatically called if the response body is read to completion.
+        """
+        await self._response.aclose()
+
+    async def until_done(self) -> Self:
+        """Waits until the stream has been consumed."""
+        await consume_async_iterator(self)
+        return self
+
+    async def stream_to(self, sink: AudioSink) -> int:
+        """Write every decoded chunk to `sink` as it arrives and return the number of bytes written.
+
+        `sink.write` may be a coroutine function (e.g. an async pipe or websocket
+        wrapper); its result is awaited before the next chunk is written.
+        """
+        written = 0
+        async for chunk in self:
+            result = sink.write(chunk)
+            if inspect.isawaitable(result):
+                await result
+            written += len(chunk)
+        return written
+
+    async def read(self) -> bytes:
+        """Consume the stream and return the complete audio."""
+        buf = bytearray()
+        async for chunk in self:
+            buf += chunk
+        return bytes(buf)
+
+    async def __stream__(self) -> AsyncIterator[bytes]:
+        async for event in self._raw_stream:
+            chunk = _handle_event(event, self._set_usage)
+            if chunk:
+                yield chunk
+
+    def _set_usage(self, usage: Dict[str, Any]) -> None:
+        self.usage = usage
+
+
+class AsyncSpeechStreamManager:
+    """Context manager over an `AsyncSpeechAudioStream` that is returned by `.stream()`.
+
+    This context manager ensures the response cannot be leaked if you don't read
+    the stream to completion.
+    """
+
+    def __init__(self, api_request: Awaitable[AsyncStream[object]]) -> None:
+        self.__stream: AsyncSpeechAudioStream | None = None
+        self.__api_request = api_request
+
+    async def __aenter__(self) -> AsyncSpeechAudioStream:
+        self.__stream = AsyncSpeechAudioStream(raw_stream=await self.__api_request)
+        return self.__stream
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self.__stream is not None:
+            await self.__stream.close()
+
+
+def _handle_event(event: object, on_usage: Callable[[Dict[str, Any]], None]) -> bytes | None:
+    if not isinstance(event, dict):
+        return None
+
+    data = cast(Dict[str, Any], event)
+    type_ = data.get("type")
+    if type_ == "speech.audio.delta":
+        audio = data.get("audio")
+        # a2b_base64 accepts the ASCII str directly, skipping an intermediate encode
+        return binascii.a2b_base64(audio) if audio else None
+    if type_ == "speech.audio.done" and isinstance(data.get("usage"), dict):
+        on_usage(data["usage"])
+    return None
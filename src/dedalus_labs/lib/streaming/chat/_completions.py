@@ -5,6 +5,7 @@ from types import TracebackType
 from typing import TYPE_CHECKING, Any, Dict, Generic, Callable, Iterable, Awaitable, AsyncIterator, cast
 from typing_extensions import Self, Iterator, assert_never
 
+import httpx
 from jiter import from_json
 
 from ._types import ParsedChoiceSnapshot, ParsedChatCompletionSnapshot, ParsedChatCompletionMessageSnapshot
@@ -65,10 +66,14 @@ class ChatCompletionStream(Generic[ResponseFormatT]):
         input_tools: Iterable[InputTool] | Omit,
     ) -> None:
         self._raw_stream = raw_stream
-        self._response = raw_stream.response
         self._iterator = self.__stream__()
         self._state = ChatCompletionStreamState(response_format=response_format, input_tools=input_tools)
 
+    @property
+    def _response(self) -> httpx.Response:
+        # the raw stream swaps in a new response when it reconnects
+        return self._raw_stream.response
+
     def __next__(self) -> ChatCompletionStreamEvent[ResponseFormatT]:
         return self._iterator.__next__()
 
@@ -188,10 +193,14 @@ class AsyncChatCompletionStream(Generic[ResponseFormatT]):
         input_tools: Iterable[InputTool] | Omit,
     ) -> None:
         self._raw_stream = raw_stream
-        self._response = raw_stream.response
         self._iterator = self.__stream__()
         self._state = ChatCompletionStreamState(response_format=response_format, input_tools=input_tools)
 
+    @property
+    def _response(self) -> httpx.Response:
+        # the raw stream swaps in a new response when it reconnects
+        return self._raw_stream.response
+
     async def __anext__(self) -> ChatCompletionStreamEvent[ResponseFormatT]:
         return await self._iterator.__anext__()
 
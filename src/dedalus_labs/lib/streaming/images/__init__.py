@@ -0,0 +1,21 @@
+from ._events import (
+    ImageGenerationStreamEvent as ImageGenerationStreamEvent,
+    ImageGenerationCompletedEvent as ImageGenerationCompletedEvent,
+    ImageGenerationPartialImageEvent as ImageGenerationPartialImageEvent,
+)
+from ._images import (
+    ImageGenerationStream as ImageGenerationStream,
+    AsyncImageGenerationStream as AsyncImageGenerationStream,
+    ImageGenerationStreamManager as ImageGenerationStreamManager,
+    AsyncImageGenerationStreamManager as AsyncImageGenerationStreamManager,
+)
+
+__all__ = [
+    "AsyncImageGenerationStream",
+    "AsyncImageGenerationStreamManager",
+    "ImageGenerationCompletedEvent",
+    "ImageGenerationPartialImageEvent",
+    "ImageGenerationStream",
+    "ImageGenerationStreamEvent",
+    "ImageGenerationStreamManager",
+]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+from typing import IO, Any, Dict, Union, Optional
+from dataclasses import dataclass
+from typing_extensions import Literal, TypeAlias
+
+from ...images._payload import Base64Payload
+
+
+@dataclass
+class _ImageEvent:
+    image: Base64Payload
+    """The image data. Nothing is decoded until `image.to_bytes()` or `save()` is called."""
+
+    created_at: Optional[int] = None
+    size: Optional[str] = None
+    quality: Optional[str] = None
+    background: Optional[str] = None
+    output_format: Optional[str] = None
+
+    @property
+    def b64_json(self) -> str:
+        """The base64 text, materialised on demand for compatibility with `Image.b64_json`."""
+        return self.image.to_str()
+
+    def to_bytes(self) -> bytes:
+        return self.image.to_bytes()
+
+    def save(self, file: Union[str, "os.PathLike[str]", IO[bytes]]) -> int:
+        """Decode the image straight into `file`, returning the number of bytes written."""
+        return self.image.save(file)
+
+
+@dataclass
+class ImageGenerationPartialImageEvent(_ImageEvent):
+    """Emitted for each progressively refined preview when `partial_images` is set."""
+
+    type: Literal["image_generation.partial_image"] = "image_generation.partial_image"
+
+    partial_image_index: int = 0
+
+
+@dataclass
+class ImageGenerationCompletedEvent(_ImageEvent):
+    """Emitted once with the finished image."""
+
+    type: Literal["image_generation.completed"] = "image_generation.completed"
+
+    usage: Optional[Dict[str, Any]] = None
+
+
+ImageGenerationStreamEvent: TypeAlias = Union[ImageGenerationPartialImageEvent, ImageGenerationCompletedEvent]
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import os
+from types import TracebackType
+from typing import IO, Any, Dict, List, Tuple, Union, Callable, Optional, Awaitable, AsyncIterator, cast
+from typing_extensions import Self, Iterator
+
+import httpx
+
+from ._events import ImageGenerationStreamEvent, ImageGenerationCompletedEvent, ImageGenerationPartialImageEvent
+from ...._utils import consume_sync_iterator, consume_async_iterator
+from ...._streaming import Stream, AsyncStream
+from ...images._payload import Base64Payload, parse_b64_json
+
+_EVENT_BOUNDARIES = (b"\r\n\r\n", b"\n\n", b"\r\r")
+
+
+class ImageGenerationStream:
+    """Iterator over the events of an `images.generate(stream=True)` response.
+
+    Server-sent events are framed directly on the raw bytes so that each
+    `b64_json` payload stays a `memoryview` into the response body until it is
+    accessed; the JSON parser only ever sees the surrounding metadata. This
+    bypasses the raw stream's event decoding, so a dropped image stream is not
+    resumed, even with `stream_reconnects`.
+
+    ```py
+    with client.images.stream(prompt="A lighthouse", partial_images=2) as stream:
+        for event in stream:
+            event.save(f"preview-{event.type}.png")
+    ```
+    """
+
+    def __init__(self, *, raw_stream: Stream[object]) -> None:
+        self._raw_stream = raw_stream
+        self._iterator = self.__stream__()
+        self._final: Optional[ImageGenerationCompletedEvent] = None
+
+    @property
+    def _response(self) -> httpx.Response:
+        return self._raw_stream.response
+
+    def __next__(self) -> ImageGenerationStreamEvent:
+        return self._iterator.__next__()
+
+    def __iter__(self) -> Iterator[ImageGenerationStreamEvent]:
+        for item in self._iterator:
+            yield item
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the response and release the connection.
+
+        Automatically called if the response body is read to completion.
+        """
+        self._response.close()
+
+    def until_done(self) -> Self:
+        """Blocks until the stream has been consumed."""
+        consume_sync_iterator(self)
+        return self
+
+    def get_final_image(self) -> ImageGenerationCompletedEvent:
+        """Waits until the stream has been read to completion and returns the finished image."""
+        self.until_done()
+        return _require_final(self._final)
+
+    def save(self, file: Union[str, "os.PathLike[str]", IO[bytes]]) -> int:
+        """Waits for the finished image and decodes it straight into `file`."""
+        return self.get_final_image().save(file)
+
+    def __stream__(self) -> Iterator[ImageGenerationStreamEvent]:
+        parser = _FrameParser()
+        try:
+            for chunk in self._response.iter_bytes():
+                for frame in parser.feed(chunk):
+                    event = self._handle_frame(frame)
+                    if event is not None:
+                        yield event
+            for frame in parser.flush():
+                event = self._handle_frame(frame)
+                if event is not None:
+                    yield event
+        finally:
+            self._response.close()
+
+    def _handle_frame(self, frame: bytes) -> ImageGenerationStreamEvent | None:
+        event = _build_event(frame, self._raw_stream._client._make_status_error, self._response)
+        if isinstance(event, ImageGenerationCompletedEvent):
+            self._final = event
+        return event
+
+
+class ImageGenerationStreamManager:
+    """Context manager over an `ImageGenerationStream` that is returned by `.stream()`.
+
+    This context manager ensures the response cannot be leaked if you don't read
+    the stream to completion.
+    """
+
+    def __init__(self, api_request: Callable[[], Stream[object]]) -> None:
+        self.__stream: ImageGenerationStream | None = None
+        self.__api_request = api_request
+
+    def __enter__(self) -> ImageGenerationStream:
+        self.__stream = ImageGenerationStream(raw_stream=self.__api_request())
+        return self.__stream
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self.__stream is not None:
+            self.__stream.close()
+
+
+class AsyncImageGenerationStream:
+    """Async iterator over the events of an `images.generate(stream=True)` response."""
+
+    def __init__(self, *, raw_stream: AsyncStream[object]) -> None:
+        self._raw_stream = raw_stream
+        self._iterator = self.__stream__()
+        self._final: Optional[ImageGenerationCompletedEvent] = None
+
+    @property
+    def _response(self) -> httpx.Response:
+        return self._raw_stream.response
+
+    async def __anext__(self) -> ImageGenerationStreamEvent:
+        return await self._iterator.__anext__()
+
+    async def __aiter__(self) -> AsyncIterator[ImageGenerationStreamEvent]:
+        async for item in self._iterator:
+            yield item
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the response and release the connection.
+
+        Automatically called if the response body is read to completion.
+        """
+        await self._response.aclose()
+
+    async def until_done(self) -> Self:
+        """Waits until the stream has been consumed."""
+        await consume_async_iterator(self)
+        return self
+
+    async def get_final_image(self) -> ImageGenerationCompletedEvent:
+        """Waits until the stream has been read to completion and returns the finished image."""
+        await self.until_done()
+        return _require_final(self._final)
+
+    async def save(self, file: Union[str, "os.PathLike[str]", IO[bytes]]) -> int:
+        """Waits for the finished image and decodes it straight into `file`."""
+        return (await self.get_final_image()).save(file)
+
+    async def __stream__(self) -> AsyncIterator[ImageGenerationStreamEvent]:
+        parser = _FrameParser()
+        try:
+            async for chunk in self._response.aiter_bytes():
+                for frame in parser.feed(chunk):
+                    event = self._handle_frame(frame)
+                    if event is not None:
+                        yield event
+            for frame in parser.flush():
+                event = self._handle_frame(frame)
+                if event is not None:
+                    yield event
+        finally:
+            await self._response.aclose()
+
+    def _handle_frame(self, frame: bytes) -> ImageGenerationStreamEvent | None:
+        event = _build_event(frame, self._raw_stream._client._make_status_error, self._response)
+        if isinstance(event, ImageGenerationCompletedEvent):
+            self._final = event
+        return event
+
+
+class AsyncImageGenerationStreamManager:
+    """Context manager over an `AsyncImageGenerationStream` that is returned by `.stream()`.
+
+    This context manager ensures the response cannot be leaked if you don't read
+    the stream to completion.
+    """
+
+    def __init__(self, api_request: Awaitable[AsyncStream[object]]) -> None:
+        self.__stream: AsyncImageGenerationStream | None = None
+        self.__api_request = api_request
+
+    async def __aenter__(self) -> AsyncImageGenerationStream:
+        self.__stream = AsyncImageGenerationStream(raw_stream=await self.__api_request)
+        return self.__stream
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self.__stream is not None:
+            await self.__stream.close()
+
+
+class _FrameParser:
+    """Splits a byte stream into raw SSE frames without decoding them to `str`.
+
+    Unlike `SSEDecoder`, partial frames accumulate in a single `bytearray`, so a
+    multi-megabyte `data:` line arriving in many network reads is not re-copied
+    on every read.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._scanned = 0
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        self._buf += chunk
+        frames: List[bytes] = []
+        while True:
+            boundary = self._find_boundary()
+            if boundary is None:
+                # a boundary is at most 4 bytes, so only the tail needs rescanning next time
+                self._scanned = max(len(self._buf) - 3, 0)
+                return frames
+            end, length = boundary
+            frames.append(bytes(self._buf[:end]))
+            del self._buf[: end + length]
+            self._scanned = 0
+
+    def flush(self) -> List[bytes]:
+        frame, self._buf = bytes(self._buf), bytearray()
+        return [frame] if frame.strip() else []
+
+    def _find_boundary(self) -> Optional[Tuple[int, int]]:
+        best: Optional[Tuple[int, int]] = None
+        for sep in _EVENT_BOUNDARIES:
+            pos = self._buf.find(sep, self._scanned)
+            if pos != -1 and (best is None or pos < best[0]):
+                best = (pos, len(sep))
+        return best
+
+
+def _parse_frame(frame: bytes) -> Tuple[Optional[str], Optional[memoryview]]:
+    view = memoryview(frame)
+    event: Optional[str] = None
+    data: List[memoryview] = []
+
+    start = 0
+    n = len(frame)
+    while start < n:
+        newline = frame.find(b"\n", start)
+        if newline == -1:
+            newline = n
+        end = newline - 1 if newline > start and frame[newline - 1] == ord("\r") else newline
+        line_start, start = start, newline + 1
+
+        if end == line_start or frame[line_start] == ord(":"):
+            continue
+
+        colon = frame.find(b":", line_start, end)
+        if colon == -1:
+            field, value = frame[line_start:end], view[end:end]
+        else:
+            field = frame[line_start:colon]
+            value_start = colon + 1
+            if value_start < end and frame[value_start] == ord(" "):
+                value_start += 1
+            value = view[value_start:end]
+
+        if field == b"event":
+            event = str(value, "utf-8")
+        elif field == b"data":
+            data.append(value)
+
+    if not data:
+        return event, None
+    if len(data) == 1:
+        return event, data[0]
+    return event, memoryview(b"\n".join(data))
+
+
+def _build_event(
+    frame: bytes,
+    make_status_error: Callable[..., Exception],
+    response: Any,
+) -> ImageGenerationStreamEvent | None:
+    event_name, data = _parse_frame(frame)
+    if data is None or bytes(data[:6]) == b"[DONE]":
+        return None
+
+    payload = parse_b64_json(data)
+    if not isinstance(payload, dict):
+        return None
+    body = cast(Dict[str, Any], payload)
+    type_ = body.get("type") or event_name
+
+    if event_name == "error" or type_ == "error":
+        raise make_status_error(f"{body}", body=body, response=response)
+
+    image = body.get("b64_json")
+    if not isinstance(image, Base64Payload):
+        return None
+
+    common: Dict[str, Any] = {
+        "image": image,
+        "created_at": body.get("created_at"),
+        "size": body.get("size"),
+        "quality": body.get("quality"),
+        "background": body.get("background"),
+        "output_format": body.get("output_format"),
+    }
+    if type_ == "image_generation.partial_image":
+        return ImageGenerationPartialImageEvent(partial_image_index=body.get("partial_image_index") or 0, **common)
+    if type_ == "image_generation.completed":
+        return ImageGenerationCompletedEvent(usage=body.get("usage"), **common)
+    return None
+
+
+def _require_final(final: Optional[ImageGenerationCompletedEvent]) -> ImageGenerationCompletedEvent:
+    if final is None:
+        raise RuntimeError("The stream ended without an `image_generation.completed` event")
+    return final
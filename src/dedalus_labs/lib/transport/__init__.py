@@ -0,0 +1,38 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""HTTP transport helpers: HTTP/2, concurrency-sized pools, pool statistics, connection warm-up and transfer sizes."""
+
+from ._pool import (
+    PoolStats,
+    PooledHttpxClient,
+    PooledAsyncHttpxClient,
+    pool_stats,
+    pool_limits,
+)
+from ._warmup import (
+    KeepAlive,
+    WarmupResult,
+    AsyncKeepAlive,
+    warmup,
+    async_warmup,
+)
+from ..._transfer import ACCEPT_ENCODING, TransferStats
+
+__all__ = [
+    "ACCEPT_ENCODING",
+    "AsyncKeepAlive",
+    "KeepAlive",
+    "PoolStats",
+    "PooledAsyncHttpxClient",
+    "PooledHttpxClient",
+    "pool_limits",
+    "pool_stats",
+    "TransferStats",
+    "WarmupResult",
+    "async_warmup",
+    "warmup",
+]
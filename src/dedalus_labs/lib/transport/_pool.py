@@ -0,0 +1,259 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Connection pools sized for a target concurrency, with optional HTTP/2.
+
+The SDK's default pool allows 100 connections but keeps only 20 alive. Under many
+concurrent long-lived SSE streams, that means constant reconnects and TLS
+handshakes. These clients keep a connection alive for every concurrent request.
+With `http2=True` they multiplex many streams over a few connections instead:
+
+```py
+client = AsyncDedalus(http_client=PooledAsyncHttpxClient(concurrency=500, http2=True))
+...
+client.pool_stats()  # PoolStats(connections=6, in_use=5, idle=1, waiting=0, ...)
+```
+
+HTTP/2 needs the `h2` package (`pip install httpx[http2]`).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
+from dataclasses import dataclass
+
+import httpx
+import httpcore
+
+from ..._base_client import DefaultHttpxClient, DefaultAsyncHttpxClient
+
+if TYPE_CHECKING:
+    from ..._client import Dedalus, AsyncDedalus
+
+__all__ = [
+    "PoolStats",
+    "PooledAsyncHttpxClient",
+    "PooledHttpxClient",
+    "pool_limits",
+    "pool_stats",
+]
+
+_KEEPALIVE_EXPIRY = 60.0
+
+
+@dataclass
+class PoolStats:
+    """Snapshot of a client's connection pool."""
+
+    connections: int = 0
+    in_use: int = 0
+    """Connections currently carrying at least one request."""
+    idle: int = 0
+    http2_connections: int = 0
+    waiting: int = 0
+    """Requests queued for a free connection."""
+    requests: int = 0
+    """Requests sent since the client was created."""
+    connections_opened: int = 0
+    """TCP connects since the client was created; each one is a new connection."""
+    tls_handshakes: int = 0
+
+
+def pool_limits(concurrency: int) -> httpx.Limits:
+    """Limits that keep a connection alive for each of `concurrency` simultaneous requests.
+
+    Under HTTP/2 the pool opens only as many connections as the server's stream
+    limit requires, so the same limits serve as a ceiling for HTTP/1.1 fallback.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    return httpx.Limits(
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+        keepalive_expiry=_KEEPALIVE_EXPIRY,
+    )
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.waiting = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+
+    def count(self, event: str) -> None:
+        with self._lock:
+            if event == "connection.connect_tcp.complete":
+                self.connections_opened += 1
+            elif event == "connection.start_tls.complete":
+                self.tls_handshakes += 1
+
+    def request(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.waiting += 1
+
+    def assigned(self) -> None:
+        """The request got a connection (or gave up waiting for one)."""
+        with self._lock:
+            self.waiting -= 1
+
+
+class _InstrumentedTransport(httpx.HTTPTransport):
+    """`httpx.HTTPTransport` that counts requests, connects and TLS handshakes via httpcore's trace hook."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.counters = _Counters()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.counters.request()
+        trace = _Trace(self.counters, request.extensions.get("trace"))
+        request.extensions["trace"] = trace
+        try:
+            return super().handle_request(request)
+        finally:
+            trace.done()
+
+
+class _AsyncInstrumentedTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.counters = _Counters()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.counters.request()
+        trace = _AsyncTrace(self.counters, request.extensions.get("trace"))
+        request.extensions["trace"] = trace
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            trace.done()
+
+
+class _Waiting:
+    """Tracks one request until the pool hands it a connection.
+
+    httpcore's pool emits no trace events itself, so the first connection or
+    protocol event for a request means it is no longer queued.
+    """
+
+    def __init__(self, counters: _Counters, previous: Any) -> None:
+        # a resumed stream re-sends its request with the first attempt's extensions
+        if isinstance(previous, _Waiting):
+            previous = previous.previous
+        self.previous = previous
+        self._counters = counters
+        self._waiting = True
+
+    def done(self) -> None:
+        if self._waiting:
+            self._waiting = False
+            self._counters.assigned()
+
+
+class _Trace(_Waiting):
+    """httpcore `trace` extension that feeds `_Counters`, then calls the caller's own hook."""
+
+    def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        self.done()
+        self._counters.count(event)
+        if self.previous is not None:
+            self.previous(event, info)
+
+
+class _AsyncTrace(_Waiting):
+    async def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        self.done()
+        self._counters.count(event)
+        if self.previous is not None:
+            await self.previous(event, info)
+
+
+def _transport_kwargs(kwargs: Dict[str, Any], http2: bool) -> Dict[str, Any]:
+    transport_kwargs: Dict[str, Any] = {"http2": http2, "limits": kwargs["limits"]}
+    for key in ("verify", "cert", "trust_env"):
+        if key in kwargs:
+            transport_kwargs[key] = kwargs[key]
+    return transport_kwargs
+
+
+class PooledHttpxClient(DefaultHttpxClient):
+    """`DefaultHttpxClient` with a pool sized for `concurrency` and optional HTTP/2.
+
+    Pass it as `Dedalus(http_client=...)`; explicit `limits` or `transport` take precedence.
+    """
+
+    def __init__(self, *, concurrency: int = 100, http2: bool = False, **kwargs: Any) -> None:
+        kwargs.setdefault("limits", pool_limits(concurrency))
+        if "transport" not in kwargs:
+            kwargs["transport"] = _InstrumentedTransport(**_transport_kwargs(kwargs, http2))
+        super().__init__(http2=http2, **kwargs)
+
+
+class PooledAsyncHttpxClient(DefaultAsyncHttpxClient):
+    """Async counterpart of `PooledHttpxClient`, for `AsyncDedalus(http_client=...)`."""
+
+    def __init__(self, *, concurrency: int = 100, http2: bool = False, **kwargs: Any) -> None:
+        kwargs.setdefault("limits", pool_limits(concurrency))
+        if "transport" not in kwargs:
+            kwargs["transport"] = _AsyncInstrumentedTransport(**_transport_kwargs(kwargs, http2))
+        super().__init__(http2=http2, **kwargs)
+
+
+def pool_stats(client: Union[Dedalus, AsyncDedalus, httpx.Client, httpx.AsyncClient]) -> PoolStats:
+    """Current pool statistics for an SDK client or the httpx client behind it.
+
+    Connection counts come from the public `connections` list of the transport's
+    httpcore pool and are zero for transports without one. Request, waiting,
+    connect and handshake counters need a `PooledHttpxClient` /
+    `PooledAsyncHttpxClient` and are zero otherwise.
+    """
+    http_client = client if isinstance(client, (httpx.Client, httpx.AsyncClient)) else client._client
+    transport = http_client._transport
+    stats = PoolStats()
+
+    counters = getattr(transport, "counters", None)
+    if isinstance(counters, _Counters):
+        stats.requests = counters.requests
+        stats.waiting = counters.waiting
+        stats.connections_opened = counters.connections_opened
+        stats.tls_handshakes = counters.tls_handshakes
+
+    for connection in _pool_connections(transport):
+        stats.connections += 1
+        if connection.is_idle():
+            stats.idle += 1
+        elif not connection.is_closed():
+            stats.in_use += 1
+        if "HTTP/2" in connection.info():
+            stats.http2_connections += 1
+    return stats
+
+
+def _httpcore_pool(transport: object) -> Union[httpcore.ConnectionPool, httpcore.AsyncConnectionPool, None]:
+    # httpx doesn't expose its transport's pool, so check the attribute is the
+    # httpcore pool we expect and report nothing rather than fail if it changes
+    pool = getattr(transport, "_pool", None)
+    if not isinstance(pool, (httpcore.ConnectionPool, httpcore.AsyncConnectionPool)):
+        return None
+    return pool
+
+
+def _pool_connections(transport: object) -> List[httpcore.ConnectionInterface]:
+    pool = _httpcore_pool(transport)
+    if pool is None:
+        return []
+    return list(pool.connections)  # type: ignore[arg-type]
+
+
+def _keepalive_expiry(client: Union[Dedalus, AsyncDedalus]) -> Optional[float]:
+    """Seconds an idle connection stays in the client's pool, or `None` if unknown or unlimited."""
+    pool = _httpcore_pool(client._client._transport)
+    expiry = getattr(pool, "_keepalive_expiry", None)
+    return float(expiry) if isinstance(expiry, (int, float)) else None
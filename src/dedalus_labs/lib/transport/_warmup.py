@@ -0,0 +1,245 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Connection pre-warming and keep-alive pings.
+
+`warmup` opens `n_connections` pooled connections to `base_url` (and one to
+`as_base_url`, which serves the JWKS used for credential encryption) so the first
+real request does not pay DNS, TCP and TLS setup. `KeepAlive` repeats that on a
+background thread (or task) so idle connections are reused before the server's
+idle timeout closes them:
+
+```py
+client = Dedalus(http_client=PooledHttpxClient(concurrency=32))
+client.warmup(8)
+with client.keep_alive(8, interval=20):
+    ...
+```
+
+The pool must keep connections longer than `interval`; the SDK's default
+client expires idle connections after 5 seconds, `PooledHttpxClient` after 60.
+Without an explicit `interval`, `KeepAlive` pings at half the pool's expiry.
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import threading
+from typing import TYPE_CHECKING, List, Tuple, Union, Optional
+from dataclasses import field, dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from ._pool import pool_stats, _keepalive_expiry
+
+if TYPE_CHECKING:
+    from ..._client import Dedalus, AsyncDedalus
+
+__all__ = [
+    "AsyncKeepAlive",
+    "KeepAlive",
+    "WarmupResult",
+    "async_warmup",
+    "warmup",
+]
+
+_WARMUP_TIMEOUT = 5.0
+# used when the pool's keep-alive expiry can't be read, or connections never expire
+_KEEPALIVE_INTERVAL = 20.0
+
+
+@dataclass
+class WarmupResult:
+    """Outcome of one `warmup` call."""
+
+    ok: int = 0
+    """Warm-up requests that got any HTTP response; the status code doesn't matter."""
+    errors: List[Exception] = field(default_factory=list)
+    connections: int = 0
+    """Connections in the pool afterwards."""
+    elapsed: float = 0.0
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+
+def _targets(client: Union[Dedalus, AsyncDedalus], n_connections: int) -> List[Tuple[str, str]]:
+    if n_connections < 1:
+        raise ValueError("n_connections must be at least 1")
+    # unauthenticated requests: connection setup is the point, the response is discarded
+    targets = [("HEAD", str(client.base_url))] * n_connections
+    if client.as_base_url:
+        targets.append(("GET", f"{client.as_base_url.rstrip('/')}/.well-known/jwks.json"))
+    return targets
+
+
+def warmup(client: Dedalus, n_connections: int = 4, *, timeout: float = _WARMUP_TIMEOUT) -> WarmupResult:
+    """Open `n_connections` concurrent connections to `client.base_url` and one to `client.as_base_url`.
+
+    Requests are sent concurrently so HTTP/1.1 pools open one connection each;
+    an HTTP/2 pool may multiplex them over fewer. Errors are collected, not raised.
+    """
+    targets = _targets(client, n_connections)
+    result = WarmupResult()
+    started = time.monotonic()
+
+    def send(target: Tuple[str, str]) -> Optional[Exception]:
+        method, url = target
+        try:
+            client._client.request(method, url, timeout=timeout)
+        except httpx.HTTPError as exc:
+            return exc
+        return None
+
+    with ThreadPoolExecutor(max_workers=len(targets), thread_name_prefix="dedalus-warmup") as executor:
+        for error in executor.map(send, targets):
+            _record(result, error)
+
+    result.connections = pool_stats(client).connections
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+async def async_warmup(
+    client: AsyncDedalus, n_connections: int = 4, *, timeout: float = _WARMUP_TIMEOUT
+) -> WarmupResult:
+    """Async counterpart of `warmup`."""
+    targets = _targets(client, n_connections)
+    result = WarmupResult()
+    started = time.monotonic()
+
+    async def send(target: Tuple[str, str]) -> Optional[Exception]:
+        method, url = target
+        try:
+            await client._client.request(method, url, timeout=timeout)
+        except httpx.HTTPError as exc:
+            return exc
+        return None
+
+    for error in await asyncio.gather(*(send(target) for target in targets)):
+        _record(result, error)
+
+    result.connections = pool_stats(client).connections
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+def _record(result: WarmupResult, error: Optional[Exception]) -> None:
+    if error is None:
+        result.ok += 1
+    else:
+        result.errors.append(error)
+
+
+def _keepalive_interval(client: Union[Dedalus, AsyncDedalus], interval: Optional[float]) -> float:
+    expiry = _keepalive_expiry(client)
+    if interval is None:
+        return expiry / 2 if expiry else _KEEPALIVE_INTERVAL
+    if interval <= 0:
+        raise ValueError("interval must be positive")
+    if expiry is not None and interval >= expiry:
+        raise ValueError(
+            f"interval ({interval}s) must be shorter than the pool's keepalive_expiry ({expiry}s), "
+            "or idle connections expire between pings; pass a shorter interval or a pool with "
+            "a longer expiry such as `PooledHttpxClient`"
+        )
+    return interval
+
+
+class KeepAlive:
+    """Re-runs `warmup` every `interval` seconds on a daemon thread until stopped.
+
+    Pinging reuses idle connections, which resets their keep-alive timers, and
+    reopens any the server has closed in the meantime. `interval` defaults to half
+    the pool's keep-alive expiry and must be shorter than it. A failed round is
+    recorded in `last` rather than stopping the thread.
+    """
+
+    def __init__(self, client: Dedalus, n_connections: int = 4, *, interval: Optional[float] = None) -> None:
+        self.client = client
+        self.n_connections = n_connections
+        self.interval = _keepalive_interval(client, interval)
+        self.last: Optional[WarmupResult] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> KeepAlive:
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="dedalus-keepalive", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.last = warmup(self.client, self.n_connections)
+            except Exception as exc:
+                # e.g. the client was closed under us; keep pinging until stopped
+                self.last = WarmupResult(errors=[exc])
+
+    def __enter__(self) -> KeepAlive:
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+
+class AsyncKeepAlive:
+    """Async counterpart of `KeepAlive`, running as a task on the current event loop."""
+
+    def __init__(self, client: AsyncDedalus, n_connections: int = 4, *, interval: Optional[float] = None) -> None:
+        self.client = client
+        self.n_connections = n_connections
+        self.interval = _keepalive_interval(client, interval)
+        self.last: Optional[WarmupResult] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> AsyncKeepAlive:
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.last = await async_warmup(self.client, self.n_connections)
+            except Exception as exc:
+                self.last = WarmupResult(errors=[exc])
+
+    async def __aenter__(self) -> AsyncKeepAlive:
+        return self.start()
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.stop()
@@ -0,0 +1,117 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Bookkeeping shared by the resumable bulk helpers (`generate_images_bulk`, `run_many`)."""
+
+from __future__ import annotations
+
+import os
+import json
+import hashlib
+import threading
+from typing import Any, Dict, List, Union, Mapping
+from pathlib import Path
+
+__all__ = [
+    "Manifest",
+    "latency_percentile",
+    "request_id",
+]
+
+
+class Manifest:
+    """Append-only JSONL record of finished items; items recorded as `ok` are skipped on re-runs.
+
+    Each entry is written and flushed as its own line, so an interrupted job
+    leaves at most a torn final line, which `finished()` ignores.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def finished(self) -> set[str]:
+        """Ids of the items recorded as `ok`."""
+        finished: set[str] = set()
+        if not self.path.exists():
+            return finished
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # a torn final line from an interrupted run
+                    continue
+                if entry.get("status") == "ok":
+                    finished.add(entry["id"])
+        return finished
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        """Append one entry; blocking, so call it from a worker thread on an event loop."""
+        line = json.dumps(entry, default=str) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as log:
+            log.write(line)
+
+
+def request_id(request: Mapping[str, Any]) -> str:
+    """A stable id for a request without one, derived from its parameters.
+
+    Files (bytes, paths and seekable file objects) are identified by a digest
+    of their content, models by their fields and functions by their qualified
+    name. Any other object that isn't a JSON value contributes only its type. Blocking for paths and
+    file objects, which are read in full.
+
+    Raises:
+        ValueError: A file object can't be rewound after reading, so the request
+            needs an explicit id.
+    """
+    canonical = json.dumps(_canonical(request), sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _canonical(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Mapping):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"sha256": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, os.PathLike):
+        with open(value, "rb") as f:
+            return {"sha256": _file_digest(f)}
+    if hasattr(value, "read"):
+        if not (hasattr(value, "seekable") and value.seekable()):
+            raise ValueError(f"can't derive an id from the unseekable file {value!r}; give the item an explicit `id`")
+        position = value.tell()
+        try:
+            return {"sha256": _file_digest(value)}
+        finally:
+            value.seek(position)
+    if hasattr(value, "model_dump"):
+        return _canonical(value.model_dump())
+    if callable(value) and hasattr(value, "__qualname__"):
+        # the repr of a function includes its address, which changes every run
+        return f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+    return f"<{type(value).__module__}.{type(value).__qualname__}>"
+
+
+def _file_digest(f: Any) -> str:
+    digest = hashlib.sha256()
+    while True:
+        chunk = f.read(1024 * 1024)
+        if not chunk:
+            return digest.hexdigest()
+        digest.update(chunk if isinstance(chunk, bytes) else str(chunk).encode("utf-8"))
+
+
+def latency_percentile(latencies: List[float], percentile: float) -> float:
+    if not latencies:
+        return 0.0
+    ordered = sorted(latencies)
+    index = min(len(ordered) - 1, max(0, round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
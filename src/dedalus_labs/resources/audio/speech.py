@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import Union
+from functools import partial
 from typing_extensions import Literal
 
 import httpx
@@ -21,8 +22,10 @@ from ..._response import (
     async_to_custom_raw_response_wrapper,
     async_to_custom_streamed_response_wrapper,
 )
+from ..._streaming import Stream, AsyncStream
 from ...types.audio import speech_create_params
 from ..._base_client import make_request_options
+from ...lib.streaming.audio import SpeechStreamManager, AsyncSpeechStreamManager
 
 __all__ = ["SpeechResource", "AsyncSpeechResource"]
 
@@ -135,6 +138,69 @@ class SpeechResource(SyncAPIResource):
             cast_to=BinaryAPIResponse,
         )
 
+    def stream(
+        self,
+        *,
+        input: str,
+        model: Union[str, Literal["tts-1", "tts-1-hd", "gpt-4o-mini-tts"]],
+        voice: Union[
+            str, Literal["alloy", "ash", "ballad", "coral", "echo", "sage", "shimmer", "verse", "marin", "cedar"]
+        ],
+        instructions: str | Omit = omit,
+        response_format: Literal["mp3", "opus", "aac", "flac", "wav", "pcm"] | Omit = omit,
+        speed: float | Omit = omit,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+        idempotency_key: str | None = None,
+    ) -> SpeechStreamManager:
+        """
+        Stream speech audio as it is generated.
+
+        Requests `stream_format="sse"` and returns a context manager over a
+        `SpeechAudioStream` that yields decoded audio bytes for every
+        `speech.audio.delta` event, so playback can begin on the first chunk.
+        Use `response_format="pcm"` for the lowest latency to first sample.
+
+        ```py
+        with client.audio.speech.stream(model="gpt-4o-mini-tts", voice="alloy", input="Hello") as stream:
+            stream.stream_to(ring_buffer)
+        ```
+        """
+        extra_headers = {
+            "Accept": "text/event-stream",
+            "X-Stainless-Helper-Method": "audio.speech.stream",
+            **(extra_headers or {}),
+        }
+        api_request = partial(
+            self._post,
+            "/v1/audio/speech",
+            body=maybe_transform(
+                {
+                    "input": input,
+                    "model": model,
+                    "voice": voice,
+                    "instructions": instructions,
+                    "response_format": response_format,
+                    "speed": speed,
+                    "stream_format": "sse",
+                },
+                speech_create_params.SpeechCreateParams,
+            ),
+            options=make_request_options(
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                idempotency_key=idempotency_key,
+            ),
+            cast_to=object,
+            stream=True,
+            stream_cls=Stream[object],
+        )
+        return SpeechStreamManager(api_request)
+
 
 class AsyncSpeechResource(AsyncAPIResource):
     @cached_property
@@ -244,6 +310,56 @@ class AsyncSpeechResource(AsyncAPIResource):
             cast_to=AsyncBinaryAPIResponse,
         )
 
+    def stream(
+        self,
+        *,
+        input: str,
+        model: Union[str, Literal["tts-1", "tts-1-hd", "gpt-4o-mini-tts"]],
+        voice: Union[
+            str, Literal["alloy", "ash", "ballad", "coral", "echo", "sage", "shimmer", "verse", "marin", "cedar"]
+        ],
+        instructions: str | Omit = omit,
+        response_format: Literal["mp3", "opus", "aac", "flac", "wav", "pcm"] | Omit = omit,
+        speed: float | Omit = omit,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+        idempotency_key: str | None = None,
+    ) -> AsyncSpeechStreamManager:
+        """Async variant of `stream()` with identical semantics."""
+        extra_headers = {
+            "Accept": "text/event-stream",
+            "X-Stainless-Helper-Method": "audio.speech.stream",
+            **(extra_headers or {}),
+        }
+        api_request = self._post(
+            "/v1/audio/speech",
+            body=maybe_transform(
+                {
+                    "input": input,
+                    "model": model,
+                    "voice": voice,
+                    "instructions": instructions,
+                    "response_format": response_format,
+                    "speed": speed,
+                    "stream_format": "sse",
+                },
+                speech_create_params.SpeechCreateParams,
+            ),
+            options=make_request_options(
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                idempotency_key=idempotency_key,
+            ),
+            cast_to=object,
+            stream=True,
+            stream_cls=AsyncStream[object],
+        )
+        return AsyncSpeechStreamManager(api_request)
+
 
 class SpeechResourceWithRawResponse:
     def __init__(self, speech: SpeechResource) -> None:
@@ -16,9 +16,14 @@ from ..._response import (
     async_to_raw_response_wrapper,
     async_to_streamed_response_wrapper,
 )
+from ...lib.audio import transcribe_long_audio
 from ...types.audio import transcription_create_params
 from ..._base_client import make_request_options
-from ...types.audio.transcription_create_response import TranscriptionCreateResponse
+from ...lib.audio._chunking import AudioInput
+from ...types.audio.transcription_create_response import (
+    TranscriptionCreateResponse,
+    CreateTranscriptionResponseVerboseJSON,
+)
 
 __all__ = ["TranscriptionsResource", "AsyncTranscriptionsResource"]
 
@@ -218,6 +223,49 @@ class AsyncTranscriptionsResource(AsyncAPIResource):
             ),
         )
 
+    async def create_chunked(
+        self,
+        *,
+        file: AudioInput,
+        model: str,
+        segment_seconds: float = 600.0,
+        overlap_seconds: float = 2.0,
+        max_concurrency: int = 8,
+        sample_rate: Optional[int] = None,
+        language: Optional[str] | Omit = omit,
+        prompt: Optional[str] | Omit = omit,
+        temperature: Optional[float] | Omit = omit,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> CreateTranscriptionResponseVerboseJSON:
+        """
+        Transcribe a long WAV / raw PCM recording as concurrent overlapping segments.
+
+        The audio is split locally at quiet points near every `segment_seconds`,
+        each segment is transcribed with `response_format="verbose_json"`, and the
+        results are stitched back into a single transcript whose segment and word
+        timestamps refer to the original recording. `sample_rate` is required for
+        raw PCM input.
+        """
+        return await transcribe_long_audio(
+            self,
+            file,
+            model=model,
+            segment_seconds=segment_seconds,
+            overlap_seconds=overlap_seconds,
+            max_concurrency=max_concurrency,
+            sample_rate=sample_rate,
+            language=language,
+            prompt=prompt,
+            temperature=temperature,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            extra_body=extra_body,
+            timeout=timeout,
+        )
+
 
 class TranscriptionsResourceWithRawResponse:
     def __init__(self, transcriptions: TranscriptionsResource) -> None:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Mapping, Optional, cast
+import os
+from typing import Any, Union, Mapping, Iterable, Optional, cast
+from functools import partial
 from typing_extensions import Literal
 
 import httpx
@@ -18,7 +20,11 @@ from .._response import (
     async_to_raw_response_wrapper,
     async_to_streamed_response_wrapper,
 )
+from .._streaming import Stream, AsyncStream
 from .._base_client import make_request_options
+from ..lib.images._bulk import BulkItem, BulkImageStats, generate_images_bulk
+from ..lib.images._lazy import ImagesResourceWithLazyPayloads, AsyncImagesResourceWithLazyPayloads
+from ..lib.streaming.images import ImageGenerationStreamManager, AsyncImageGenerationStreamManager
 from ..types.images_response import ImagesResponse
 
 __all__ = ["ImagesResource", "AsyncImagesResource"]
@@ -44,6 +50,18 @@ class ImagesResource(SyncAPIResource):
         """
         return ImagesResourceWithStreamingResponse(self)
 
+    @cached_property
+    def with_lazy_payloads(self) -> ImagesResourceWithLazyPayloads:
+        """
+        A variant of these methods that returns a `LazyImagesResponse`, whose image
+        data stays as undecoded slices of the response body until accessed through
+        `image.to_bytes()` or `image.save(path)`.
+
+        Useful for large `n` / high-resolution requests, where holding every image as
+        a base64 `str` roughly doubles peak memory.
+        """
+        return ImagesResourceWithLazyPayloads(self)
+
     def create_variation(
         self,
         *,
@@ -318,6 +336,83 @@ class ImagesResource(SyncAPIResource):
             cast_to=ImagesResponse,
         )
 
+    def stream(
+        self,
+        *,
+        prompt: str,
+        background: Optional[Literal["transparent", "opaque", "auto"]] | Omit = omit,
+        model: Optional[str] | Omit = omit,
+        moderation: Optional[Literal["low", "auto"]] | Omit = omit,
+        n: Optional[int] | Omit = omit,
+        output_compression: Optional[int] | Omit = omit,
+        output_format: Optional[Literal["png", "jpeg", "webp"]] | Omit = omit,
+        partial_images: Optional[int] | Omit = omit,
+        quality: Optional[Literal["auto", "high", "medium", "low", "hd", "standard"]] | Omit = omit,
+        size: Optional[
+            Literal["256x256", "512x512", "1024x1024", "1536x1024", "1024x1536", "1792x1024", "1024x1792", "auto"]
+        ]
+        | Omit = omit,
+        user: Optional[str] | Omit = omit,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+        idempotency_key: str | None = None,
+    ) -> ImageGenerationStreamManager:
+        """
+        Generate an image in streaming mode, yielding partial previews as they arrive.
+
+        Returns a context manager over an `ImageGenerationStream` of
+        `image_generation.partial_image` and `image_generation.completed` events.
+        Image payloads are kept as undecoded base64 views until accessed and can be
+        written straight to disk with `event.save(path)`.
+
+        ```py
+        with client.images.stream(prompt="A lighthouse", partial_images=2) as stream:
+            for event in stream:
+                if event.type == "image_generation.partial_image":
+                    event.save(f"preview-{event.partial_image_index}.png")
+            stream.save("final.png")
+        ```
+        """
+        extra_headers = {
+            "Accept": "text/event-stream",
+            "X-Stainless-Helper-Method": "images.stream",
+            **(extra_headers or {}),
+        }
+        api_request = partial(
+            self._post,
+            "/v1/images/generations",
+            body=maybe_transform(
+                {
+                    "prompt": prompt,
+                    "background": background,
+                    "model": model,
+                    "moderation": moderation,
+                    "n": n,
+                    "output_compression": output_compression,
+                    "output_format": output_format,
+                    "partial_images": partial_images,
+                    "quality": quality,
+                    "size": size,
+                    "stream": True,
+                    "user": user,
+                },
+                image_generate_params.ImageGenerateParams,
+            ),
+            options=make_request_options(
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                idempotency_key=idempotency_key,
+            ),
+            cast_to=object,
+            stream=True,
+            stream_cls=Stream[object],
+        )
+        return ImageGenerationStreamManager(api_request)
+
 
 class AsyncImagesResource(AsyncAPIResource):
     @cached_property
@@ -339,6 +434,18 @@ class AsyncImagesResource(AsyncAPIResource):
         """
         return AsyncImagesResourceWithStreamingResponse(self)
 
+    @cached_property
+    def with_lazy_payloads(self) -> AsyncImagesResourceWithLazyPayloads:
+        """
+        A variant of these methods that returns a `LazyImagesResponse`, whose image
+        data stays as undecoded slices of the response body until accessed through
+        `image.to_bytes()` or `image.save(path)`.
+
+        Useful for large `n` / high-resolution requests, where holding every image as
+        a base64 `str` roughly doubles peak memory.
+        """
+        return AsyncImagesResourceWithLazyPayloads(self)
+
     async def create_variation(
         self,
         *,
@@ -613,6 +720,110 @@ class AsyncImagesResource(AsyncAPIResource):
             cast_to=ImagesResponse,
         )
 
+    def stream(
+        self,
+        *,
+        prompt: str,
+        background: Optional[Literal["transparent", "opaque", "auto"]] | Omit = omit,
+        model: Optional[str] | Omit = omit,
+        moderation: Optional[Literal["low", "auto"]] | Omit = omit,
+        n: Optional[int] | Omit = omit,
+        output_compression: Optional[int] | Omit = omit,
+        output_format: Optional[Literal["png", "jpeg", "webp"]] | Omit = omit,
+        partial_images: Optional[int] | Omit = omit,
+        quality: Optional[Literal["auto", "high", "medium", "low", "hd", "standard"]] | Omit = omit,
+        size: Optional[
+            Literal["256x256", "512x512", "1024x1024", "1536x1024", "1024x1536", "1792x1024", "1024x1792", "auto"]
+        ]
+        | Omit = omit,
+        user: Optional[str] | Omit = omit,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+        idempotency_key: str | None = None,
+    ) -> AsyncImageGenerationStreamManager:
+        """Async variant of `stream()` with identical semantics."""
+        extra_headers = {
+            "Accept": "text/event-stream",
+            "X-Stainless-Helper-Method": "images.stream",
+            **(extra_headers or {}),
+        }
+        api_request = self._post(
+            "/v1/images/generations",
+            body=maybe_transform(
+                {
+                    "prompt": prompt,
+                    "background": background,
+                    "model": model,
+                    "moderation": moderation,
+                    "n": n,
+                    "output_compression": output_compression,
+                    "output_format": output_format,
+                    "partial_images": partial_images,
+                    "quality": quality,
+                    "size": size,
+                    "stream": True,
+                    "user": user,
+                },
+                image_generate_params.ImageGenerateParams,
+            ),
+            options=make_request_options(
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                idempotency_key=idempotency_key,
+            ),
+            cast_to=object,
+            stream=True,
+            stream_cls=AsyncStream[object],
+        )
+        return AsyncImageGenerationStreamManager(api_request)
+
+    async def generate_bulk(
+        self,
+        items: Iterable[BulkItem],
+        *,
+        output_dir: Union[str, os.PathLike[str]],
+        method: Literal["generate", "edit", "create_variation"] = "generate",
+        manifest: Union[str, os.PathLike[str], None] = None,
+        max_concurrency: int = 8,
+        requests_per_minute: Union[float, Mapping[str, float], None] = None,
+        **params: Any,
+    ) -> BulkImageStats:
+        """
+        Run `generate` (or `edit` / `create_variation`) for many requests at bounded concurrency.
+
+        Each item is a prompt or a mapping of keyword arguments for `method`, with
+        `params` applied as defaults. Decoded images are written to `output_dir` as
+        each request completes and recorded in a JSONL manifest, so re-running an
+        interrupted job skips the items that already succeeded.
+
+        `requests_per_minute` is either a single limit or a per-model mapping.
+
+        ```py
+        stats = await client.images.generate_bulk(
+            ({"id": sku, "prompt": f"Product photo of {name}"} for sku, name in catalog),
+            output_dir="renders/",
+            model="openai/gpt-image-1",
+            max_concurrency=16,
+            requests_per_minute={"openai/gpt-image-1": 50},
+        )
+        print(stats.images_per_second, stats.latency_percentile(95))
+        ```
+        """
+        return await generate_images_bulk(
+            self,
+            items,
+            output_dir=output_dir,
+            method=method,
+            manifest=manifest,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            **params,
+        )
+
 
 class ImagesResourceWithRawResponse:
     def __init__(self, images: ImagesResource) -> None:
@@ -15,6 +15,7 @@ from .._response import (
 )
 from ..types.model import Model
 from .._base_client import make_request_options
+from ..lib.models._catalog import ModelCatalog, AsyncModelCatalog
 from ..types.list_models_response import ListModelsResponse
 
 __all__ = ["ModelsResource", "AsyncModelsResource"]
@@ -40,6 +41,17 @@ class ModelsResource(SyncAPIResource):
         """
         return ModelsResourceWithStreamingResponse(self)
 
+    @cached_property
+    def catalog(self) -> ModelCatalog:
+        """
+        A cached, indexed view of `list()` shared by this client.
+
+        Lookups by id, provider or capability are served from memory; once the
+        cached list is older than its TTL it is refreshed in the background with a
+        conditional request, so callers never wait on it after the first load.
+        """
+        return ModelCatalog(self)
+
     def retrieve(
         self,
         model_id: str,
@@ -154,6 +166,17 @@ class AsyncModelsResource(AsyncAPIResource):
         """
         return AsyncModelsResourceWithStreamingResponse(self)
 
+    @cached_property
+    def catalog(self) -> AsyncModelCatalog:
+        """
+        A cached, indexed view of `list()` shared by this client.
+
+        Lookups by id, provider or capability are served from memory; once the
+        cached list is older than its TTL it is refreshed in the background with a
+        conditional request, so callers never wait on it after the first load.
+        """
+        return AsyncModelCatalog(self)
+
     async def retrieve(
         self,
         model_id: str,
@@ -1,9 +1,13 @@
 # File generated from our OpenAPI spec by Stainless. See CONTRIBUTING.md for details.
 
-from typing import Optional
+import os
+from typing import IO, TYPE_CHECKING, Union, Optional
 
 from .._models import BaseModel
 
+if TYPE_CHECKING:
+    from ..lib.images._payload import Base64Payload
+
 __all__ = ["Image"]
 
 
@@ -18,3 +22,21 @@ class Image(BaseModel):
 
     url: Optional[str] = None
     """URL of the generated image (if response_format=url)"""
+
+    def to_bytes(self) -> bytes:
+        """Decode the base64 image data.
+
+        Raises `ValueError` if the image was returned as a URL instead.
+        """
+        return self._b64_payload().to_bytes()
+
+    def save(self, file: Union[str, "os.PathLike[str]", IO[bytes]]) -> int:
+        """Decode the image data straight into `file`, returning the number of bytes written."""
+        return self._b64_payload().save(file)
+
+    def _b64_payload(self) -> "Base64Payload":
+        from ..lib.images._payload import Base64Payload
+
+        if self.b64_json is None:
+            raise ValueError("This image has no `b64_json` data; request it with `response_format='b64_json'`")
+        return Base64Payload.from_str(self.b64_json)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+
+def completion(
+    content: Optional[str] = None,
+    *,
+    tool_calls: Optional[List[Dict[str, Any]]] = None,
+    model: str = "openai/gpt-4o-mini",
+    usage: Optional[Dict[str, Any]] = None,
+    **extra: Any,
+) -> httpx.Response:
+    """A non-streaming `chat.completions` response with a single assistant message."""
+    message: Dict[str, Any] = {"role": "assistant", "content": content}
+    if tool_calls is not None:
+        message["tool_calls"] = tool_calls
+    body: Dict[str, Any] = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 1,
+        "model": model,
+        "choices": [{"index": 0, "finish_reason": "stop", "message": message}],
+        **extra,
+    }
+    if usage is not None:
+        body["usage"] = usage
+    return httpx.Response(200, json=body)
+
+
+def tool_call(id: str, name: str, arguments: str = "{}") -> Dict[str, Any]:
+    """A function tool call as it appears in an assistant message."""
+    return {"id": id, "type": "function", "function": {"name": name, "arguments": arguments}}
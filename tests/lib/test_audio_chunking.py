@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import io
+import re
+import json
+import wave
+import array
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import AsyncDedalus
+from dedalus_labs.lib.audio import AudioChunk, split_audio, stitch_transcriptions
+from dedalus_labs.types.audio.transcription_create_response import CreateTranscriptionResponseVerboseJSON
+
+from ..conftest import base_url
+
+RATE = 8000
+
+
+def make_wav(seconds: float, *, silences: List[float] = [], rate: int = RATE) -> bytes:
+    """A loud square wave with 100ms of silence centred on each of `silences`."""
+    samples = array.array("h")
+    for i in range(int(seconds * rate)):
+        t = i / rate
+        quiet = any(abs(t - s) < 0.05 for s in silences)
+        samples.append(0 if quiet else (8000 if (i // 20) % 2 else -8000))
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+    return buf.getvalue()
+
+
+def wav_seconds(data: bytes) -> float:
+    with wave.open(io.BytesIO(data), "rb") as w:
+        return w.getnframes() / w.getframerate()
+
+
+def test_split_snaps_to_silence() -> None:
+    chunks = split_audio(make_wav(10, silences=[3.6, 7.3]), segment_seconds=3, overlap_seconds=0.5, search_seconds=1)
+
+    assert [c.index for c in chunks] == [0, 1, 2]
+    assert chunks[0].start == 0
+    assert chunks[1].start == pytest.approx(3.6, abs=0.05)
+    assert chunks[2].start == pytest.approx(7.3, abs=0.05)
+    assert chunks[-1].end == pytest.approx(10)
+
+    for prev, nxt in zip(chunks, chunks[1:]):
+        assert prev.end == nxt.start
+        assert prev.overlap == pytest.approx(0.5)
+    assert chunks[-1].overlap == 0
+    assert wav_seconds(chunks[0].data) == pytest.approx(chunks[0].end + 0.5)
+
+
+def test_split_raw_pcm() -> None:
+    with wave.open(io.BytesIO(make_wav(2)), "rb") as w:
+        pcm = w.readframes(w.getnframes())
+
+    chunks = split_audio(pcm, sample_rate=RATE, segment_seconds=1, overlap_seconds=0, search_seconds=0)
+    assert len(chunks) == 2
+    assert sum(wav_seconds(c.data) for c in chunks) == pytest.approx(2)
+
+    with pytest.raises(ValueError, match="sample_rate"):
+        split_audio(pcm)
+
+
+def test_split_short_audio_is_single_chunk() -> None:
+    chunks = split_audio(make_wav(1), segment_seconds=600)
+    assert len(chunks) == 1
+    assert chunks[0].overlap == 0
+    assert chunks[0].filename == "chunk-0000.wav"
+
+
+def _verbose(segments: List[Dict[str, Any]], text: str = "") -> CreateTranscriptionResponseVerboseJSON:
+    return CreateTranscriptionResponseVerboseJSON.construct(
+        duration=0.0,
+        language="en",
+        text=text,
+        segments=[
+            dict(
+                id=i,
+                avg_logprob=0.0,
+                compression_ratio=1.0,
+                no_speech_prob=0.0,
+                seek=0,
+                temperature=0.0,
+                tokens=[],
+                **s,
+            )
+            for i, s in enumerate(segments)
+        ],
+    )
+
+
+def test_stitch_offsets_and_dedupes_overlap() -> None:
+    chunks = [
+        AudioChunk(index=0, start=0.0, end=10.0, overlap=2.0, data=b""),
+        AudioChunk(index=1, start=10.0, end=18.0, overlap=0.0, data=b""),
+    ]
+    first = _verbose(
+        [
+            {"start": 0.0, "end": 5.0, "text": " hello"},
+            {"start": 5.0, "end": 9.0, "text": " there"},
+            # heard again by the second chunk, midpoint falls past the boundary
+            {"start": 9.5, "end": 11.5, "text": " general"},
+        ]
+    )
+    second = _verbose(
+        [
+            {"start": 0.0, "end": 1.5, "text": " general"},
+            {"start": 1.5, "end": 8.0, "text": " kenobi"},
+        ]
+    )
+
+    result = stitch_transcriptions(chunks, [first, second])
+
+    assert result.text == "hello there general kenobi"
+    assert result.duration == 18.0
+    assert result.language == "en"
+    assert result.segments is not None
+    assert [(s.id, s.start, s.end) for s in result.segments] == [
+        (0, 0.0, 5.0),
+        (1, 5.0, 9.0),
+        (2, 10.0, 11.5),
+        (3, 11.5, 18.0),
+    ]
+
+
+async def test_create_chunked(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    def respond(request: httpx.Request) -> httpx.Response:
+        match = re.search(rb'filename="chunk-(\d+)\.wav"', request.content)
+        assert match is not None
+        index = int(match.group(1))
+        assert b"verbose_json" in request.content
+        body = {
+            "duration": 1.0,
+            "language": "en",
+            "text": f"part {index}",
+            "segments": [
+                {
+                    "id": 0,
+                    "avg_logprob": 0.0,
+                    "compression_ratio": 1.0,
+                    "end": 0.5,
+                    "no_speech_prob": 0.0,
+                    "seek": 0,
+                    "start": 0.0,
+                    "temperature": 0.0,
+                    "text": f"part {index}",
+                    "tokens": [],
+                }
+            ],
+        }
+        return httpx.Response(200, content=json.dumps(body), headers={"content-type": "application/json"})
+
+    respx_mock.post(f"{base_url}/v1/audio/transcriptions").mock(side_effect=respond)
+
+    result = await async_client.audio.transcriptions.create_chunked(
+        file=make_wav(3.2, silences=[1.0, 2.0, 3.0]),
+        model="openai/whisper-1",
+        segment_seconds=1,
+        overlap_seconds=0.2,
+        max_concurrency=2,
+    )
+
+    assert result.text == "part 0 part 1 part 2"
+    assert result.segments is not None
+    assert [s.start for s in result.segments] == pytest.approx([0.0, 1.0, 2.0], abs=0.05)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import io
+import json
+import base64
+import asyncio
+from typing import Any, Dict, List
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import AsyncDedalus
+from dedalus_labs.lib.utils._manifest import request_id
+
+from ..conftest import base_url
+
+
+def image_response(request: httpx.Request) -> httpx.Response:
+    prompt = json.loads(request.content)["prompt"]
+    body = {"created": 1, "data": [{"b64_json": base64.b64encode(prompt.encode()).decode()}]}
+    return httpx.Response(200, json=body)
+
+
+async def test_generate_bulk_writes_files_and_manifest(
+    async_client: AsyncDedalus, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    in_flight: List[int] = [0, 0]
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return image_response(request)
+
+    route = respx_mock.post(f"{base_url}/v1/images/generations").mock(side_effect=respond)
+    items = [{"id": f"item-{i}", "prompt": f"prompt {i}"} for i in range(10)]
+
+    stats = await async_client.images.generate_bulk(
+        items, output_dir=tmp_path, model="openai/gpt-image-1", max_concurrency=3
+    )
+
+    assert route.call_count == 10
+    assert in_flight[1] <= 3
+    assert stats.succeeded == 10
+    assert stats.images == 10
+    assert stats.failed == stats.skipped == 0
+    assert len(stats.latencies) == 10
+    assert stats.images_per_second > 0
+    assert (tmp_path / "item-4-0.png").read_bytes() == b"prompt 4"
+    assert json.loads(route.calls[0].request.content)["model"] == "openai/gpt-image-1"
+
+    entries = [json.loads(line) for line in (tmp_path / "manifest.jsonl").read_text().splitlines()]
+    assert sorted(e["id"] for e in entries) == sorted(i["id"] for i in items)
+    assert all(e["status"] == "ok" for e in entries)
+
+
+async def test_generate_bulk_resumes_from_manifest(
+    async_client: AsyncDedalus, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    calls: List[str] = []
+    rejected: List[str] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        prompt = json.loads(request.content)["prompt"]
+        calls.append(prompt)
+        if prompt == "bad" and not rejected:
+            rejected.append(prompt)
+            return httpx.Response(400, json={"error": {"message": "rejected"}})
+        return image_response(request)
+
+    respx_mock.post(f"{base_url}/v1/images/generations").mock(side_effect=respond)
+    prompts = ["a", "b", "bad"]
+
+    first = await async_client.images.generate_bulk(prompts, output_dir=tmp_path, max_concurrency=1)
+    assert (first.succeeded, first.failed) == (2, 1)
+
+    calls.clear()
+    second = await async_client.images.generate_bulk(prompts, output_dir=tmp_path, max_concurrency=1)
+    assert calls == ["bad"]
+    assert (second.succeeded, second.failed, second.skipped) == (1, 0, 2)
+
+
+async def test_generate_bulk_keeps_files_inside_output_dir(
+    async_client: AsyncDedalus, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    respx_mock.post(f"{base_url}/v1/images/generations").mock(side_effect=image_response)
+    out = tmp_path / "out"
+    items = [{"id": "../escape", "prompt": "x"}, {"id": "/abs/path", "prompt": "y"}, {"id": "..", "prompt": "z"}]
+
+    stats = await async_client.images.generate_bulk(items, output_dir=out, max_concurrency=1)
+
+    assert stats.succeeded == 3
+    assert {p.name for p in out.iterdir()} == {"_.._escape-0.png", "_abs_path-0.png", "_..-0.png", "manifest.jsonl"}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out"]
+    entries = [json.loads(line) for line in (out / "manifest.jsonl").read_text().splitlines()]
+    assert [e["id"] for e in entries] == ["../escape", "/abs/path", ".."]
+
+
+async def test_generate_bulk_hashes_files_by_content(
+    async_client: AsyncDedalus, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    route = respx_mock.post(f"{base_url}/v1/images/edits").mock(
+        return_value=httpx.Response(200, json={"created": 1, "data": [{"b64_json": base64.b64encode(b"x").decode()}]})
+    )
+    photo = tmp_path / "photo.png"
+    photo.write_bytes(b"first")
+
+    def items() -> List[Dict[str, Any]]:
+        # fresh file objects every run: their reprs differ, their content doesn't
+        return [{"image": io.BytesIO(b"cat"), "prompt": "hat"}, {"image": photo, "prompt": "hat"}]
+
+    out = tmp_path / "out"
+    first = await async_client.images.generate_bulk(items(), output_dir=out, method="edit", max_concurrency=1)
+    assert first.succeeded == 2
+    assert route.call_count == 2
+    assert b"cat" in route.calls[0].request.content  # hashing didn't consume the file
+
+    second = await async_client.images.generate_bulk(items(), output_dir=out, method="edit", max_concurrency=1)
+    assert (second.skipped, route.call_count) == (2, 2)
+
+    # same path, new content: a different request
+    photo.write_bytes(b"second")
+    third = await async_client.images.generate_bulk(items(), output_dir=out, method="edit", max_concurrency=1)
+    assert (third.skipped, third.succeeded, route.call_count) == (1, 1, 3)
+
+
+def test_request_id_needs_an_explicit_id_for_unseekable_files() -> None:
+    class Pipe(io.RawIOBase):
+        def readable(self) -> bool:
+            return True
+
+    assert request_id({"image": b"cat"}) == request_id({"image": bytearray(b"cat")})
+    assert request_id({"image": b"cat"}) != request_id({"image": b"dog"})
+    with pytest.raises(ValueError, match="explicit `id`"):
+        request_id({"image": Pipe()})
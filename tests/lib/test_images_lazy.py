@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+import base64
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.types import Image
+from dedalus_labs.lib.images import LazyImage, Base64Payload, LazyImagesResponse
+
+from ..conftest import base_url
+
+IMAGES = [b"\x89PNG one" * 1000, b"\x89PNG two" * 2000]
+
+
+def images_body() -> bytes:
+    return json.dumps(
+        {
+            "created": 1700000000,
+            "data": [{"b64_json": base64.b64encode(image).decode(), "revised_prompt": "a cat"} for image in IMAGES],
+        }
+    ).encode()
+
+
+def test_image_to_bytes_and_save(tmp_path: Path) -> None:
+    image = Image.construct(b64_json=base64.b64encode(IMAGES[0]).decode())
+    assert image.to_bytes() == IMAGES[0]
+    assert image.save(tmp_path / "image.png") == len(IMAGES[0])
+    assert (tmp_path / "image.png").read_bytes() == IMAGES[0]
+
+    with pytest.raises(ValueError, match="b64_json"):
+        Image.construct(url="https://example.com/image.png").to_bytes()
+
+
+def test_lazy_response_from_bytes() -> None:
+    body = images_body()
+    response = LazyImagesResponse.from_bytes(body)
+
+    assert response.created == 1700000000
+    assert all(isinstance(image, LazyImage) for image in response.data)
+    assert [image.revised_prompt for image in response.data] == ["a cat", "a cat"]
+    assert [image.b64_json for image in response.data] == [None, None]
+
+    payloads = [image.payload for image in response.data]
+    assert all(isinstance(p, Base64Payload) and p.encoded.obj is body for p in payloads)
+    assert [image.to_bytes() for image in response.data] == IMAGES
+    assert response.to_dict() == {"created": 1700000000, "data": [{"revised_prompt": "a cat"}] * 2}
+
+
+def test_with_lazy_payloads(client: Dedalus, respx_mock: MockRouter, tmp_path: Path) -> None:
+    respx_mock.post(f"{base_url}/v1/images/generations").mock(
+        return_value=httpx.Response(200, content=images_body(), headers={"content-type": "application/json"})
+    )
+
+    response = client.images.with_lazy_payloads.generate(prompt="a cat", n=2, response_format="b64_json")
+
+    assert isinstance(response, LazyImagesResponse)
+    for i, image in enumerate(response.data):
+        assert image.save(tmp_path / f"{i}.png") == len(IMAGES[i])
+        assert (tmp_path / f"{i}.png").read_bytes() == IMAGES[i]
+
+
+async def test_async_with_lazy_payloads(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    respx_mock.post(f"{base_url}/v1/images/generations").mock(
+        return_value=httpx.Response(200, content=images_body(), headers={"content-type": "application/json"})
+    )
+
+    response = await async_client.images.with_lazy_payloads.generate(prompt="a cat", n=2)
+
+    assert [image.to_bytes() for image in response.data] == IMAGES
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import base64
+from typing import Any, Dict, List, Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus, APIStatusError
+from dedalus_labs.lib.images import Base64Payload, parse_b64_json
+from dedalus_labs.lib.streaming.images import ImageGenerationCompletedEvent, ImageGenerationPartialImageEvent
+
+from ..conftest import base_url
+
+PARTIAL = b"\x89PNG partial" * 10
+FINAL = b"\x89PNG final" * 5000
+
+
+def sse(event: str, payload: Dict[str, Any]) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode()
+
+
+def image_stream_body() -> bytes:
+    return sse(
+        "image_generation.partial_image",
+        {
+            "type": "image_generation.partial_image",
+            "b64_json": base64.b64encode(PARTIAL).decode(),
+            "partial_image_index": 0,
+            "size": "1024x1024",
+            "output_format": "png",
+        },
+    ) + sse(
+        "image_generation.completed",
+        {
+            "type": "image_generation.completed",
+            "b64_json": base64.b64encode(FINAL).decode(),
+            "created_at": 1700000000,
+            "usage": {"total_tokens": 42},
+        },
+    )
+
+
+def split(data: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def test_stream_events(client: Dedalus, respx_mock: MockRouter, tmp_path: Path) -> None:
+    respx_mock.post(f"{base_url}/v1/images/generations").mock(
+        return_value=httpx.Response(200, content=image_stream_body(), headers={"content-type": "text/event-stream"})
+    )
+
+    with client.images.stream(prompt="A lighthouse", partial_images=1) as stream:
+        events = list(stream)
+
+        assert [type(e) for e in events] == [ImageGenerationPartialImageEvent, ImageGenerationCompletedEvent]
+        partial, final = events
+        assert isinstance(partial, ImageGenerationPartialImageEvent)
+        assert partial.partial_image_index == 0
+        assert partial.size == "1024x1024"
+        assert partial.to_bytes() == PARTIAL
+        assert isinstance(final, ImageGenerationCompletedEvent)
+        assert final.usage == {"total_tokens": 42}
+        assert final.image.size == len(FINAL)
+
+        assert stream.save(tmp_path / "final.png") == len(FINAL)
+        assert (tmp_path / "final.png").read_bytes() == FINAL
+
+    body = json.loads(respx_mock.calls.last.request.content)
+    assert body["stream"] is True
+    assert body["partial_images"] == 1
+
+
+async def test_async_stream_chunked(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    # tiny network reads so frames and payloads straddle chunk boundaries
+    class Chunked(httpx.AsyncByteStream):
+        async def __aiter__(self) -> Any:
+            for chunk in split(image_stream_body(), 7):
+                yield chunk
+
+    respx_mock.post(f"{base_url}/v1/images/generations").mock(
+        return_value=httpx.Response(200, stream=Chunked(), headers={"content-type": "text/event-stream"})
+    )
+
+    async with async_client.images.stream(prompt="A lighthouse", partial_images=1) as stream:
+        final = await stream.get_final_image()
+
+    assert final.to_bytes() == FINAL
+    assert final.created_at == 1700000000
+
+
+def test_stream_error_event(client: Dedalus, respx_mock: MockRouter) -> None:
+    respx_mock.post(f"{base_url}/v1/images/generations").mock(
+        return_value=httpx.Response(
+            200,
+            content=sse("error", {"type": "error", "error": {"message": "nope"}}),
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+
+    with pytest.raises(APIStatusError):
+        with client.images.stream(prompt="A lighthouse") as stream:
+            stream.until_done()
+
+
+def test_parse_b64_json_keeps_payloads_as_views() -> None:
+    images: List[bytes] = [b"first", b"second image"]
+    body = json.dumps(
+        {
+            "created": 1,
+            "data": [
+                {"b64_json": base64.b64encode(images[0]).decode(), "revised_prompt": 'say "b64_json"'},
+                {"url": None, "b64_json": base64.b64encode(images[1]).decode()},
+            ],
+        }
+    ).encode()
+
+    parsed = parse_b64_json(body)
+
+    assert parsed["created"] == 1
+    assert parsed["data"][0]["revised_prompt"] == 'say "b64_json"'
+    payloads = [item["b64_json"] for item in parsed["data"]]
+    assert all(isinstance(p, Base64Payload) for p in payloads)
+    assert all(isinstance(p.encoded.obj, bytes) and p.encoded.obj is body for p in payloads)
+    assert [p.to_bytes() for p in payloads] == images
+    assert [p.size for p in payloads] == [len(i) for i in images]
+
+
+def test_parse_b64_json_escaped_fallback() -> None:
+    encoded = base64.b64encode(b"\xff\xfe\xfd" * 10).decode()
+    assert "/" in encoded
+    body = b'{"b64_json": "' + encoded.replace("/", "\\/").encode() + b'"}'
+
+    assert parse_b64_json(body)["b64_json"].to_bytes() == b"\xff\xfe\xfd" * 10
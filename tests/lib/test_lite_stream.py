@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus, APIStatusError
+from dedalus_labs.types.chat import ChatCompletionChunk
+from dedalus_labs.lib.streaming import LiteChunk, LiteObject, LiteStream, AsyncLiteStream
+
+from ..conftest import base_url
+
+api_key = "My API Key"
+
+
+def _chunk(**choice: Any) -> Dict[str, Any]:
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1,
+        "model": "openai/gpt-4o",
+        "choices": [{"index": 0, "delta": {}, "finish_reason": None, **choice}],
+    }
+
+
+CHUNKS: List[Dict[str, Any]] = [
+    _chunk(delta={"role": "assistant", "content": "Hel"}),
+    _chunk(delta={"content": "lo"}),
+    _chunk(
+        delta={"tool_calls": [{"index": 0, "id": "call_1", "function": {"name": "add", "arguments": "{}"}}]},
+        finish_reason="tool_calls",
+    ),
+    {**_chunk(), "choices": [], "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}},
+]
+
+
+def _sse(events: List[str]) -> httpx.Response:
+    body = "".join(f"{event}\n\n" for event in events)
+    return httpx.Response(200, content=body.encode(), headers={"Content-Type": "text/event-stream"})
+
+
+def _mock(respx_mock: MockRouter, events: List[str]) -> None:
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(return_value=_sse(events))
+
+
+def _events() -> List[str]:
+    return [f"data: {json.dumps(chunk)}" for chunk in CHUNKS] + ["data: [DONE]"]
+
+
+def test_lite_chunks_read_like_models(respx_mock: MockRouter) -> None:
+    _mock(respx_mock, _events())
+    client = Dedalus(base_url=base_url, api_key=api_key)
+
+    with LiteStream(raw_stream=client.chat.completions.create(model="m", messages=[], stream=True)) as stream:
+        chunks = list(stream)
+
+    assert len(chunks) == 4
+    assert "".join(c.choices[0].delta.content or "" for c in chunks[:3]) == "Hello"
+    assert chunks[0].choices[0].delta.role == "assistant"
+    assert chunks[2].choices[0].finish_reason == "tool_calls"
+    assert chunks[2].choices[0].delta.tool_calls[0].function.name == "add"
+    assert chunks[3].usage.total_tokens == 5
+    # fields the server left out read as None, like unset optional model fields
+    assert chunks[0].usage is None
+    assert chunks[1].choices[0].delta.tool_calls is None
+
+
+def test_lite_chunks_are_read_only_and_convert_on_demand(respx_mock: MockRouter) -> None:
+    _mock(respx_mock, _events())
+    client = Dedalus(base_url=base_url, api_key=api_key)
+
+    chunk = next(LiteStream(raw_stream=client.chat.completions.create(model="m", messages=[], stream=True)))
+
+    assert isinstance(chunk, LiteChunk)
+    assert not hasattr(chunk, "__dict__")
+    with pytest.raises(AttributeError, match="read-only"):
+        chunk.id = "other"  # type: ignore[misc]
+    with pytest.raises(AttributeError, match="read-only"):
+        chunk.choices[0].delta.content = "x"
+
+    model = chunk.to_model()
+    assert isinstance(model, ChatCompletionChunk)
+    assert model.choices[0].delta.content == "Hel"
+    assert chunk.to_model() is model
+    assert chunk.to_dict() == CHUNKS[0]
+    assert chunk.choices[0] == LiteObject(CHUNKS[0]["choices"][0])
+
+
+def test_error_events_raise(respx_mock: MockRouter) -> None:
+    _mock(respx_mock, [f"data: {json.dumps(CHUNKS[0])}", 'event: error\ndata: {"message": "overloaded"}'])
+    client = Dedalus(base_url=base_url, api_key=api_key)
+    stream = LiteStream(raw_stream=client.chat.completions.create(model="m", messages=[], stream=True))
+
+    assert next(stream).choices[0].delta.content == "Hel"
+    with pytest.raises(APIStatusError, match="overloaded"):
+        next(stream)
+
+
+async def test_async_lite_stream(respx_mock: MockRouter) -> None:
+    _mock(respx_mock, _events())
+    client = AsyncDedalus(base_url=base_url, api_key=api_key)
+
+    raw = await client.chat.completions.create(model="m", messages=[], stream=True)
+    async with AsyncLiteStream(raw_stream=raw) as stream:
+        chunks = [chunk async for chunk in stream]
+
+    assert [c.choices[0].delta.content for c in chunks[:2]] == ["Hel", "lo"]
+    assert chunks[-1].to_model().usage is not None
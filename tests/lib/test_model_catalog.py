@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import time
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.models import ModelCatalog
+
+from ..conftest import base_url
+
+
+def model(id: str, provider: str, input_token_limit: int, **capabilities: bool) -> Dict[str, Any]:
+    return {
+        "id": id,
+        "provider": provider,
+        "created_at": "2025-01-01T00:00:00Z",
+        "capabilities": {"input_token_limit": input_token_limit, "text": True, **capabilities},
+    }
+
+
+MODELS = [
+    model("openai/gpt-4o", "openai", 128_000, tools=True, vision=True),
+    model("openai/gpt-4o-mini", "openai", 128_000, tools=True),
+    model("anthropic/claude-sonnet-4", "anthropic", 200_000, tools=True, vision=True, thinking=True),
+    model("google/gemini-nano", "google", 32_000, tools=True, vision=True),
+]
+
+
+def models_response(request: httpx.Request) -> httpx.Response:
+    if request.headers.get("if-none-match") == '"v1"':
+        return httpx.Response(304)
+    return httpx.Response(200, json={"object": "list", "data": MODELS}, headers={"etag": '"v1"'})
+
+
+def test_indexes_and_queries(client: Dedalus, respx_mock: MockRouter) -> None:
+    route = respx_mock.get(f"{base_url}/v1/models").mock(side_effect=models_response)
+    client = client.copy()  # the catalog is cached per client
+    catalog = client.models.catalog
+
+    assert catalog is client.models.catalog
+    assert len(catalog) == 4
+    assert "openai/gpt-4o" in catalog
+    assert catalog.get("openai/gpt-4o-mini") is catalog["openai/gpt-4o-mini"]
+    assert catalog.get("nope") is None
+    assert [m.id for m in catalog.by_provider("openai")] == ["openai/gpt-4o", "openai/gpt-4o-mini"]
+
+    found = catalog.find("tools", "vision", min_input_tokens=128_000)
+    assert [m.id for m in found] == ["openai/gpt-4o", "anthropic/claude-sonnet-4"]
+    assert catalog.find("vision", "tools", min_input_tokens=128_000) is found
+    assert [m.id for m in catalog.find("thinking", provider="anthropic")] == ["anthropic/claude-sonnet-4"]
+    assert catalog.etag == '"v1"'
+    assert route.call_count == 1
+
+    with pytest.raises(ValueError, match="Unknown capability"):
+        catalog.find("teleportation")
+
+
+def test_conditional_refresh(client: Dedalus, respx_mock: MockRouter) -> None:
+    route = respx_mock.get(f"{base_url}/v1/models").mock(side_effect=models_response)
+    catalog = ModelCatalog(client.models, ttl=0, background_refresh=False)
+
+    first = catalog.all()
+    assert catalog.refresh() is False
+    assert catalog.all() is first
+    assert route.calls[-1].request.headers["if-none-match"] == '"v1"'
+
+
+def test_background_refresh_serves_stale_data(client: Dedalus, respx_mock: MockRouter) -> None:
+    releases: List[str] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if releases:
+            time.sleep(0.05)
+            return httpx.Response(200, json={"object": "list", "data": MODELS[:1]}, headers={"etag": '"v2"'})
+        releases.append("first")
+        return models_response(request)
+
+    respx_mock.get(f"{base_url}/v1/models").mock(side_effect=respond)
+    catalog = ModelCatalog(client.models, ttl=0.01)
+
+    assert len(catalog) == 4
+    time.sleep(0.02)
+    assert len(catalog) == 4  # stale, refresh runs on a background thread
+
+    deadline = time.monotonic() + 5
+    while catalog.etag != '"v2"' and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert catalog.etag == '"v2"'
+    assert [m.id for m in catalog.find("vision")] == ["openai/gpt-4o"]
+
+
+async def test_async_catalog(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    route = respx_mock.get(f"{base_url}/v1/models").mock(side_effect=models_response)
+    catalog = async_client.copy().models.catalog
+
+    found = await catalog.find("tools", "vision", min_input_tokens=128_000)
+    assert [m.id for m in found] == ["openai/gpt-4o", "anthropic/claude-sonnet-4"]
+    assert (await catalog.get("google/gemini-nano")) is not None
+
+    catalog._ttl = 0
+    assert len(await catalog.all()) == 4
+    await asyncio.sleep(0.05)
+    assert route.call_count == 2
+    assert route.calls[-1].request.headers["if-none-match"] == '"v1"'
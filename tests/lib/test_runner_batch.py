@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import asyncio
+from typing import List
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.runner import BatchItem, DedalusRunner
+
+from .helpers import completion
+from ..conftest import base_url
+
+
+def respond(request: httpx.Request) -> httpx.Response:
+    prompt = json.loads(request.content)["messages"][-1]["content"]
+    if prompt == "bad":
+        return httpx.Response(400, json={"error": {"message": "rejected"}})
+    return completion(prompt.upper(), usage={"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12})
+
+
+def test_run_many(client: Dedalus, respx_mock: MockRouter, tmp_path: Path) -> None:
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(side_effect=respond)
+    runner = DedalusRunner(client.with_options(max_retries=0))
+    checkpoint = tmp_path / "eval.jsonl"
+
+    batch = runner.run_many(
+        ["a", "b", {"id": "third", "input": "c"}, "bad"],
+        model="openai/gpt-4o-mini",
+        max_concurrency=2,
+        checkpoint=checkpoint,
+    )
+    items: List[BatchItem] = list(batch)
+
+    outputs = {item.index: item.result.final_output for item in items if item.result is not None}
+    assert outputs == {0: "A", 1: "B", 2: "C"}
+    assert [item.ok for item in items].count(False) == 1
+    assert next(item for item in items if item.index == 2).id == "third"
+    assert (batch.stats.succeeded, batch.stats.failed, batch.stats.steps) == (3, 1, 3)
+    assert (batch.stats.prompt_tokens, batch.stats.total_tokens) == (30, 36)
+    assert len(batch.stats.latencies) == 3
+
+    entries = [json.loads(line) for line in checkpoint.read_text().splitlines()]
+    assert sorted(e["status"] for e in entries) == ["error", "ok", "ok", "ok"]
+
+    resumed = runner.run_many(
+        ["a", "b", {"id": "third", "input": "c"}, "bad"], model="openai/gpt-4o-mini", checkpoint=checkpoint
+    )
+    assert [item.index for item in resumed] == [3]
+    assert resumed.stats.skipped == 3
+
+
+def test_checkpoint_ids_cover_shared_run_kwargs(client: Dedalus, respx_mock: MockRouter, tmp_path: Path) -> None:
+    route = respx_mock.post(f"{base_url}/v1/chat/completions").mock(side_effect=respond)
+    runner = DedalusRunner(client)
+    checkpoint = tmp_path / "eval.jsonl"
+
+    def lookup(key: str) -> str:
+        """Look up a key."""
+        return key
+
+    first = runner.run_many(["a", "b"], model="openai/gpt-4o-mini", tools=[lookup], checkpoint=checkpoint)
+    assert [item.ok for item in first] == [True, True]
+
+    # identical arguments are skipped, including the (freshly created) tools
+    again = runner.run_many(["a", "b"], model="openai/gpt-4o-mini", tools=[lookup], checkpoint=checkpoint)
+    assert (list(again), again.stats.skipped) == ([], 2)
+
+    other_model = runner.run_many(["a", "b"], model="openai/gpt-4o", tools=[lookup], checkpoint=checkpoint)
+    assert sorted(item.index for item in other_model) == [0, 1]
+    assert other_model.stats.skipped == 0
+    assert [json.loads(call.request.content)["model"] for call in route.calls[-2:]] == [["openai/gpt-4o"]] * 2
+
+
+async def test_arun_many_respects_concurrency(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    in_flight = [0, 0]
+
+    async def respond_slowly(request: httpx.Request) -> httpx.Response:
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return respond(request)
+
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(side_effect=respond_slowly)
+    runner = DedalusRunner(async_client)
+
+    batch = runner.arun_many([f"p{i}" for i in range(10)], model="openai/gpt-4o-mini", max_concurrency=3)
+    items = [item async for item in batch]
+
+    assert sorted(item.result.final_output for item in items if item.result) == sorted(f"P{i}" for i in range(10))
+    assert in_flight[1] <= 3
+    assert batch.stats.succeeded == 10
+    assert batch.stats.mean_steps == 1
+
+
+def test_run_many_requires_sync_client(async_client: AsyncDedalus) -> None:
+    with pytest.raises(TypeError, match="arun_many"):
+        DedalusRunner(async_client).run_many(["a"], model="openai/gpt-4o-mini")
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Callable
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.runner import (
+    DedalusRunner,
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
+
+from .helpers import tool_call, completion
+from ..conftest import base_url
+
+USAGE = {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12}
+
+
+def turns() -> List[httpx.Response]:
+    tool_calls = [tool_call("c1", "expensive", '{"n": 1}'), tool_call("c2", "expensive", '{"n": 2}')]
+    return [completion(tool_calls=tool_calls, usage=USAGE), completion("done", usage=USAGE)]
+
+
+def stores(tmp_path: Path) -> Dict[str, Callable[[], CheckpointStore]]:
+    return {
+        "memory": MemoryCheckpointStore,
+        "file": lambda: FileCheckpointStore(tmp_path / "runs"),
+        "sqlite": lambda: SQLiteCheckpointStore(tmp_path / "runs.db"),
+    }
+
+
+@pytest.mark.parametrize("kind", ["memory", "file", "sqlite"])
+def test_resume_skips_finished_tools(kind: str, client: Dedalus, respx_mock: MockRouter, tmp_path: Path) -> None:
+    store = stores(tmp_path)[kind]()
+    calls: List[int] = []
+
+    def expensive(n: int) -> int:
+        calls.append(n)
+        if n == 2 and len(calls) == 2:
+            raise KeyboardInterrupt  # simulate the process dying mid-step
+        return n * 10
+
+    route = respx_mock.post(f"{base_url}/v1/chat/completions").mock(side_effect=turns())
+    runner = DedalusRunner(client)
+
+    with pytest.raises(KeyboardInterrupt):
+        runner.run(input="go", model="openai/gpt-4o-mini", tools=[expensive], checkpoint=store, run_id="r1")
+    assert calls == [1, 2]
+
+    result = runner.run(input="go", model="openai/gpt-4o-mini", tools=[expensive], checkpoint=store, run_id="r1")
+
+    assert calls == [1, 2, 2]
+    assert route.call_count == 2
+    sent = json.loads(route.calls[1].request.content)["messages"]
+    assert [m["content"] for m in sent if m["role"] == "tool"] == ["10", "20"]
+    assert result.final_output == "done"
+    assert result.steps_used == 2
+    assert result.tools_called == ["expensive", "expensive"]
+    assert result.usage == {"prompt_tokens": 20, "completion_tokens": 4, "total_tokens": 24}
+
+    # a finished run is returned from the journal without calling the API again
+    again = runner.run(input="go", model="openai/gpt-4o-mini", tools=[expensive], checkpoint=store, run_id="r1")
+    assert again.final_output == "done"
+    assert route.call_count == 2
+
+    state = store.state("r1")
+    assert state is not None and state.done and not state.pending_tool_calls
+
+
+async def test_async_resume_with_default_run_id(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    store = MemoryCheckpointStore()
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(side_effect=turns())
+    calls: List[int] = []
+
+    async def expensive(n: int) -> int:
+        calls.append(n)
+        return n
+
+    runner = DedalusRunner(async_client)
+    first = await runner.run(input="go", model="openai/gpt-4o-mini", tools=[expensive], checkpoint=store)
+    second = await runner.run(input="go", model="openai/gpt-4o-mini", tools=[expensive], checkpoint=store)
+
+    assert calls == [1, 2]
+    assert first.final_output == second.final_output == "done"
+    assert second.messages == first.messages
+
+
+def test_checkpoint_rejects_streaming(client: Dedalus) -> None:
+    with pytest.raises(ValueError, match="stream"):
+        DedalusRunner(client).run(input="go", model="m", stream=True, checkpoint=MemoryCheckpointStore())
+
+
+def test_checkpoint_store_interface_is_abstract() -> None:
+    class Partial(CheckpointStore):
+        def append(self, run_id: str, record: Dict[str, Any]) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        Partial()  # type: ignore[abstract]
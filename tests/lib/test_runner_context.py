@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.runner import (
+    ContextWindow,
+    DedalusRunner,
+    KeepLastTokens,
+    ContextStrategy,
+    SummarizeOldTurns,
+    DropStaleToolOutputs,
+    estimate_tokens,
+)
+
+from .helpers import completion
+from ..conftest import base_url
+
+
+def history(turns: int) -> List[Dict[str, Any]]:
+    messages: List[Dict[str, Any]] = [{"role": "system", "content": "be brief"}]
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"question {i} " + "x" * 400})
+        messages.append(
+            {
+                "role": "assistant",
+                "tool_calls": [{"id": f"c{i}", "type": "function", "function": {"name": "f", "arguments": "{}"}}],
+            }
+        )
+        messages.append({"role": "tool", "tool_call_id": f"c{i}", "content": "y" * 400})
+    return messages
+
+
+def test_estimate_tokens() -> None:
+    assert estimate_tokens({"role": "user", "content": "x" * 400}) == 104
+    assert estimate_tokens({"role": "user", "content": [{"type": "text", "text": "abcd"}]}) == 5
+
+
+def test_keep_last_tokens_keeps_tool_results_with_their_calls(client: Dedalus) -> None:
+    messages = history(10)
+    fitted = KeepLastTokens().apply(messages, 700, estimate_tokens, client)
+
+    assert fitted[0] == {"role": "system", "content": "be brief"}
+    assert sum(estimate_tokens(m) for m in fitted) <= 700
+    assert fitted[-1] is messages[-1]
+    assert fitted[1]["role"] != "tool"
+    for i, msg in enumerate(fitted):
+        if msg["role"] == "tool":
+            assert fitted[i - 1]["role"] in ("assistant", "tool")
+
+
+def test_drop_stale_tool_outputs(client: Dedalus) -> None:
+    messages = history(3)
+    fitted = DropStaleToolOutputs(keep_last=1).apply(messages, 0, estimate_tokens, client)
+
+    assert [m["content"] for m in fitted if m["role"] == "tool"] == ["[tool output omitted]"] * 2 + ["y" * 400]
+    assert messages[3]["content"] == "y" * 400
+
+
+def test_summarize_old_turns(client: Dedalus, respx_mock: MockRouter) -> None:
+    route = respx_mock.post(f"{base_url}/v1/chat/completions").mock(return_value=completion("they asked things"))
+    messages = history(10)
+
+    fitted = SummarizeOldTurns("openai/gpt-4o-mini").apply(messages, 1000, estimate_tokens, client)
+
+    request = json.loads(route.calls[0].request.content)
+    assert request["model"] == "openai/gpt-4o-mini"
+    assert "question 0" in request["messages"][1]["content"]
+    assert fitted[0]["content"] == "be brief"
+    assert fitted[1] == {"role": "system", "content": "Summary of the earlier conversation:\nthey asked things"}
+    assert fitted[-1] is messages[-1]
+    assert len(fitted) < len(messages)
+
+
+def test_runner_uses_catalog_budget(client: Dedalus, respx_mock: MockRouter) -> None:
+    respx_mock.get(f"{base_url}/v1/models").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "data": [
+                    {
+                        "id": "openai/gpt-4o",
+                        "provider": "openai",
+                        "created_at": "2025-01-01T00:00:00Z",
+                        "capabilities": {"input_token_limit": 5000},
+                    }
+                ],
+            },
+        )
+    )
+    route = respx_mock.post(f"{base_url}/v1/chat/completions").mock(return_value=completion("ok"))
+
+    result = DedalusRunner(client.copy()).run(
+        messages=history(20), model="openai/gpt-4o", context=ContextWindow(reserve_tokens=4000)
+    )
+
+    sent = json.loads(route.calls[0].request.content)["messages"]
+    assert sum(estimate_tokens(m) for m in sent) <= 1000
+    assert sent[0]["role"] == "system"
+    assert result.final_output == "ok"
+    assert len(result.messages) == len(sent) + 1
+
+
+async def test_async_runner_with_fixed_budget(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    route = respx_mock.post(f"{base_url}/v1/chat/completions").mock(return_value=completion("ok"))
+
+    window = ContextWindow(max_input_tokens=600, reserve_tokens=0)
+    await DedalusRunner(async_client).run(messages=history(20), model="openai/gpt-4o", context=window)
+
+    sent = json.loads(route.calls[0].request.content)["messages"]
+    assert window.total(sent) <= 600
+    assert sum(1 for m in sent if m.get("content") == "[tool output omitted]") > 0
+
+
+def test_custom_strategy_must_implement_apply(client: Dedalus) -> None:
+    class Incomplete(ContextStrategy):
+        pass
+
+    class KeepNewest(ContextStrategy):
+        def apply(self, messages: List[Dict[str, Any]], *_: Any) -> List[Dict[str, Any]]:
+            return messages[-1:]
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore[abstract]
+
+    messages = history(10)
+    window = ContextWindow([KeepNewest()], max_input_tokens=500, reserve_tokens=0)
+    assert window.fit(messages, "m", client) == messages[-1:]
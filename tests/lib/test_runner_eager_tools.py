@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+from typing import Any, Dict, List, Iterator, AsyncIterator
+
+import httpx
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.runner import DedalusRunner
+from dedalus_labs.lib.runner._tool_calls import ready_tool_calls
+
+from ..conftest import base_url
+
+
+def sse(delta: Dict[str, Any], finish_reason: Any = None) -> bytes:
+    chunk = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1,
+        "model": "openai/gpt-4o",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(chunk)}\n\n".encode()
+
+
+def tool_delta(index: int, *, id: str | None = None, name: str | None = None, arguments: str = "") -> Dict[str, Any]:
+    call: Dict[str, Any] = {"index": index, "function": {"arguments": arguments}}
+    if id is not None:
+        call.update(id=id, type="function", function={"name": name, "arguments": arguments})
+    return {"tool_calls": [call]}
+
+
+TOOL_TURN = [
+    tool_delta(0, id="call_0", name="lookup", arguments='{"key": '),
+    tool_delta(0, arguments='"a"}'),
+    tool_delta(1, id="call_1", name="lookup", arguments='{"key": "b"}'),
+]
+
+
+def test_ready_tool_calls() -> None:
+    def call(name: str, arguments: str) -> Any:
+        return {"id": "x", "type": "function", "function": {"name": name, "arguments": arguments}}
+
+    local = {"lookup"}
+    assert ready_tool_calls([call("lookup", '{"key": "a"')], {}, local) == []
+    assert ready_tool_calls([call("lookup", '{"key": "a"}')], {}, local) == [0]
+    assert ready_tool_calls([call("lookup", ""), call("lookup", "")], {}, local) == [0]
+    assert ready_tool_calls([call("remote", "{}"), call("lookup", "{}")], {1: None}, local) == []
+
+
+async def test_async_eager_tools_overlap_with_stream(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    events: List[str] = []
+
+    async def tool_turn() -> AsyncIterator[bytes]:
+        for i, delta in enumerate(TOOL_TURN):
+            yield sse(delta)
+            if i == 1:
+                await asyncio.sleep(0.05)
+        events.append("stream done")
+        yield sse({}, finish_reason="tool_calls")
+        yield b"data: [DONE]\n\n"
+
+    responses = iter(
+        [
+            httpx.Response(200, content=tool_turn(), headers={"content-type": "text/event-stream"}),
+            httpx.Response(
+                200,
+                content=sse({"content": "done"}, finish_reason="stop") + b"data: [DONE]\n\n",
+                headers={"content-type": "text/event-stream"},
+            ),
+        ]
+    )
+    route = respx_mock.post(f"{base_url}/v1/chat/completions").mock(side_effect=lambda _: next(responses))
+
+    async def lookup(key: str) -> str:
+        events.append(f"lookup {key}")
+        return key.upper()
+
+    runner = DedalusRunner(async_client)
+    stream = runner.run(input="hi", model="openai/gpt-4o", tools=[lookup], stream=True, eager_tools=True)
+    chunks = [chunk async for chunk in stream]
+
+    assert events.index("lookup a") < events.index("stream done")
+    assert len(chunks) == 5
+    messages = json.loads(route.calls[1].request.content)["messages"]
+    assert [m["content"] for m in messages if m["role"] == "tool"] == ["A", "B"]
+    assert [m["tool_call_id"] for m in messages if m["role"] == "tool"] == ["call_0", "call_1"]
+
+
+def test_sync_eager_tools(client: Dedalus, respx_mock: MockRouter) -> None:
+    events: List[str] = []
+
+    def tool_turn() -> Iterator[bytes]:
+        for i, delta in enumerate(TOOL_TURN):
+            yield sse(delta)
+            if i == 1:
+                time.sleep(0.05)
+        events.append("stream done")
+        yield sse({}, finish_reason="tool_calls")
+        yield b"data: [DONE]\n\n"
+
+    responses = iter(
+        [
+            httpx.Response(200, content=tool_turn(), headers={"content-type": "text/event-stream"}),
+            httpx.Response(
+                200,
+                content=sse({"content": "done"}, finish_reason="stop") + b"data: [DONE]\n\n",
+                headers={"content-type": "text/event-stream"},
+            ),
+        ]
+    )
+    route = respx_mock.post(f"{base_url}/v1/chat/completions").mock(side_effect=lambda _: next(responses))
+
+    def lookup(key: str) -> str:
+        events.append(f"lookup {key}")
+        return key.upper()
+
+    runner = DedalusRunner(client)
+    list(runner.run(input="hi", model="openai/gpt-4o", tools=[lookup], stream=True, eager_tools=True))
+
+    assert events.index("lookup a") < events.index("stream done")
+    messages = json.loads(route.calls[1].request.content)["messages"]
+    assert [m["content"] for m in messages if m["role"] == "tool"] == ["A", "B"]
+
+
+def _mcp_turn(*deltas: Dict[str, Any]) -> httpx.Response:
+    body = b"".join(sse(delta) for delta in deltas)
+    body += sse({"content": "answered by the server"}, finish_reason="stop") + b"data: [DONE]\n\n"
+    return httpx.Response(200, content=body, headers={"content-type": "text/event-stream"})
+
+
+async def test_eager_calls_are_awaited_when_server_tools_end_the_run(
+    async_client: AsyncDedalus, respx_mock: MockRouter
+) -> None:
+    route = respx_mock.post(f"{base_url}/v1/chat/completions").mock(
+        return_value=_mcp_turn(
+            tool_delta(0, id="call_0", name="lookup", arguments='{"key": "a"}'),
+            tool_delta(1, id="call_1", name="web_search", arguments='{"q": "x"}'),
+        )
+    )
+    calls: List[str] = []
+
+    async def lookup(key: str) -> str:
+        calls.append(key)
+        return key.upper()
+
+    runner = DedalusRunner(async_client)
+    stream = runner.run(input="hi", model="openai/gpt-4o", tools=[lookup], stream=True, eager_tools=True, events=True)
+    events = [event async for event in stream]
+
+    assert route.call_count == 1
+    assert calls == ["a"]
+    results = [e for e in events if e.type == "tool_result"]
+    assert [(e.name, e.result) for e in results] == [("lookup", "A")]
+
+    # without events nothing reports the result, but the call still finishes before the stream ends
+    finished: List[str] = []
+
+    async def slow_lookup(key: str) -> str:
+        await asyncio.sleep(0.05)
+        finished.append(key)
+        return key.upper()
+
+    slow_lookup.__name__ = "lookup"
+    stream = runner.run(input="hi", model="openai/gpt-4o", tools=[slow_lookup], stream=True, eager_tools=True)
+    [chunk async for chunk in stream]
+    assert finished == ["a"]
+
+
+def test_no_eager_calls_start_once_a_server_tool_is_called(client: Dedalus, respx_mock: MockRouter) -> None:
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(
+        return_value=_mcp_turn(
+            tool_delta(0, id="call_0", name="web_search", arguments='{"q": "x"}'),
+            tool_delta(1, id="call_1", name="lookup", arguments='{"key": "a"}'),
+        )
+    )
+    calls: List[str] = []
+
+    def lookup(key: str) -> str:
+        calls.append(key)
+        return key.upper()
+
+    runner = DedalusRunner(client)
+    list(runner.run(input="hi", model="openai/gpt-4o", tools=[lookup], stream=True, eager_tools=True))
+
+    # non-eager mode never runs local calls in a turn the server already answered
+    assert calls == []
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.runner import (
+    RunEvent,
+    FinalEvent,
+    StepEndEvent,
+    DedalusRunner,
+    ToolResultEvent,
+    ContentDeltaEvent,
+    ToolCallReadyEvent,
+)
+
+from ..conftest import base_url
+
+
+def sse(delta: Dict[str, Any], finish_reason: Any = None, usage: Any = None) -> bytes:
+    chunk: Dict[str, Any] = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1,
+        "model": "openai/gpt-4o",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    if usage is not None:
+        chunk["usage"] = usage
+    return f"data: {json.dumps(chunk)}\n\n".encode()
+
+
+def stream(*chunks: bytes) -> httpx.Response:
+    return httpx.Response(
+        200, content=b"".join(chunks) + b"data: [DONE]\n\n", headers={"content-type": "text/event-stream"}
+    )
+
+
+def tool_delta(index: int, id: str, arguments: str) -> Dict[str, Any]:
+    return {
+        "tool_calls": [
+            {"index": index, "id": id, "type": "function", "function": {"name": "lookup", "arguments": arguments}}
+        ]
+    }
+
+
+USAGE = {"prompt_tokens": 10, "completion_tokens": 3, "total_tokens": 13}
+
+
+def mock_turns(respx_mock: MockRouter) -> None:
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(
+        side_effect=[
+            stream(
+                sse(tool_delta(0, "call_0", '{"key": "a"}')),
+                sse(tool_delta(1, "call_1", '{"key": "missing"}')),
+                sse({}, finish_reason="tool_calls", usage=USAGE),
+            ),
+            stream(sse({"content": "A "}), sse({"content": "and B"}, finish_reason="stop", usage=USAGE)),
+        ]
+    )
+
+
+def lookup(key: str) -> str:
+    """Look up a key."""
+    return {"a": "A"}[key]
+
+
+def check(events: List[RunEvent]) -> None:
+    assert [e.type for e in events] == [
+        "step_start",
+        "tool_call_ready",
+        "tool_call_ready",
+        "tool_result",
+        "tool_result",
+        "step_end",
+        "step_start",
+        "content_delta",
+        "content_delta",
+        "step_end",
+        "final",
+    ]
+    assert [e.step for e in events] == [1] * 6 + [2] * 5
+    elapsed = [e.elapsed for e in events]
+    assert elapsed == sorted(elapsed)
+
+    ready = [e for e in events if isinstance(e, ToolCallReadyEvent)]
+    assert [(e.name, e.arguments, e.local) for e in ready] == [
+        ("lookup", '{"key": "a"}', True),
+        ("lookup", '{"key": "missing"}', True),
+    ]
+    results = [e for e in events if isinstance(e, ToolResultEvent)]
+    assert [(e.tool_call_id, e.result, e.ok) for e in results] == [("call_0", "A", True), ("call_1", None, False)]
+    assert all(e.duration >= 0 for e in results)
+
+    ends = [e for e in events if isinstance(e, StepEndEvent)]
+    assert [e.finish_reason for e in ends] == ["tool_calls", "stop"]
+    assert all(e.usage == USAGE for e in ends)
+    for end in ends:
+        assert end.time_to_first_token is not None
+        assert 0 <= end.time_to_first_token <= end.duration
+
+    assert "".join(e.text for e in events if isinstance(e, ContentDeltaEvent)) == "A and B"
+    final = events[-1]
+    assert isinstance(final, FinalEvent)
+    assert final.output == "A and B"
+    assert final.tools_called == ["lookup"]
+    assert final.usage == {"prompt_tokens": 20, "completion_tokens": 6, "total_tokens": 26}
+
+
+def test_sync_events(client: Dedalus, respx_mock: MockRouter) -> None:
+    mock_turns(respx_mock)
+    events = list(
+        DedalusRunner(client).run(input="a?", model="openai/gpt-4o", tools=[lookup], stream=True, events=True)
+    )
+    check(events)
+
+
+async def test_async_events(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    mock_turns(respx_mock)
+    stream = DedalusRunner(async_client).run(
+        input="a?", model="openai/gpt-4o", tools=[lookup], stream=True, events=True
+    )
+    check([event async for event in stream])
+
+
+def test_events_require_stream(client: Dedalus) -> None:
+    with pytest.raises(ValueError, match="requires stream=True"):
+        DedalusRunner(client).run(input="a?", model="openai/gpt-4o", events=True)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.runner import RunMetrics, StepMetrics, DedalusRunner
+
+from .helpers import tool_call, completion
+from ..conftest import base_url
+
+
+def clock() -> str:
+    """Tell the time."""
+    return "noon"
+
+
+def broken() -> str:
+    """Always fails."""
+    raise RuntimeError("nope")
+
+
+def mock_turns(respx_mock: MockRouter) -> None:
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(
+        side_effect=[
+            completion(
+                tool_calls=[tool_call("c1", "clock"), tool_call("c2", "broken")],
+                usage={"prompt_tokens": 100, "completion_tokens": 10, "total_tokens": 110},
+                tools_executed=["web_search"],
+            ),
+            completion(
+                "It is noon.",
+                usage={
+                    "prompt_tokens": 150,
+                    "completion_tokens": 5,
+                    "total_tokens": 155,
+                    "prompt_tokens_details": {"cached_tokens": 100},
+                },
+            ),
+        ]
+    )
+
+
+def check(steps: list[StepMetrics], totals: RunMetrics) -> None:
+    first, second = steps
+    assert (first.step, first.model, first.prompt_tokens, first.cached_tokens) == (1, "openai/gpt-4o-mini", 100, 0)
+    assert first.tools_executed == ["web_search"]
+    assert [(t.name, t.tool_call_id, t.ok) for t in first.tools] == [("clock", "c1", True), ("broken", "c2", False)]
+    assert (second.step, second.cached_tokens, second.tools) == (2, 100, [])
+
+    assert totals.steps == 2 and totals.tool_calls == 2
+    assert (totals.prompt_tokens, totals.completion_tokens, totals.total_tokens) == (250, 15, 265)
+    assert totals.cached_ratio == pytest.approx(0.4)
+    assert totals.model_time == pytest.approx(first.latency + second.latency)
+    assert totals.tool_time == pytest.approx(first.tool_time)
+    assert totals.slowest_step in (1, 2)
+
+
+def test_sync_step_metrics(client: Dedalus, respx_mock: MockRouter) -> None:
+    mock_turns(respx_mock)
+    result = DedalusRunner(client).run(input="time?", model="openai/gpt-4o-mini", tools=[clock, broken])
+    check(result.step_metrics, result.metrics)
+
+
+async def test_async_step_metrics(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    mock_turns(respx_mock)
+    result = await DedalusRunner(async_client).run(input="time?", model="openai/gpt-4o-mini", tools=[clock, broken])
+    check(result.step_metrics, result.metrics)
+
+
+def test_empty_run_metrics() -> None:
+    totals = RunMetrics.from_steps([])
+    assert (totals.steps, totals.mean_latency, totals.cached_ratio, totals.slowest_step) == (0, 0.0, 0.0, None)
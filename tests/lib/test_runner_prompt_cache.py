@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.runner import DedalusRunner
+
+from .helpers import completion
+from ..conftest import base_url
+
+USAGE: Dict[str, Any] = {"prompt_tokens": 1200, "completion_tokens": 5, "total_tokens": 1205}
+
+
+def lookup(city: str) -> str:
+    """Look up a city."""
+    return city
+
+
+def sent_keys(respx_mock: MockRouter) -> List[Optional[str]]:
+    return [json.loads(call.request.content).get("prompt_cache_key") for call in respx_mock.calls]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_key_is_stable_across_inputs(client: Dedalus, respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/chat/completions").mock(return_value=completion("ok", usage=USAGE))
+    runner = DedalusRunner(client)
+
+    runner.run(input="first", instructions="Be terse.", model="openai/gpt-4o-mini", tools=[lookup])
+    runner.run(input="second", instructions="Be terse.", model="openai/gpt-4o-mini", tools=[lookup])
+    runner.run(input="first", instructions="Be verbose.", model="openai/gpt-4o-mini", tools=[lookup])
+    runner.run(input="first", instructions="Be terse.", model="openai/gpt-4o", tools=[lookup])
+    runner.run(input="first", instructions="Be terse.", model="openai/gpt-4o-mini")
+
+    keys = sent_keys(respx_mock)
+    assert all(key and key.startswith("dedalus-runner-") for key in keys)
+    assert keys[0] == keys[1]
+    assert len(set(keys)) == 4
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_override_and_opt_out(client: Dedalus, respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/chat/completions").mock(return_value=completion("ok", usage=USAGE))
+    runner = DedalusRunner(client)
+
+    runner.run(input="hi", model="openai/gpt-4o-mini", prompt_cache_key="tenant-7")
+    runner.run(input="hi", model="openai/gpt-4o-mini", prompt_cache_key=False)
+
+    assert sent_keys(respx_mock) == ["tenant-7", None]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_cached_tokens_are_reported(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/chat/completions").mock(
+        side_effect=[
+            completion("ok", usage={**USAGE, "prompt_tokens_details": {"cached_tokens": 1024}}),
+            completion("ok", usage=USAGE),
+        ]
+    )
+    runner = DedalusRunner(async_client)
+
+    warm = await runner.run(input="hi", model="openai/gpt-4o-mini")
+    cold = await runner.run(input="hi", model="openai/gpt-4o-mini")
+
+    assert warm.usage["cached_tokens"] == warm.cached_tokens == 1024
+    assert cold.cached_tokens == 0 and "cached_tokens" not in cold.usage
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus, BadRequestError
+from dedalus_labs.lib.runner import ModelRouter, DedalusRunner
+
+from .helpers import completion
+from ..conftest import base_url
+
+
+def requested_models(respx_mock: MockRouter) -> List[Any]:
+    return [json.loads(call.request.content)["model"] for call in respx_mock.calls]
+
+
+def test_rank_prefers_unmeasured_then_fastest_then_recovering(monkeypatch: pytest.MonkeyPatch) -> None:
+    router = ModelRouter(cooldown=10)
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    router.record_success("slow", 2.0)
+    router.record_success("fast", 0.5)
+    router.record_failure("flaky")
+    assert router.rank(["slow", "flaky", "fast", "new", "fast"]) == ["new", "fast", "slow", "flaky"]
+    assert not router.is_healthy("flaky")
+
+    now[0] += 11
+    assert router.is_healthy("flaky")
+    assert router.health("flaky").failures == 1
+
+
+def test_ewma_latency() -> None:
+    router = ModelRouter(alpha=0.5)
+    router.record_success("m", 1.0, time_to_first_token=0.2)
+    router.record_success("m", 3.0)
+    health = router.health("m")
+    assert (health.calls, health.latency, health.time_to_first_token) == (2, 2.0, 0.2)
+
+    router.record_failure("m")
+    assert router.health("m").error_rate == 0.5
+
+
+def test_shared_router_is_process_wide() -> None:
+    assert ModelRouter.shared() is ModelRouter.shared()
+
+
+def test_fails_over_within_the_step(client: Dedalus, respx_mock: MockRouter) -> None:
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(
+        side_effect=[httpx.Response(503, json={"error": "overloaded"}), completion("ok", model="anthropic/claude")]
+    )
+    router = ModelRouter()
+
+    result = DedalusRunner(client).run(input="hi", model=["openai/gpt-4o", "anthropic/claude"], router=router)
+
+    assert result.final_output == "ok"
+    assert requested_models(respx_mock) == ["openai/gpt-4o", "anthropic/claude"]
+    assert router.health("openai/gpt-4o").failures == 1
+    assert router.health("anthropic/claude").latency is not None
+    assert router.rank(["openai/gpt-4o", "anthropic/claude"]) == ["anthropic/claude", "openai/gpt-4o"]
+
+
+def test_client_errors_are_not_failed_over(client: Dedalus, respx_mock: MockRouter) -> None:
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(return_value=httpx.Response(400, json={"error": "bad"}))
+
+    with pytest.raises(BadRequestError):
+        DedalusRunner(client).run(input="hi", model=["a", "b"], router=ModelRouter())
+    assert len(respx_mock.calls) == 1
+
+
+async def test_router_state_is_shared_between_runners(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(return_value=completion("ok", model="x"))
+    router = ModelRouter()
+    router.record_success("slow", 5.0)
+    router.record_success("fast", 0.1)
+
+    for _ in range(2):
+        await DedalusRunner(async_client).run(
+            input="hi", model="slow", available_models=["slow", "fast"], router=router
+        )
+
+    assert requested_models(respx_mock) == ["fast", "fast"]
+    assert router.health("fast").calls == 3
+
+
+def test_streams_record_time_to_first_token(client: Dedalus, respx_mock: MockRouter) -> None:
+    chunk = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1,
+        "model": "m",
+        "choices": [{"index": 0, "delta": {"content": "hi"}, "finish_reason": "stop"}],
+    }
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(
+        return_value=httpx.Response(
+            200,
+            content=f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n".encode(),
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+    router = ModelRouter()
+
+    chunks = list(DedalusRunner(client).run(input="hi", model="m", stream=True, router=router))
+
+    assert len(chunks) == 1
+    health = router.health("m")
+    assert health.time_to_first_token is not None and health.latency is not None
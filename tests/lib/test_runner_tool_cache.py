@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import time
+import asyncio
+import threading
+from typing import Any, List
+from pathlib import Path
+
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.runner import ToolCache, DedalusRunner, cached_tool
+
+from .helpers import tool_call, completion
+from ..conftest import base_url
+
+
+def test_cached_tool_keeps_schema_and_caches_direct_calls() -> None:
+    calls: List[float] = []
+
+    @cached_tool
+    def convert(amount: float, unit: str = "km") -> float:
+        """Convert miles."""
+        calls.append(amount)
+        return amount * 1.6 if unit == "km" else amount * 1609
+
+    assert convert.__name__ == "convert"
+    assert convert(2) == convert(amount=2, unit="km") == 3.2
+    assert calls == [2]
+    assert convert(2, "m") == 3218
+    assert calls == [2, 2]
+
+
+def test_lru_eviction_and_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = ToolCache(maxsize=2, ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+
+    for key in ("a", "b", "c"):
+        cache.call(key, lambda key=key: key.upper())
+    assert len(cache) == 2
+    assert cache.call("a", lambda: "recomputed") == "recomputed"  # evicted as least recently used
+
+    now[0] += 11
+    assert cache.call("c", lambda: "fresh") == "fresh"  # expired
+    assert cache.stats.misses == 5 and cache.stats.hits == 0
+
+
+def test_disk_tier_survives_new_cache(tmp_path: Path) -> None:
+    first = ToolCache(directory=tmp_path)
+    first.call("k", lambda: {"rate": 1.6})
+
+    second = ToolCache(directory=tmp_path)
+    assert second.call("k", lambda: pytest.fail("should be read from disk")) == {"rate": 1.6}
+    assert second.stats.disk_hits == 1 and second.stats.hits == 1
+
+    second.clear()
+    assert ToolCache(directory=tmp_path).call("k", lambda: "gone") == "gone"
+
+
+def test_single_flight_threads() -> None:
+    cache = ToolCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls: List[int] = []
+
+    def slow() -> int:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 42
+
+    results: List[Any] = []
+    leader = threading.Thread(target=lambda: results.append(cache.call("k", slow)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(cache.call("k", slow))) for _ in range(3)]
+    for t in followers:
+        t.start()
+    while cache.stats.coalesced < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in [leader, *followers]:
+        t.join(5)
+
+    assert results == [42] * 4
+    assert calls == [1]
+    assert cache.stats.coalesced == 3
+
+
+async def test_single_flight_async_shares_errors() -> None:
+    cache = ToolCache()
+    calls: List[int] = []
+
+    async def failing() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*(cache.acall("k", failing) for _ in range(3)), return_exceptions=True)
+    assert calls == [1]
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(cache) == 0  # failures are not cached
+
+
+async def test_cancelled_leader_hands_the_call_to_a_waiter() -> None:
+    cache = ToolCache()
+    started = asyncio.Event()
+    calls: List[int] = []
+
+    async def slow() -> int:
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.05)
+        return 42
+
+    leader = asyncio.ensure_future(cache.acall("k", slow))
+    await started.wait()
+    follower = asyncio.ensure_future(cache.acall("k", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await asyncio.wait_for(follower, timeout=5) == 42
+    assert calls == [1, 1]
+    assert cache.call("k", lambda: pytest.fail("should be cached")) == 42
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_run_reports_cache_hits(client: Dedalus, respx_mock: MockRouter) -> None:
+    calls: List[float] = []
+
+    @cached_tool
+    def convert(amount: float) -> float:
+        calls.append(amount)
+        return amount * 1.6
+
+    respx_mock.post("/v1/chat/completions").mock(
+        side_effect=[
+            completion(tool_calls=[tool_call("c1", "convert", '{"amount": 5}')]),
+            completion(tool_calls=[tool_call("c2", "convert", '{"amount":5}')]),
+            completion("8 km"),
+        ]
+        * 2
+    )
+
+    runner = DedalusRunner(client)
+    first = runner.run(input="5 miles?", model="openai/gpt-4o-mini", tools=[convert])
+    second = runner.run(input="5 miles?", model="openai/gpt-4o-mini", tools=[convert])
+
+    assert calls == [5]
+    assert [r["result"] for r in first.tool_results] == [8.0, 8.0]
+    assert (first.tool_cache["convert"].misses, first.tool_cache["convert"].hits) == (1, 1)
+    assert second.tool_cache["convert"].hit_rate == 1.0
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_run_reuses_results_within_a_step(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    calls: List[float] = []
+
+    @cached_tool(ttl=60)
+    async def convert(amount: float) -> float:
+        calls.append(amount)
+        await asyncio.sleep(0)
+        return amount * 1.6
+
+    respx_mock.post("/v1/chat/completions").mock(
+        side_effect=[
+            completion(
+                tool_calls=[tool_call("c1", "convert", '{"amount": 1}'), tool_call("c2", "convert", '{"amount": 1}')]
+            ),
+            completion("done"),
+        ]
+    )
+
+    result = await DedalusRunner(async_client).run(input="go", model="openai/gpt-4o-mini", tools=[convert])
+
+    assert calls == [1]
+    assert result.tool_cache["convert"].calls == 2
+    assert result.tool_cache["convert"].hit_rate == 0.5
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import base64
+import threading
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.streaming.audio import AudioRingBuffer
+
+from ..conftest import base_url
+
+CHUNKS = [b"\x00\x01" * 50, b"\x02\x03" * 70, b"\x04"]
+
+
+def sse_body(chunks: List[bytes]) -> bytes:
+    events: List[Dict[str, Any]] = [
+        {"type": "speech.audio.delta", "audio": base64.b64encode(chunk).decode()} for chunk in chunks
+    ]
+    events.append({"type": "speech.audio.done", "usage": {"input_tokens": 3, "output_tokens": 9, "total_tokens": 12}})
+    return b"".join(f"data: {json.dumps(event)}\n\n".encode() for event in events)
+
+
+def mock_speech(respx_mock: MockRouter) -> None:
+    respx_mock.post(f"{base_url}/v1/audio/speech").mock(
+        return_value=httpx.Response(200, content=sse_body(CHUNKS), headers={"content-type": "text/event-stream"})
+    )
+
+
+def test_stream_yields_decoded_chunks(client: Dedalus, respx_mock: MockRouter) -> None:
+    mock_speech(respx_mock)
+
+    with client.audio.speech.stream(model="gpt-4o-mini-tts", voice="alloy", input="hi") as stream:
+        assert list(stream) == CHUNKS
+        assert stream.usage == {"input_tokens": 3, "output_tokens": 9, "total_tokens": 12}
+
+    request = respx_mock.calls.last.request
+    assert json.loads(request.content)["stream_format"] == "sse"
+    assert request.headers["Accept"] == "text/event-stream"
+
+
+def test_stream_to_ring_buffer(client: Dedalus, respx_mock: MockRouter) -> None:
+    mock_speech(respx_mock)
+    expected = b"".join(CHUNKS)
+    # smaller than the payload so the writer has to wait for the reader
+    ring = AudioRingBuffer(capacity=64)
+    received = bytearray()
+
+    def play() -> None:
+        out = bytearray(16)
+        while not ring.eof:
+            n = ring.readinto(out)
+            received.extend(out[:n])
+
+    player = threading.Thread(target=play)
+    player.start()
+    with client.audio.speech.stream(model="gpt-4o-mini-tts", voice="alloy", input="hi") as stream:
+        assert stream.stream_to(ring) == len(expected)
+    ring.close()
+    player.join(timeout=5)
+
+    assert bytes(received) == expected
+
+
+async def test_async_stream(async_client: AsyncDedalus, respx_mock: MockRouter) -> None:
+    mock_speech(respx_mock)
+
+    class AsyncSink:
+        def __init__(self) -> None:
+            self.data = bytearray()
+
+        async def write(self, data: bytes) -> None:
+            self.data += data
+
+    sink = AsyncSink()
+    async with async_client.audio.speech.stream(model="gpt-4o-mini-tts", voice="alloy", input="hi") as stream:
+        await stream.stream_to(sink)
+        assert stream.usage is not None
+
+    assert bytes(sink.data) == b"".join(CHUNKS)
+
+
+def test_ring_buffer_wraps_around() -> None:
+    ring = AudioRingBuffer(capacity=8)
+    assert ring.write(b"abcdef") == 6
+    assert ring.read(4) == b"abcd"
+    assert ring.write(b"ghijkl") == 6
+    assert len(ring) == 8
+    assert ring.write(b"x", timeout=0.01) == 0
+
+    ring.close()
+    assert not ring.eof
+    assert ring.read() == b"efghijkl"
+    assert ring.eof
+    assert ring.write(b"more") == 0
+
+    with pytest.raises(ValueError):
+        AudioRingBuffer(capacity=0)
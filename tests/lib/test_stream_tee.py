@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+import threading
+from typing import Any, Dict, List, Iterator, AsyncIterator
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus, APIStatusError
+from dedalus_labs.lib.streaming import LiteStream, StreamBroadcast, tee, atee
+
+from ..conftest import base_url
+
+api_key = "My API Key"
+
+
+def _chunk(content: str) -> Dict[str, Any]:
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1,
+        "model": "openai/gpt-4o",
+        "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": None}],
+    }
+
+
+def _mock(respx_mock: MockRouter, events: List[str]) -> None:
+    body = "".join(f"{event}\n\n" for event in events)
+    respx_mock.post(f"{base_url}/v1/chat/completions").mock(
+        return_value=httpx.Response(200, content=body.encode(), headers={"Content-Type": "text/event-stream"})
+    )
+
+
+def _events(n: int) -> List[str]:
+    return [f"data: {json.dumps(_chunk(str(i)))}" for i in range(n)] + ["data: [DONE]"]
+
+
+def _consume_in_threads(*iterables: Any) -> List[List[Any]]:
+    results: List[List[Any]] = [[] for _ in iterables]
+
+    def run(i: int) -> None:
+        results[i].extend(iterables[i])
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(iterables))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+def test_subscribers_share_parsed_chunks(respx_mock: MockRouter) -> None:
+    _mock(respx_mock, _events(50))
+    client = Dedalus(base_url=base_url, api_key=api_key)
+
+    subscribers = tee(client.chat.completions.create(model="m", messages=[], stream=True), 3, maxsize=4)
+    a, b, c = _consume_in_threads(*subscribers)
+
+    assert [chunk.choices[0].delta.content for chunk in a] == [str(i) for i in range(50)]
+    assert all(x is y is z for x, y, z in zip(a, b, c))
+    assert len(a) == len(b) == len(c) == 50
+
+
+def test_tee_works_over_lite_streams(respx_mock: MockRouter) -> None:
+    _mock(respx_mock, _events(5))
+    client = Dedalus(base_url=base_url, api_key=api_key)
+
+    lite = LiteStream(raw_stream=client.chat.completions.create(model="m", messages=[], stream=True))
+    a, b = _consume_in_threads(*tee(lite))
+
+    assert [chunk.choices[0].delta.content for chunk in b] == ["0", "1", "2", "3", "4"]
+    assert all(x is y for x, y in zip(a, b))
+
+
+def test_drop_policy_never_stalls_fast_subscribers() -> None:
+    def source() -> Iterator[int]:
+        for i in range(100):
+            time.sleep(0.001)
+            yield i
+
+    # `slow` isn't read until the source is exhausted
+    fast, slow = tee(source(), maxsize=5, on_lag="drop")
+
+    assert list(fast) == list(range(100))
+    received = list(slow)
+    assert len(received) + slow.dropped == 100
+    assert 0 < len(received) <= 5
+    assert fast.dropped == 0
+
+
+def test_errors_reach_every_subscriber(respx_mock: MockRouter) -> None:
+    _mock(respx_mock, [f"data: {json.dumps(_chunk('a'))}", 'event: error\ndata: {"message": "overloaded"}'])
+    client = Dedalus(base_url=base_url, api_key=api_key)
+
+    a, b = tee(client.chat.completions.create(model="m", messages=[], stream=True))
+
+    for subscriber in (a, b):
+        assert next(subscriber).choices[0].delta.content == "a"
+        with pytest.raises(APIStatusError, match="overloaded"):
+            next(subscriber)
+        assert list(subscriber) == []
+
+
+def test_source_closes_once_every_subscriber_closes() -> None:
+    closed = threading.Event()
+
+    class Source:
+        def __iter__(self) -> Iterator[int]:
+            i = 0
+            while not closed.is_set():
+                yield i
+                i += 1
+
+        def close(self) -> None:
+            closed.set()
+
+    a, b = tee(Source(), maxsize=2)
+    assert next(a) == 0
+    a.close()
+    assert next(b) == 0
+    b.close()
+
+    assert closed.wait(timeout=5)
+    assert list(a) == list(b) == []
+
+
+def test_source_closes_when_it_ends_after_every_subscriber_closed() -> None:
+    finish = threading.Event()
+    closed = threading.Event()
+
+    class Source:
+        def __iter__(self) -> Iterator[int]:
+            yield 0
+            # both subscribers close while the pump waits here for the next chunk
+            finish.wait(timeout=5)
+
+        def close(self) -> None:
+            closed.set()
+
+    a, b = tee(Source())
+    assert next(a) == next(b) == 0
+    a.close()
+    b.close()
+    finish.set()
+
+    assert closed.wait(timeout=5)
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_base_exceptions_reach_subscribers() -> None:
+    class Interrupted(BaseException):
+        pass
+
+    def source() -> Iterator[int]:
+        yield 0
+        raise Interrupted
+
+    a, b = tee(source())
+    results = _consume_in_threads(a, b)
+
+    # without the failure marker the consumers would block forever
+    assert results == [[0], [0]]
+    assert a.closed and b.closed
+    # the interrupt still propagates in the pump thread
+    pump = a._broadcast._thread
+    assert pump is not None
+    pump.join(timeout=5)
+
+
+def test_subscribe_after_start_is_rejected() -> None:
+    broadcast = StreamBroadcast(iter([1, 2]))
+    first = broadcast.subscribe()
+    assert next(first) == 1
+
+    with pytest.raises(RuntimeError, match="before any subscriber starts"):
+        broadcast.subscribe()
+
+
+async def test_async_tee_backpressure(respx_mock: MockRouter) -> None:
+    _mock(respx_mock, _events(30))
+    client = AsyncDedalus(base_url=base_url, api_key=api_key)
+
+    stream = await client.chat.completions.create(model="m", messages=[], stream=True)
+    client_feed, persistence, moderation = atee(stream, 3, maxsize=2)
+
+    async def collect(subscriber: AsyncIterator[Any], delay: float = 0) -> List[Any]:
+        items: List[Any] = []
+        async for item in subscriber:
+            items.append(item)
+            await asyncio.sleep(delay)
+        return items
+
+    a, b, c = await asyncio.gather(collect(client_feed), collect(persistence, 0.001), collect(moderation))
+
+    assert len(a) == len(b) == len(c) == 30
+    assert all(x is y is z for x, y, z in zip(a, b, c))
+    assert persistence.dropped == 0
+
+
+async def test_async_drop_policy() -> None:
+    async def source() -> AsyncIterator[int]:
+        for i in range(100):
+            await asyncio.sleep(0.001)
+            yield i
+
+    fast, slow = atee(source(), maxsize=3, on_lag="drop")
+
+    assert [i async for i in fast] == list(range(100))
+    received = [i async for i in slow]
+    assert len(received) + slow.dropped == 100
+    assert 0 < len(received) <= 3
+
+
+async def test_cancelled_async_source_reaches_subscribers() -> None:
+    started = asyncio.Event()
+
+    async def source() -> AsyncIterator[int]:
+        started.set()
+        await asyncio.sleep(60)
+        yield 0
+
+    a, b = atee(source(), maxsize=1)
+    pending = asyncio.ensure_future(a.__anext__())
+    await started.wait()
+    broadcast_task = a._broadcast._task
+    assert broadcast_task is not None
+    broadcast_task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(b.__anext__(), timeout=5)
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(pending, timeout=5)
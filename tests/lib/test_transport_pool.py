@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.transport import (
+    PoolStats,
+    PooledHttpxClient,
+    PooledAsyncHttpxClient,
+    pool_stats,
+    pool_limits,
+)
+
+from ..conftest import base_url
+
+api_key = "My API Key"
+
+
+def test_pool_limits_keep_every_connection_alive() -> None:
+    limits = pool_limits(250)
+    assert limits.max_connections == 250
+    assert limits.max_keepalive_connections == 250
+
+    with pytest.raises(ValueError, match="at least 1"):
+        pool_limits(0)
+
+
+def test_fresh_client_has_empty_pool() -> None:
+    with PooledHttpxClient(concurrency=8) as http_client:
+        client = Dedalus(base_url=base_url, api_key=api_key, http_client=http_client)
+        assert client.pool_stats() == PoolStats()
+
+
+def test_pool_stats_on_default_client() -> None:
+    client = Dedalus(base_url=base_url, api_key=api_key)
+    stats = client.pool_stats()
+    assert stats.connections == 0
+    assert stats.requests == 0
+
+
+def test_explicit_transport_takes_precedence() -> None:
+    transport = httpx.MockTransport(lambda _request: httpx.Response(200, json={}))
+    with PooledHttpxClient(concurrency=4, transport=transport) as http_client:
+        http_client.get("https://example.com/")
+        # a caller-supplied transport isn't instrumented, so there is nothing to count
+        assert pool_stats(http_client).requests == 0
+
+
+def test_counts_requests_and_connections() -> None:
+    import threading
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002, ARG002
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        with PooledHttpxClient(concurrency=4) as http_client:
+            for _ in range(3):
+                assert http_client.get(url).text == "ok"
+
+            stats = pool_stats(http_client)
+            assert stats.requests == 3
+            # keep-alive: one TCP connection serves all three requests
+            assert stats.connections_opened == 1
+            assert stats.connections == 1
+            assert stats.idle == 1
+            assert stats.in_use == 0
+            assert stats.waiting == 0
+            assert stats.tls_handshakes == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_counts_requests_waiting_for_a_connection() -> None:
+    import threading
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    release = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            release.wait(5)
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002, ARG002
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        with PooledHttpxClient(concurrency=1) as http_client:
+            workers = [threading.Thread(target=http_client.get, args=(url,)) for _ in range(3)]
+            for worker in workers:
+                worker.start()
+            for _ in range(100):
+                stats = pool_stats(http_client)
+                if stats.requests == 3 and stats.in_use == 1:
+                    break
+                release.wait(0.02)
+
+            assert stats.in_use == 1
+            assert stats.waiting == 2
+            release.set()
+            for worker in workers:
+                worker.join()
+            assert pool_stats(http_client).waiting == 0
+    finally:
+        release.set()
+        server.shutdown()
+        server.server_close()
+
+
+def test_failed_request_is_not_left_waiting() -> None:
+    with PooledHttpxClient(concurrency=1) as http_client:
+        with pytest.raises(httpx.ConnectError):
+            # nothing listens on port 1
+            http_client.get("http://127.0.0.1:1/")
+        stats = pool_stats(http_client)
+        assert (stats.requests, stats.waiting) == (1, 0)
+
+
+def test_unrecognised_pool_degrades_to_zeros() -> None:
+    with PooledHttpxClient(concurrency=4) as http_client:
+        transport = http_client._transport
+        original = transport._pool  # type: ignore[attr-defined]
+        transport._pool = object()  # type: ignore[attr-defined]
+        try:
+            assert pool_stats(http_client) == PoolStats()
+        finally:
+            transport._pool = original  # type: ignore[attr-defined]
+
+
+async def test_async_pool_stats() -> None:
+    async with PooledAsyncHttpxClient(concurrency=8) as http_client:
+        client = AsyncDedalus(base_url=base_url, api_key=api_key, http_client=http_client)
+        assert client.pool_stats() == PoolStats()
+
+
+def test_http2_requires_h2() -> None:
+    pytest.importorskip("h2")
+    with PooledHttpxClient(concurrency=64, http2=True) as http_client:
+        assert pool_stats(http_client).http2_connections == 0
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import time
+import asyncio
+import threading
+from typing import List, Iterator
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs.lib.transport import KeepAlive, PooledHttpxClient, PooledAsyncHttpxClient
+
+api_key = "My API Key"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    paths: List[str] = []
+
+    def _reply(self, body: bool) -> None:
+        self.paths.append(f"{self.command} {self.path}")
+        # hold the connection long enough that concurrent warm-up requests can't share one
+        time.sleep(0.1)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        if body:
+            self.wfile.write(b"{}")
+
+    def do_HEAD(self) -> None:
+        self._reply(body=False)
+
+    def do_GET(self) -> None:
+        self._reply(body=True)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002, ARG002
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    _Handler.paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_warmup_opens_connections(server_url: str) -> None:
+    with PooledHttpxClient(concurrency=8) as http_client:
+        client = Dedalus(base_url=server_url, api_key=api_key, http_client=http_client)
+        result = client.warmup(3)
+
+        assert result.ok == 3
+        assert result.failed == 0
+        assert result.connections == 3
+        assert client.pool_stats().idle == 3
+        assert _Handler.paths == ["HEAD /"] * 3
+
+
+def test_warmup_includes_jwks(server_url: str) -> None:
+    with PooledHttpxClient(concurrency=8) as http_client:
+        client = Dedalus(base_url=server_url, api_key=api_key, as_base_url=server_url + "/", http_client=http_client)
+        result = client.warmup(1)
+
+    assert result.ok == 2
+    assert sorted(_Handler.paths) == ["GET /.well-known/jwks.json", "HEAD /"]
+
+
+def test_warmup_collects_errors() -> None:
+    client = Dedalus(base_url="http://127.0.0.1:1", api_key=api_key)
+    result = client.warmup(2, timeout=1.0)
+
+    assert result.ok == 0
+    assert result.failed == 2
+    assert result.connections == 0
+
+
+def test_warmup_validates_count(server_url: str) -> None:
+    client = Dedalus(base_url=server_url, api_key=api_key)
+    with pytest.raises(ValueError, match="at least 1"):
+        client.warmup(0)
+
+
+def test_keep_alive_pings_in_background(server_url: str) -> None:
+    with PooledHttpxClient(concurrency=4) as http_client:
+        client = Dedalus(base_url=server_url, api_key=api_key, http_client=http_client)
+        with client.keep_alive(2, interval=0.05) as keepalive:
+            assert isinstance(keepalive, KeepAlive)
+            assert keepalive.running
+            deadline = time.monotonic() + 5
+            while keepalive.last is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert not keepalive.running
+
+    assert keepalive.last is not None
+    assert keepalive.last.ok == 2
+
+
+async def test_async_warmup_and_keep_alive(server_url: str) -> None:
+    async with PooledAsyncHttpxClient(concurrency=8) as http_client:
+        client = AsyncDedalus(base_url=server_url, api_key=api_key, http_client=http_client)
+        result = await client.warmup(3)
+        assert result.ok == 3
+        assert result.connections == 3
+
+        async with client.keep_alive(2, interval=0.05) as keepalive:
+            while keepalive.last is None:
+                await asyncio.sleep(0.01)
+        assert not keepalive.running
+        assert keepalive.last.ok == 2
+
+
+def test_keep_alive_interval_follows_pool_expiry(server_url: str) -> None:
+    # the SDK's default pool expires idle connections after 5 seconds
+    client = Dedalus(base_url=server_url, api_key=api_key)
+    assert KeepAlive(client).interval == 2.5
+    with pytest.raises(ValueError, match="keepalive_expiry"):
+        KeepAlive(client, interval=20.0)
+
+    with PooledHttpxClient(concurrency=4) as http_client:
+        pooled = Dedalus(base_url=server_url, api_key=api_key, http_client=http_client)
+        assert KeepAlive(pooled).interval == 30.0
+        assert KeepAlive(pooled, interval=20.0).interval == 20.0
+
+
+def test_keep_alive_survives_unexpected_errors(server_url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    from dedalus_labs.lib.transport import _warmup
+
+    def broken(*_args: object) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(_warmup, "warmup", broken)
+    client = Dedalus(base_url=server_url, api_key=api_key)
+    with client.keep_alive(2, interval=0.01) as keepalive:
+        deadline = time.monotonic() + 5
+        while keepalive.last is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        assert keepalive.running
+
+    assert keepalive.last is not None
+    assert [str(error) for error in keepalive.last.errors] == ["boom"]
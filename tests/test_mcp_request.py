@@ -0,0 +1,170 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#           github.com/dedalus-labs/dedalus-sdk-python/LICENSE
+# ==============================================================================
+
+"""Tests for MCP request preparation and its copy-on-write body handling."""
+
+from __future__ import annotations
+
+import copy
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus
+from dedalus_labs._models import FinalRequestOptions
+from dedalus_labs.lib.mcp import request as mcp_request, prepare_mcp_request, prepare_mcp_request_sync
+
+base_url = "http://127.0.0.1:4010"
+
+
+def _body() -> Dict[str, Any]:
+    return {
+        "model": "openai/gpt-4o",
+        "messages": [
+            {"role": "user", "content": [{"type": "image_url", "image_url": {"url": "data:image/png;base64,AAAA"}}]}
+        ],
+        "mcp_servers": ["dedalus-labs/example-server@v2"],
+    }
+
+
+def _nested_body() -> Dict[str, Any]:
+    # every nested value is a mutable dict or list owned by the caller
+    return {
+        **_body(),
+        "mcp_servers": [{"slug": "dedalus-labs/example-server", "version": "v2"}, "dedalus-labs/other"],
+        "tools": [{"type": "function", "function": {"name": "lookup", "parameters": {"type": "object"}}}],
+        "metadata": {"tags": ["a", "b"]},
+    }
+
+
+class _Connection:
+    name = "github"
+
+
+class _Credential:
+    connection = _Connection()
+
+    def values_for_encryption(self) -> Dict[str, Any]:
+        return {"token": "ghp_xxx"}
+
+
+class TestPrepareMCPRequest:
+    """The body is copied at most once, shallowly, and never mutated."""
+
+    def test_body_without_mcp_is_returned_as_is(self) -> None:
+        body = {"model": "openai/gpt-4o", "messages": [{"role": "user", "content": "hi"}]}
+        assert prepare_mcp_request_sync(body, None, None) is body
+
+    def test_caller_body_is_not_mutated(self) -> None:
+        body = _body()
+        prepared = prepare_mcp_request_sync(body, None, None)
+
+        assert body["mcp_servers"] == ["dedalus-labs/example-server@v2"]
+        assert prepared["mcp_servers"] == [{"slug": "dedalus-labs/example-server", "version": "v2"}]
+
+    def test_nested_values_are_shared(self) -> None:
+        body = _body()
+        prepared = prepare_mcp_request_sync(body, None, None)
+
+        assert prepared is not body
+        assert prepared["messages"] is body["messages"]
+
+    async def test_async_matches_sync(self) -> None:
+        body = _body()
+        prepared = await prepare_mcp_request(body, None, None)
+
+        assert prepared == prepare_mcp_request_sync(body, None, None)
+        assert prepared["messages"] is body["messages"]
+
+    def test_per_attempt_edits_never_reach_the_caller_body(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cryptography = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.rsa")
+        public_key = cryptography.generate_private_key(public_exponent=65537, key_size=2048).public_key()
+        monkeypatch.setattr(mcp_request, "fetch_encryption_key_sync", lambda *_args: public_key)
+
+        body = {**_nested_body(), "credentials": [_Credential()]}
+        snapshot = copy.deepcopy({k: v for k, v in body.items() if k != "credentials"})
+        nested = {key: body[key] for key in ("messages", "mcp_servers", "tools", "metadata")}
+
+        for attempt in range(3):
+            prepared = prepare_mcp_request_sync(body, "http://as.example", None)
+            assert "credentials" not in prepared
+            assert [server["credentials"] for server in prepared["mcp_servers"]] == [
+                {"github": prepared["mcp_servers"][0]["credentials"]["github"]}
+            ] * 2
+            # what a retry hook may do to the body it is given: replace top-level keys
+            prepared["metadata"] = {**prepared["metadata"], "attempt": attempt}
+            prepared["messages"] = [*prepared["messages"], {"role": "user", "content": f"attempt {attempt}"}]
+            prepared.pop("tools")
+
+        assert {k: v for k, v in body.items() if k != "credentials"} == snapshot
+        assert all(body[key] is value for key, value in nested.items())
+        assert len(body["credentials"]) == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_every_retry_sends_the_same_body(respx_mock: MockRouter) -> None:
+    client = Dedalus(base_url=base_url, api_key="My API Key", max_retries=2)
+    route = respx_mock.post("/v1/chat/completions").mock(
+        side_effect=[httpx.Response(500), httpx.Response(500), httpx.Response(200, json={})]
+    )
+    body = _body()
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # no backoff between attempts
+        monkeypatch.setattr(client, "_calculate_retry_timeout", lambda *_args: 0)
+        client.chat.completions.create(**body)
+
+    sent = [json.loads(call.request.content) for call in route.calls]
+    assert len(sent) == 3
+    assert sent[0] == sent[1] == sent[2]
+    assert sent[0]["mcp_servers"] == [{"slug": "dedalus-labs/example-server", "version": "v2"}]
+    assert body["mcp_servers"] == ["dedalus-labs/example-server@v2"]
+
+
+class _StampingDedalus(Dedalus):
+    """Edits the prepared body on every attempt, like a subclass adding per-attempt metadata."""
+
+    attempts: List[Dict[str, Any]]
+
+    def _prepare_options(self, options: FinalRequestOptions) -> FinalRequestOptions:
+        options = super()._prepare_options(options)
+        if isinstance(options.json_data, dict):
+            self.attempts.append(options.json_data)
+            options.json_data["metadata"] = {**options.json_data["metadata"], "attempt": len(self.attempts)}
+            options.json_data["mcp_servers"].append("dedalus-labs/per-attempt")
+        return options
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_retries_edited_per_attempt_start_from_the_callers_body(respx_mock: MockRouter) -> None:
+    client = _StampingDedalus(base_url=base_url, api_key="My API Key", max_retries=2)
+    client.attempts = []
+    route = respx_mock.post("/v1/chat/completions").mock(
+        side_effect=[httpx.Response(500), httpx.Response(500), httpx.Response(200, json={})]
+    )
+    body = _nested_body()
+    snapshot = copy.deepcopy(body)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(client, "_calculate_retry_timeout", lambda *_args: 0)
+        # a non-default content type keeps the body a dict, so it is prepared again on every attempt
+        client.chat.completions.create(**body, extra_headers={"Content-Type": "application/json; charset=utf-8"})
+
+    sent = [json.loads(call.request.content) for call in route.calls]
+    assert len(client.attempts) == 3
+    assert [request["metadata"] for request in sent] == [{"tags": ["a", "b"], "attempt": n} for n in (1, 2, 3)]
+    assert [request["mcp_servers"] for request in sent] == [
+        [
+            {"slug": "dedalus-labs/example-server", "version": "v2"},
+            "dedalus-labs/other",
+            "dedalus-labs/per-attempt",
+        ]
+    ] * 3
+    assert sent[0]["messages"] == sent[2]["messages"] == snapshot["messages"]
+    assert body == snapshot
@@ -961,3 +961,18 @@ def test_extra_properties() -> None:
     assert model.a.prop == 1
     assert isinstance(model.a, Item)
     assert model.other == "foo"
+
+
+def test_literal_strings_are_interned() -> None:
+    class Chunk(BaseModel):
+        object: Literal["chat.completion.chunk"]
+        kind: Literal["a", "b"]
+
+    literal = "chat.completion.chunk"
+    chunks = [Chunk.construct(**json.loads('{"object": "chat.completion.chunk", "kind": "b"}')) for _ in range(3)]
+
+    assert all(chunk.object is chunks[0].object for chunk in chunks)
+    assert chunks[0].object == literal
+    # values outside the Literal are kept as-is
+    assert construct_type(value="other", type_=Literal["a", "b"]) == "other"
+    assert construct_type(value=1, type_=Literal["a", "b"]) == 1
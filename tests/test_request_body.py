@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any, Dict
+
+import httpx
+import pytest
+from respx import MockRouter
+
+import dedalus_labs._base_client as base_client
+from dedalus_labs import Dedalus, AsyncDedalus
+
+base_url = "http://127.0.0.1:4010"
+api_key = "My API Key"
+
+_COMPLETION: Dict[str, Any] = {"id": "c", "object": "chat.completion", "created": 0, "model": "m", "choices": []}
+
+
+def _messages(size: int) -> Any:
+    return [{"role": "user", "content": "x" * size}]
+
+
+def _sent_json(request: httpx.Request) -> Any:
+    content = request.content
+    if request.headers.get("Content-Encoding") == "gzip":
+        content = gzip.decompress(content)
+    return json.loads(content)
+
+
+@pytest.fixture
+def count_encodes(monkeypatch: pytest.MonkeyPatch) -> Dict[str, int]:
+    calls = {"n": 0}
+    encode = base_client._encode_json
+
+    def counting(data: object) -> bytes:
+        calls["n"] += 1
+        return encode(data)
+
+    monkeypatch.setattr(base_client, "_encode_json", counting)
+    return calls
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_body_is_encoded_once_across_retries(respx_mock: MockRouter, count_encodes: Dict[str, int]) -> None:
+    client = Dedalus(base_url=base_url, api_key=api_key, max_retries=2)
+    client._calculate_retry_timeout = lambda *_args: 0  # type: ignore[method-assign]
+    route = respx_mock.post("/v1/chat/completions").mock(
+        side_effect=[httpx.Response(500), httpx.Response(503), httpx.Response(200, json=_COMPLETION)]
+    )
+
+    client.chat.completions.create(model="m", messages=_messages(10), extra_body={"metadata": {"k": "v"}})
+
+    assert count_encodes["n"] == 1
+    bodies = [call.request.content for call in route.calls]
+    assert len(bodies) == 3
+    assert bodies[0] == bodies[1] == bodies[2]
+    assert json.loads(bodies[0])["metadata"] == {"k": "v"}
+    assert route.calls[0].request.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_gzip_compresses_large_bodies_only(respx_mock: MockRouter) -> None:
+    client = Dedalus(base_url=base_url, api_key=api_key, request_compression="gzip")
+    route = respx_mock.post("/v1/chat/completions").mock(return_value=httpx.Response(200, json=_COMPLETION))
+
+    client.chat.completions.create(model="m", messages=_messages(10))
+    client.chat.completions.create(model="m", messages=_messages(10_000))
+
+    small, large = (call.request for call in route.calls)
+    assert "Content-Encoding" not in small.headers
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert len(large.content) < 1_000
+    assert _sent_json(large)["messages"] == _messages(10_000)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_auto_compression_waits_for_server_support(respx_mock: MockRouter) -> None:
+    client = Dedalus(base_url=base_url, api_key=api_key, request_compression="auto")
+    route = respx_mock.post("/v1/chat/completions").mock(
+        return_value=httpx.Response(200, json=_COMPLETION, headers={"Accept-Encoding": "gzip, deflate;q=0.5"})
+    )
+
+    client.chat.completions.create(model="m", messages=_messages(10_000))
+    client.chat.completions.create(model="m", messages=_messages(10_000))
+
+    first, second = (call.request for call in route.calls)
+    assert "Content-Encoding" not in first.headers
+    assert second.headers["Content-Encoding"] == "gzip"
+    assert _sent_json(second) == _sent_json(first)
+
+
+def test_copy_keeps_request_compression() -> None:
+    client = Dedalus(base_url=base_url, api_key=api_key, request_compression="gzip")
+    assert client.copy().request_compression == "gzip"
+    assert client.with_options(request_compression=None).request_compression is None
+
+
+def test_zstd_requires_zstandard() -> None:
+    try:
+        import zstandard  # noqa: F401  # pyright: ignore[reportUnusedImport, reportMissingImports]
+    except ImportError:
+        pass
+    else:
+        pytest.skip("zstandard is installed")
+
+    client = Dedalus(base_url=base_url, api_key=api_key, request_compression="zstd")
+
+    # compression happens before anything is sent
+    with pytest.raises(RuntimeError, match="zstandard"):
+        client.chat.completions.create(model="m", messages=_messages(10_000))
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_body_is_encoded_once_across_retries(respx_mock: MockRouter, count_encodes: Dict[str, int]) -> None:
+    client = AsyncDedalus(base_url=base_url, api_key=api_key, max_retries=1, request_compression="gzip")
+    client._calculate_retry_timeout = lambda *_args: 0  # type: ignore[method-assign]
+    route = respx_mock.post("/v1/chat/completions").mock(
+        side_effect=[httpx.Response(500), httpx.Response(200, json=_COMPLETION)]
+    )
+
+    await client.chat.completions.create(model="m", messages=_messages(10_000))
+
+    assert count_encodes["n"] == 1
+    first, second = (call.request for call in route.calls)
+    assert first.content == second.content
+    assert second.headers["Content-Encoding"] == "gzip"
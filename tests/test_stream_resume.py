@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any, Dict, List, Tuple, Iterator, Optional
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import httpx
+import pytest
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs._constants import STREAM_REPLAY_WINDOW
+from dedalus_labs._streaming import ServerSentEvent, _Resumption
+from dedalus_labs.lib.transport import PooledHttpxClient
+
+api_key = "My API Key"
+
+SSE = "text/event-stream"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: List[Dict[str, Any]] = []
+    # (status, content type, body, drop the connection before the body is complete)
+    replies: List[Tuple[int, str, bytes, bool]] = []
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.requests.append({"last_event_id": self.headers.get("Last-Event-ID"), "body": body})
+
+        status, content_type, payload, drop = self.replies.pop(0)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload) + (1024 if drop else 0)))
+        self.end_headers()
+        self.wfile.write(payload)
+        self.wfile.flush()
+        if drop:
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002, ARG002
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    _Handler.requests = []
+    _Handler.replies = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _events(ids: range, *, with_ids: bool = True, done: bool = False) -> bytes:
+    out = ""
+    for i in ids:
+        chunk = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion.chunk",
+            "created": 1,
+            "model": "m",
+            "choices": [{"index": 0, "delta": {"content": str(i)}, "finish_reason": None}],
+        }
+        out += (f"id: {i}\n" if with_ids else "") + f"data: {json.dumps(chunk)}\n\n"
+    if done:
+        out += "data: [DONE]\n\n"
+    return out.encode()
+
+
+def _contents(chunks: List[Any]) -> List[Optional[str]]:
+    return [chunk.choices[0].delta.content for chunk in chunks]
+
+
+def _reply_resumable() -> None:
+    _Handler.replies = [
+        (200, SSE, b"retry: 10\n\n" + _events(range(0, 3)), True),
+        # the server replays the last event it isn't sure we received
+        (200, SSE, _events(range(2, 5), done=True), False),
+    ]
+
+
+def test_dropped_stream_is_resumed(server_url: str) -> None:
+    _reply_resumable()
+    client = Dedalus(base_url=server_url, api_key=api_key, stream_reconnects=2)
+
+    stream = client.chat.completions.create(model="m", messages=[{"role": "user", "content": "hi"}], stream=True)
+
+    assert _contents(list(stream)) == ["0", "1", "2", "3", "4"]
+    first, second = _Handler.requests
+    assert first["last_event_id"] is None
+    assert second["last_event_id"] == "2"
+    assert second["body"] == first["body"]
+    assert stream.response.is_closed
+
+
+async def test_dropped_async_stream_is_resumed(server_url: str) -> None:
+    _reply_resumable()
+    client = AsyncDedalus(base_url=server_url, api_key=api_key, stream_reconnects=2)
+
+    stream = await client.chat.completions.create(model="m", messages=[], stream=True)
+
+    assert _contents([chunk async for chunk in stream]) == ["0", "1", "2", "3", "4"]
+    assert [r["last_event_id"] for r in _Handler.requests] == [None, "2"]
+
+
+def test_resumed_stream_is_counted_once_by_pool_stats(server_url: str) -> None:
+    _reply_resumable()
+    with PooledHttpxClient(concurrency=2) as http_client:
+        client = Dedalus(base_url=server_url, api_key=api_key, stream_reconnects=2, http_client=http_client)
+
+        assert len(list(client.chat.completions.create(model="m", messages=[], stream=True))) == 5
+
+        stats = client.pool_stats()
+        assert (stats.requests, stats.connections_opened, stats.waiting) == (2, 2, 0)
+
+
+def test_stream_without_event_ids_is_not_resumed(server_url: str) -> None:
+    _Handler.replies = [(200, SSE, _events(range(0, 3), with_ids=False), True)]
+    client = Dedalus(base_url=server_url, api_key=api_key, stream_reconnects=2)
+
+    stream = client.chat.completions.create(model="m", messages=[], stream=True)
+    with pytest.raises(httpx.RemoteProtocolError):
+        list(stream)
+
+    assert len(_Handler.requests) == 1
+
+
+def test_rejected_resume_raises_original_error(server_url: str) -> None:
+    _Handler.replies = [
+        (200, SSE, _events(range(0, 3)), True),
+        (404, "application/json", b'{"error": "unknown stream"}', False),
+    ]
+    client = Dedalus(base_url=server_url, api_key=api_key, stream_reconnects=2)
+
+    received: List[Any] = []
+    with pytest.raises(httpx.RemoteProtocolError):
+        for chunk in client.chat.completions.create(model="m", messages=[], stream=True):
+            received.append(chunk)
+
+    assert _contents(received) == ["0", "1", "2"]
+    assert len(_Handler.requests) == 2
+
+
+def test_reconnects_are_opt_in(server_url: str) -> None:
+    _Handler.replies = [(200, SSE, _events(range(0, 3)), True)]
+    client = Dedalus(base_url=server_url, api_key=api_key)
+
+    with pytest.raises(httpx.RemoteProtocolError):
+        list(client.chat.completions.create(model="m", messages=[], stream=True))
+
+    # resuming re-sends the POST, so it never happens unless asked for
+    assert len(_Handler.requests) == 1
+    assert client.stream_reconnects == 0
+    assert client.copy(stream_reconnects=3).stream_reconnects == 3
+
+
+def test_resumed_request_keeps_extensions() -> None:
+    resumption = _Resumption(max_reconnects=1)
+    resumption.accept(ServerSentEvent(id="1", data="{}"))
+    timeout = {"connect": 1.0, "read": 30.0, "write": 1.0, "pool": 1.0}
+    previous = httpx.Request("POST", "https://example.com/v1/chat", content=b"{}", extensions={"timeout": timeout})
+
+    request = resumption.build_request(previous)
+
+    assert request is not None
+    assert request.headers["Last-Event-ID"] == "1"
+    assert request.extensions["timeout"] == timeout
+
+
+def test_replay_window_is_bounded() -> None:
+    resumption = _Resumption(max_reconnects=1)
+    for i in range(STREAM_REPLAY_WINDOW * 2):
+        resumption.accept(ServerSentEvent(id=str(i), data="{}"))
+    resumption.build_request(httpx.Request("POST", "https://example.com/", content=b"{}"))
+
+    # only the most recent events can be replayed; older ids are forgotten
+    assert not resumption.accept(ServerSentEvent(id=str(STREAM_REPLAY_WINDOW * 2 - 1), data="{}"))
+    assert resumption.accept(ServerSentEvent(id="0", data="{}"))
+
+
+def test_resumption_honours_server_retry_interval() -> None:
+    resumption = _Resumption(max_reconnects=2)
+    assert resumption.next_delay() is None  # nothing to resume from yet
+
+    assert not resumption.accept(ServerSentEvent(id="7", retry=2500))
+    assert resumption.accept(ServerSentEvent(id="8", data="{}"))
+    assert resumption.next_delay() == 2.5
+    assert resumption.next_delay() == 2.5
+    assert resumption.next_delay() is None
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import os
+from typing import List
+from pathlib import Path
+
+import anyio
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import AsyncDedalus
+
+base_url = "http://127.0.0.1:4010"
+api_key = "My API Key"
+
+AUDIO = bytes(range(256)) * 400  # 100 KiB
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.writes: List[bytes] = []
+
+    async def write(self, data: bytes) -> None:
+        self.writes.append(data)
+
+
+@pytest.fixture
+def thread_hops(monkeypatch: pytest.MonkeyPatch) -> List[object]:
+    calls: List[object] = []
+    run_sync = anyio.to_thread.run_sync
+
+    async def counting(func: object, *args: object, **kwargs: object) -> object:
+        calls.append(func)
+        return await run_sync(func, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(anyio.to_thread, "run_sync", counting)
+    return calls
+
+
+def _client() -> AsyncDedalus:
+    return AsyncDedalus(base_url=base_url, api_key=api_key)
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_stream_to_file_coalesces_writes(
+    respx_mock: MockRouter, tmp_path: Path, thread_hops: List[object]
+) -> None:
+    respx_mock.post("/v1/audio/speech").mock(return_value=httpx.Response(200, content=AUDIO))
+    target = tmp_path / "speech.mp3"
+
+    async with _client().audio.speech.with_streaming_response.create(input="hi", model="tts-1", voice="alloy") as r:
+        await r.stream_to_file(target, chunk_size=64, buffer_size=32 * 1024)
+
+    assert target.read_bytes() == AUDIO
+    # 1600 network chunks become 4 writes, plus opening and closing the file
+    assert len(thread_hops) == 4 + 2
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_stream_to_async_sink(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/audio/speech").mock(return_value=httpx.Response(200, content=AUDIO))
+    sink = _Sink()
+
+    async with _client().audio.speech.with_streaming_response.create(input="hi", model="tts-1", voice="alloy") as r:
+        await r.stream_to_file(sink, chunk_size=1000, buffer_size=30_000)
+
+    assert b"".join(sink.writes) == AUDIO
+    assert [len(w) for w in sink.writes] == [30_000, 30_000, 30_000, 12_400]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_large_chunks_are_written_without_copying(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/audio/speech").mock(return_value=httpx.Response(200, content=AUDIO))
+    sink = _Sink()
+
+    async with _client().audio.speech.with_streaming_response.create(input="hi", model="tts-1", voice="alloy") as r:
+        await r.stream_to_file(sink, chunk_size=50_000, buffer_size=1024)
+
+    assert [len(w) for w in sink.writes] == [50_000, 50_000, 2_400]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_preallocation_is_truncated_to_what_was_written(
+    respx_mock: MockRouter, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if not hasattr(os, "posix_fallocate"):
+        pytest.skip("posix_fallocate is unavailable")
+    allocations: List[int] = []
+    fallocate = os.posix_fallocate
+
+    def recording(fd: int, offset: int, length: int) -> None:
+        allocations.append(length)
+        # claim more than will arrive, as a server with a wrong Content-Length would
+        fallocate(fd, offset, length * 2)
+
+    monkeypatch.setattr(os, "posix_fallocate", recording)
+    respx_mock.post("/v1/audio/speech").mock(return_value=httpx.Response(200, content=AUDIO))
+    target = tmp_path / "speech.mp3"
+
+    async with _client().audio.speech.with_streaming_response.create(input="hi", model="tts-1", voice="alloy") as r:
+        await r.stream_to_file(target)
+
+    assert allocations == [len(AUDIO)]
+    assert target.stat().st_size == len(AUDIO)
+    assert target.read_bytes() == AUDIO
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_write_to_file_accepts_sink(respx_mock: MockRouter, tmp_path: Path) -> None:
+    respx_mock.post("/v1/audio/speech").mock(return_value=httpx.Response(200, content=AUDIO))
+    client = _client()
+
+    binary = await client.audio.speech.create(input="hi", model="tts-1", voice="alloy")
+    sink = _Sink()
+    await binary.write_to_file(sink)
+    await binary.write_to_file(tmp_path / "speech.mp3")
+
+    assert sink.writes == [AUDIO]
+    assert (tmp_path / "speech.mp3").read_bytes() == AUDIO
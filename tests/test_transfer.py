@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from dedalus_labs import Dedalus, AsyncDedalus
+from dedalus_labs._transfer import ACCEPT_ENCODING, TransferStats
+
+base_url = "http://127.0.0.1:4010"
+api_key = "My API Key"
+
+
+def _gzip_json(payload: object) -> httpx.Response:
+    return httpx.Response(
+        200,
+        content=gzip.compress(json.dumps(payload).encode()),
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+
+
+def test_accept_encoding_lists_decodable_codings() -> None:
+    codings = [coding.strip() for coding in ACCEPT_ENCODING.split(",")]
+    assert codings[-2:] == ["gzip", "deflate"]
+    assert set(codings) <= {"zstd", "br", "gzip", "deflate"}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_accept_encoding_is_sent_and_overridable(respx_mock: MockRouter) -> None:
+    route = respx_mock.get("/v1/models").mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+
+    Dedalus(base_url=base_url, api_key=api_key).models.list()
+    Dedalus(base_url=base_url, api_key=api_key, default_headers={"Accept-Encoding": "identity"}).models.list()
+
+    first, second = (call.request for call in route.calls)
+    assert first.headers["Accept-Encoding"] == ACCEPT_ENCODING
+    assert second.headers["Accept-Encoding"] == "identity"
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_raw_response_transfer_stats(respx_mock: MockRouter) -> None:
+    models = [{"id": f"provider/model-{i}", "object": "model", "created": 0, "owned_by": "x"} for i in range(200)]
+    respx_mock.get("/v1/models").mock(return_value=_gzip_json({"object": "list", "data": models}))
+
+    response = Dedalus(base_url=base_url, api_key=api_key).models.with_raw_response.list()
+    stats = response.transfer_stats
+
+    assert stats.content_encoding == "gzip"
+    assert stats.decoded_bytes == len(response.http_response.content)
+    assert 0 < stats.wire_bytes < stats.decoded_bytes
+    assert stats.saved_bytes == stats.decoded_bytes - stats.wire_bytes
+    assert stats.compression_ratio > 1
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_stream_transfer_stats(respx_mock: MockRouter) -> None:
+    chunk = {"id": "c", "object": "chat.completion.chunk", "created": 0, "model": "m", "choices": []}
+    body = "".join(f"data: {json.dumps(chunk)}\n\n" for _ in range(20)) + "data: [DONE]\n\n"
+    respx_mock.post("/v1/chat/completions").mock(
+        return_value=httpx.Response(
+            200,
+            content=gzip.compress(body.encode()),
+            headers={"Content-Encoding": "gzip", "Content-Type": "text/event-stream"},
+        )
+    )
+
+    stream = await AsyncDedalus(base_url=base_url, api_key=api_key).chat.completions.create(
+        model="m", messages=[{"role": "user", "content": "hi"}], stream=True
+    )
+    assert [c async for c in stream]
+    stats = stream.transfer_stats
+
+    assert stats.decoded_bytes == len(body)
+    assert 0 < stats.wire_bytes < stats.decoded_bytes
+
+
+def test_stats_add_up() -> None:
+    a = TransferStats(wire_bytes=10, decoded_bytes=40, content_encoding="gzip", responses=1)
+    b = TransferStats(wire_bytes=30, decoded_bytes=30, responses=1)
+
+    total = sum([a, b, a], TransferStats())
+    assert total == TransferStats(wire_bytes=50, decoded_bytes=110, content_encoding=None, responses=3)
+    assert sum([a, a], TransferStats()).content_encoding == "gzip"
+    assert TransferStats().compression_ratio == 1.0
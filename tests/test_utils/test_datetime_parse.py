@@ -108,3 +108,20 @@ def test_datetime_parsing(value: Union[str, bytes, int, float], result: Union[da
             parse_datetime(value)
     else:
         assert parse_datetime(value) == result
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2012-04-23T09:15:00",
+        "2012-04-23 09:15:00Z",
+        "2012-04-23T10:20:30.400000+02:30",
+        "2012-04-23T10:20:30.123456789Z",
+        "2012-04-23T10:20:30.4+02",
+        "2012-04-23T10:20",
+    ],
+)
+def test_iso_fast_path_matches_regex(value: str) -> None:
+    expected = parse_datetime(value.encode())  # bytes skip the fromisoformat path
+    assert parse_datetime(value) == expected
+    assert parse_datetime(value).utcoffset() == expected.utcoffset()